@@ -141,6 +141,7 @@ pub unsafe extern "C" fn qk_transpiler_pass_standalone_sabre_layout(
         Some(options.seed),
         Vec::new(),
         false,
+        None,
     )
     .unwrap_or_else(|_| panic!("Sabre layout failed."));
     let out_circuit = dag_to_circuit(&result, false)
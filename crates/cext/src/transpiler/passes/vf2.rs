@@ -520,6 +520,7 @@ pub unsafe extern "C" fn qk_transpiler_pass_standalone_vf2_layout(
         max_trials,
         shuffle_seed: None,
         score_initial_layout: false,
+        root_shards: 1,
     });
     // SAFETY: this function is a deprecated thin wrapper around `_average`, and per documentation
     // the caller has upheld the requirements of that function.  `config` is safe to point to as it
@@ -12,6 +12,7 @@
 
 use std::fmt::Debug;
 use std::hash::{Hash, RandomState};
+use std::sync::Arc;
 #[cfg(feature = "cache_pygates")]
 use std::sync::OnceLock;
 
@@ -32,16 +33,17 @@ use crate::operations::{
 };
 use crate::packed_instruction::{PackedInstruction, PackedOperation};
 use crate::parameter::parameter_expression::{ParameterError, ParameterExpression};
-use crate::parameter::symbol_expr::{Symbol, Value};
+use crate::parameter::symbol_expr::{CompiledExpr, Symbol, Value};
 use crate::parameter_table::{ParameterTable, ParameterTableError, ParameterUse, ParameterUuid};
 use crate::register_data::RegisterData;
 use crate::slice::{PySequenceIndex, SequenceIndex};
+use crate::structural_hash::{StructuralHashCache, StructuralHashOptions, structural_hash};
 use crate::{
     Block, BlocksMode, Clbit, ControlFlowBlocks, Qubit, Stretch, Var, VarsMode, instruction,
 };
 
 use num_complex::Complex64;
-use numpy::PyReadonlyArray1;
+use numpy::{PyReadonlyArray1, PyReadonlyArray2};
 use pyo3::IntoPyObjectExt;
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
@@ -51,6 +53,7 @@ use pyo3::{PyTraverseError, PyVisit, import_exception, intern};
 use crate::instruction::Parameters;
 use hashbrown::{HashMap, HashSet};
 use indexmap::IndexMap;
+use ndarray::Axis;
 use smallvec::SmallVec;
 use thiserror::Error;
 
@@ -159,6 +162,10 @@ type CircuitDataState<'py> = (
     Vec<expr::Stretch>,
 );
 
+/// The number of bindings evaluated together by [CircuitData::assign_parameters_batch].  This
+/// bounds the memory used for the evaluated angles, independent of the total number of bindings.
+const COMPILED_BINDING_CHUNK: usize = 1024;
+
 /// A container for :class:`.QuantumCircuit` instruction listings that stores
 /// :class:`.CircuitInstruction` instances in a packed form by interning
 /// their :attr:`~.CircuitInstruction.qubits` and
@@ -214,8 +221,16 @@ type CircuitDataState<'py> = (
 #[pyclass(sequence, module = "qiskit._accelerate.circuit")]
 #[derive(Clone, Debug)]
 pub struct CircuitData {
-    /// The packed instruction listing.
-    data: Vec<PackedInstruction>,
+    /// The packed instruction listing.  This is shared between copies of the circuit, and only
+    /// cloned when one of them mutates it (see [CircuitData::data_mut]).
+    data: Arc<Vec<PackedInstruction>>,
+    /// The cached Python operation objects of this circuit's instructions, by index, if they are
+    /// not the ones cached in the instructions themselves.  This is the case for a copy of a
+    /// circuit that shares the instruction storage with the original, since the copies must not
+    /// share their operation objects.  The caches move into the instructions when the storage is
+    /// made unique (see [CircuitData::data_mut]).
+    #[cfg(feature = "cache_pygates")]
+    py_ops: Option<Box<[OnceLock<Py<PyAny>>]>>,
     /// The cache used to intern instruction bits.
     qargs_interner: Interner<[Qubit]>,
     /// The cache used to intern instruction bits.
@@ -254,6 +269,8 @@ pub struct CircuitData {
     param_table: ParameterTable,
     #[pyo3(get)]
     global_phase: Param,
+    /// Cached results of [CircuitData::structural_hash], cleared on mutation.
+    structural_hashes: StructuralHashCache,
 }
 
 #[derive(Copy, Clone, Debug, PartialEq)]
@@ -788,75 +805,20 @@ impl CircuitData {
     ///
     /// Returns:
     ///     CircuitData: The shallow copy.
-    #[pyo3(signature = (copy_instructions=true, deepcopy=false))]
-    pub fn copy(&self, py: Python<'_>, copy_instructions: bool, deepcopy: bool) -> PyResult<Self> {
-        let mut res = self.copy_empty_like(VarsMode::Alike, BlocksMode::Keep)?;
-        res.qargs_interner = self.qargs_interner.clone();
-        res.cargs_interner = self.cargs_interner.clone();
-        res.reserve(self.data().len());
-        res.param_table.clone_from(&self.param_table);
-
-        if deepcopy {
-            let memo = PyDict::new(py);
-            for inst in &self.data {
-                let new_op = match inst.op.view() {
-                    OperationRef::Gate(gate) => {
-                        PyOperationTypes::Gate(gate.py_deepcopy(py, Some(&memo))?).into()
-                    }
-                    OperationRef::ControlFlow(cf) => cf.clone().into(),
-                    OperationRef::Instruction(instruction) => {
-                        PyOperationTypes::Instruction(instruction.py_deepcopy(py, Some(&memo))?)
-                            .into()
-                    }
-                    OperationRef::Operation(operation) => {
-                        PyOperationTypes::Operation(operation.py_deepcopy(py, Some(&memo))?).into()
-                    }
-                    OperationRef::StandardGate(gate) => gate.into(),
-                    OperationRef::StandardInstruction(instruction) => instruction.into(),
-                    OperationRef::Unitary(unitary) => unitary.clone().into(),
-                    OperationRef::PauliProductMeasurement(ppm) => ppm.clone().into(),
-                };
-                res.data.push(PackedInstruction {
-                    op: new_op,
-                    qubits: inst.qubits,
-                    clbits: inst.clbits,
-                    params: inst.params.clone(),
-                    label: inst.label.clone(),
-                    #[cfg(feature = "cache_pygates")]
-                    py_op: OnceLock::new(),
-                });
-            }
-        } else if copy_instructions {
-            for inst in &self.data {
-                let new_op = match inst.op.view() {
-                    OperationRef::Gate(gate) => PyOperationTypes::Gate(gate.py_copy(py)?).into(),
-                    OperationRef::Instruction(instruction) => {
-                        PyOperationTypes::Instruction(instruction.py_copy(py)?).into()
-                    }
-                    OperationRef::Operation(operation) => {
-                        PyOperationTypes::Operation(operation.py_copy(py)?).into()
-                    }
-                    OperationRef::ControlFlow(cf) => cf.clone().into(),
-                    OperationRef::StandardGate(gate) => gate.into(),
-                    OperationRef::StandardInstruction(instruction) => instruction.into(),
-                    OperationRef::Unitary(unitary) => unitary.clone().into(),
-                    OperationRef::PauliProductMeasurement(ppm) => ppm.clone().into(),
-                };
-                res.data.push(PackedInstruction {
-                    op: new_op,
-                    qubits: inst.qubits,
-                    clbits: inst.clbits,
-                    params: inst.params.clone(),
-                    label: inst.label.clone(),
-                    #[cfg(feature = "cache_pygates")]
-                    py_op: OnceLock::new(),
-                });
-            }
-        } else {
-            res.data.extend(self.data.iter().cloned());
-        }
+    #[pyo3(name = "copy", signature = (copy_instructions=true, deepcopy=false))]
+    pub fn py_copy(
+        &self,
+        py: Python<'_>,
+        copy_instructions: bool,
+        deepcopy: bool,
+    ) -> PyResult<Self> {
+        self.copy(py, copy_instructions, deepcopy)
+    }
 
-        Ok(res)
+    /// Whether this circuit shares its instruction storage with ``other``.  This is only intended
+    /// for testing.
+    fn _shares_data_with(&self, other: &Bound<CircuitData>) -> bool {
+        Arc::ptr_eq(&self.data, &other.borrow().data)
     }
 
     /// Performs a copy with no instructions.
@@ -883,7 +845,7 @@ impl CircuitData {
     ///     additional (int): The additional capacity to reserve. If the
     ///         capacity is already sufficient, does nothing.
     pub fn reserve(&mut self, additional: usize) {
-        self.data.reserve(additional);
+        self.data_mut().reserve(additional);
     }
 
     /// Returns a tuple of the sets of :class:`.Qubit` and :class:`.Clbit` instances
@@ -913,8 +875,8 @@ impl CircuitData {
     ///         The callable to invoke.
     #[pyo3(signature = (func))]
     pub fn foreach_op(&self, py: Python<'_>, func: &Bound<PyAny>) -> PyResult<()> {
-        for inst in self.data.iter() {
-            func.call1((self.unpack_py_op(py, inst)?,))?;
+        for index in 0..self.data.len() {
+            func.call1((self.unpack_py_op_at(py, index)?,))?;
         }
         Ok(())
     }
@@ -927,8 +889,8 @@ impl CircuitData {
     ///         The callable to invoke.
     #[pyo3(signature = (func))]
     pub fn foreach_op_indexed(&self, py: Python<'_>, func: &Bound<PyAny>) -> PyResult<()> {
-        for (index, inst) in self.data.iter().enumerate() {
-            func.call1((index, self.unpack_py_op(py, inst)?))?;
+        for index in 0..self.data.len() {
+            func.call1((index, self.unpack_py_op_at(py, index)?))?;
         }
         Ok(())
     }
@@ -948,14 +910,13 @@ impl CircuitData {
     #[pyo3(signature = (func))]
     pub fn map_nonstandard_ops(&mut self, py: Python<'_>, func: &Bound<PyAny>) -> PyResult<()> {
         for index in 0..self.data.len() {
-            let instr = &self.data[index];
-            if instr.op.try_standard_gate().is_some() {
+            if self.data[index].op.try_standard_gate().is_some() {
                 continue;
             }
-            let py_op = func.call1((self.unpack_py_op(py, instr)?,))?;
+            let py_op = func.call1((self.unpack_py_op_at(py, index)?,))?;
             let result = py_op.extract::<OperationFromPython<CircuitData>>()?;
             let params = self.take_parameter_blocks(result.params);
-            let inst = &mut self.data[index];
+            let inst = &mut self.data_mut()[index];
             inst.op = result.operation;
             inst.params = params;
             inst.label = result.label;
@@ -1059,6 +1020,7 @@ impl CircuitData {
                     self.num_qubits(),
                 )));
             }
+            self.structural_hashes.clear();
             std::mem::swap(&mut temp.qubits, &mut self.qubits);
             std::mem::swap(&mut temp.qregs, &mut self.qregs);
             std::mem::swap(&mut temp.qubit_indices, &mut self.qubit_indices);
@@ -1071,6 +1033,7 @@ impl CircuitData {
                     self.num_clbits(),
                 )));
             }
+            self.structural_hashes.clear();
             std::mem::swap(&mut temp.clbits, &mut self.clbits);
             std::mem::swap(&mut temp.cregs, &mut self.cregs);
             std::mem::swap(&mut temp.clbit_indices, &mut self.clbit_indices);
@@ -1101,7 +1064,7 @@ impl CircuitData {
                 params,
                 label: inst.label.clone(),
                 #[cfg(feature = "cache_pygates")]
-                py_op: inst.py_op.clone(),
+                py_op: self.py_op_cache(index).clone(),
             }
             .into_py_any(py)
             .unwrap()
@@ -1121,7 +1084,8 @@ impl CircuitData {
             let py = value.py();
             slf.untrack_instruction_parameters(index)?;
             slf.untrack_instruction_blocks(index);
-            slf.data[index] = slf.pack(py, &value.cast::<CircuitInstruction>()?.borrow())?;
+            let packed = slf.pack(py, &value.cast::<CircuitInstruction>()?.borrow())?;
+            slf.data_mut()[index] = packed;
             slf.track_instruction_blocks(index);
             slf.track_instruction_parameters(index)?;
             Ok(())
@@ -1187,7 +1151,7 @@ impl CircuitData {
         };
         let py = value.py();
         let packed = self.pack(py, &value)?;
-        self.data.insert(index, packed);
+        self.data_mut().insert(index, packed);
         self.track_instruction_blocks(index);
         if index == self.data.len() - 1 {
             self.track_instruction_parameters(index)?;
@@ -1225,7 +1189,7 @@ impl CircuitData {
     ) -> PyResult<()> {
         let instruction_index = self.data.len();
         let packed = self.pack(value.py(), &value.borrow())?;
-        self.data.push(packed);
+        self.data_mut().push(packed);
         for item in params.iter() {
             let (parameter_index, parameters) = item.extract::<(u32, Bound<PyAny>)>()?;
             let usage = ParameterUse::Index {
@@ -1244,8 +1208,8 @@ impl CircuitData {
         if let Ok(other) = itr.cast::<CircuitData>() {
             let other = other.borrow();
             // Fast path to avoid unnecessary construction of CircuitInstruction instances.
-            self.data.reserve(other.data.len());
-            for inst in other.data.iter() {
+            self.data_mut().reserve(other.data.len());
+            for (index, inst) in other.data.iter().enumerate() {
                 let qubits = other
                     .qargs_interner
                     .get(inst.qubits)
@@ -1270,7 +1234,7 @@ impl CircuitData {
                     params,
                     label: inst.label.clone(),
                     #[cfg(feature = "cache_pygates")]
-                    py_op: inst.py_op.clone(),
+                    py_op: other.py_op_cache(index).clone(),
                 })?;
             }
             return Ok(());
@@ -1327,8 +1291,191 @@ impl CircuitData {
         Ok(self.assign_parameters_inner(items)?)
     }
 
+    /// Create a copy of the circuit for each row of ``values``, with every circuit parameter
+    /// assigned to the corresponding value in that row.
+    ///
+    /// The columns of ``values`` are in the same order as the values taken by
+    /// :meth:`assign_parameters_iterable`.  All the copies are made in a single call, so there is
+    /// no per-binding round trip through Python.
+    ///
+    /// If the only parameterized objects in the circuit are standard gates and the global phase,
+    /// their expressions are compiled once and evaluated for a chunk of bindings at a time,
+    /// instead of symbolically binding each expression for each row.
+    fn assign_parameters_batch(
+        &self,
+        py: Python,
+        values: PyReadonlyArray2<f64>,
+    ) -> PyResult<Vec<Self>> {
+        let values = values.as_array();
+        if values.ncols() != self.param_table.num_parameters() {
+            return Err(PyValueError::new_err(format!(
+                "Expected {} values in each binding, but received {}.",
+                self.param_table.num_parameters(),
+                values.ncols(),
+            )));
+        }
+        let mut out = Vec::with_capacity(values.nrows());
+        let Some((targets, compiled)) = self.compile_parameters() else {
+            for row in values.rows() {
+                let mut bound = self.copy(py, true, false)?;
+                bound.assign_parameters_row(&row.to_vec())?;
+                out.push(bound);
+            }
+            return Ok(out);
+        };
+        for chunk in values.axis_chunks_iter(Axis(0), COMPILED_BINDING_CHUNK) {
+            let evaluated = compiled
+                .iter()
+                .map(|expr| expr.eval_rows(chunk))
+                .collect::<Vec<_>>();
+            for (index, row) in chunk.rows().into_iter().enumerate() {
+                let mut bound = self.copy(py, true, false)?;
+                let angles = evaluated
+                    .iter()
+                    .map(|column| match column[index] {
+                        Value::Real(value) if value.is_finite() => Some(value),
+                        Value::Int(value) => Some(value as f64),
+                        _ => None,
+                    })
+                    .collect::<Option<Vec<_>>>();
+                match angles {
+                    Some(angles) => bound.set_compiled_parameters(&targets, &angles),
+                    // Complex or non-finite results go through the full binding, so they fail in
+                    // exactly the same way as `assign_parameters` would.
+                    None => bound.assign_parameters_row(&row.to_vec())?,
+                }
+                out.push(bound);
+            }
+        }
+        Ok(out)
+    }
+
+    /// Append many standard gates to the circuit data in a single call.
+    ///
+    /// ``gates`` holds the :class:`.StandardGate` discriminant of each new instruction.  Row ``i``
+    /// of ``qubits`` holds the qubit indices of instruction ``i`` and, if given, row ``i`` of
+    /// ``params`` holds its (numeric) parameters.  Only the leading columns each gate needs are
+    /// read, so gates of different arities can share the same arrays.  Every row is validated
+    /// before anything is appended, so the circuit is unchanged if this raises.
+    #[pyo3(signature = (gates, qubits, params=None))]
+    fn extend_standard_gates(
+        &mut self,
+        gates: PyReadonlyArray1<u8>,
+        qubits: PyReadonlyArray2<u32>,
+        params: Option<PyReadonlyArray2<f64>>,
+    ) -> PyResult<()> {
+        let gates = gates.as_array();
+        let qubits = qubits.as_array();
+        let params = params.as_ref().map(|params| params.as_array());
+        if qubits.nrows() != gates.len() {
+            return Err(PyValueError::new_err(format!(
+                "Expected {} rows of qubits, but received {}.",
+                gates.len(),
+                qubits.nrows(),
+            )));
+        }
+        if let Some(params) = params.as_ref() {
+            if params.nrows() != gates.len() {
+                return Err(PyValueError::new_err(format!(
+                    "Expected {} rows of parameters, but received {}.",
+                    gates.len(),
+                    params.nrows(),
+                )));
+            }
+        }
+        let num_qubits = self.num_qubits() as u32;
+        let mut packed = Vec::with_capacity(gates.len());
+        for (index, &id) in gates.iter().enumerate() {
+            let gate = ::bytemuck::checked::try_cast::<u8, StandardGate>(id).map_err(|_| {
+                CircuitError::new_err(format!("Invalid standard gate id {id} in row {index}."))
+            })?;
+            let gate_qubits = gate.num_qubits() as usize;
+            if qubits.ncols() < gate_qubits {
+                return Err(CircuitError::new_err(format!(
+                    "'{}' acts on {} qubits, but only {} qubit columns were given.",
+                    gate.name(),
+                    gate_qubits,
+                    qubits.ncols(),
+                )));
+            }
+            let row = qubits.row(index);
+            let qargs = row
+                .iter()
+                .take(gate_qubits)
+                .map(|&qubit| {
+                    if qubit < num_qubits {
+                        Ok(Qubit(qubit))
+                    } else {
+                        Err(CircuitError::new_err(format!(
+                            "Qubit index {qubit} in row {index} is out of range for a circuit \
+                             with {num_qubits} qubits."
+                        )))
+                    }
+                })
+                .collect::<PyResult<SmallVec<[Qubit; 2]>>>()?;
+            if (1..qargs.len()).any(|i| qargs[..i].contains(&qargs[i])) {
+                return Err(CircuitError::new_err(format!(
+                    "Duplicate qubits in row {index}: {:?}.",
+                    qargs.iter().map(|qubit| qubit.0).collect::<Vec<_>>(),
+                )));
+            }
+            let gate_params = gate.num_params() as usize;
+            let gate_params = if gate_params == 0 {
+                None
+            } else {
+                let row = match params.as_ref() {
+                    Some(params) if params.ncols() >= gate_params => params.row(index),
+                    _ => {
+                        return Err(CircuitError::new_err(format!(
+                            "'{}' takes {} parameters, but not enough parameter columns were given.",
+                            gate.name(),
+                            gate_params,
+                        )));
+                    }
+                };
+                Some(Box::new(
+                    row.iter()
+                        .take(gate_params)
+                        .map(|&value| Param::Float(value))
+                        .collect::<SmallVec<[Param; 3]>>(),
+                ))
+            };
+            packed.push(PackedInstruction::from_standard_gate(
+                gate,
+                gate_params,
+                self.qargs_interner.insert(&qargs),
+            ));
+        }
+        self.data_mut().reserve(packed.len());
+        for instruction in packed {
+            self.push(instruction)?;
+        }
+        Ok(())
+    }
+
+    /// A hash of the structure of the circuit.
+    ///
+    /// This covers the number of qubits and clbits, the global phase, and each instruction's
+    /// operation, qubit and clbit indices, and parameters.  Symbolic parameters are hashed by
+    /// their expressions.  The hash is calculated in one pass over the data and cached until the
+    /// circuit is next modified.
+    ///
+    /// Args:
+    ///     ignore_global_phase: if ``True``, circuits that differ only by their global phase have
+    ///         the same hash.
+    ///     canonical: if ``True``, the hash depends only on the DAG of the circuit, so it does
+    ///         not change if instructions acting on disjoint wires are reordered.
+    #[pyo3(name = "structural_hash", signature = (*, ignore_global_phase=false, canonical=false))]
+    pub fn py_structural_hash(&self, ignore_global_phase: bool, canonical: bool) -> u64 {
+        self.structural_hash(StructuralHashOptions {
+            ignore_global_phase,
+            canonical,
+        })
+    }
+
     pub fn clear(&mut self) {
         std::mem::take(&mut self.data);
+        self.structural_hashes.clear();
         self.param_table.clear();
     }
 
@@ -1341,7 +1488,7 @@ impl CircuitData {
     /// An IndexMap containing the operation names as keys and their respective counts as values.
     pub fn count_ops(&self) -> IndexMap<&str, usize, ::ahash::RandomState> {
         let mut ops_count: IndexMap<&str, usize, ::ahash::RandomState> = IndexMap::default();
-        for instruction in &self.data {
+        for instruction in self.data.iter() {
             *ops_count.entry(instruction.op.name()).or_insert(0) += 1;
         }
         ops_count.par_sort_by(|_k1, v1, _k2, v2| v2.cmp(v1));
@@ -1483,7 +1630,8 @@ impl CircuitData {
 
     fn __clear__(&mut self) {
         // Clear anything that could have a reference cycle.
-        self.data.clear();
+        std::mem::take(&mut self.data);
+        self.structural_hashes.clear();
         self.qubits.dispose();
         self.clbits.dispose();
         self.qregs.dispose();
@@ -1848,7 +1996,7 @@ impl CircuitData {
         let clbit_indices = BitLocator::with_capacity(clbit_size);
 
         let mut self_ = CircuitData {
-            data: Vec::new(),
+            data: Arc::new(Vec::new()),
             qargs_interner: Interner::new(),
             cargs_interner: Interner::new(),
             qubits: qubits_registry,
@@ -1856,6 +2004,9 @@ impl CircuitData {
             blocks: ControlFlowBlocks::new(),
             param_table: ParameterTable::new(),
             global_phase: Param::Float(0.),
+            structural_hashes: StructuralHashCache::default(),
+            #[cfg(feature = "cache_pygates")]
+            py_ops: None,
             qregs: RegisterData::new(),
             cregs: RegisterData::new(),
             qubit_indices,
@@ -1885,6 +2036,7 @@ impl CircuitData {
 
     pub fn add_qubit(&mut self, bit: ShareableQubit, strict: bool) -> Result<(), CircuitDataError> {
         let index = self.qubits.add(bit.clone(), strict)?;
+        self.structural_hashes.clear();
         self.qubit_indices
             .insert(bit, BitLocations::new(index.0, []));
         Ok(())
@@ -1892,6 +2044,7 @@ impl CircuitData {
 
     pub fn add_clbit(&mut self, bit: ShareableClbit, strict: bool) -> Result<(), CircuitDataError> {
         let index = self.clbits.add(bit.clone(), strict)?;
+        self.structural_hashes.clear();
         self.clbit_indices
             .insert(bit, BitLocations::new(index.0, []));
         Ok(())
@@ -1910,17 +2063,44 @@ impl CircuitData {
     /// disconnected from the circuit; updates to its parameters, label, duration, unit
     /// and condition will not be propagated back.
     ///
-    /// The provided `instr` MUST belong to this circuit.
+    /// The provided `instr` MUST belong to this circuit.  Prefer [CircuitData::unpack_py_op_at]
+    /// when the index of the instruction is known, since a copy of a circuit that shares its
+    /// instruction storage with the original can only cache its operation objects by index.
     pub fn unpack_py_op(&self, py: Python, instr: &PackedInstruction) -> PyResult<Py<PyAny>> {
+        #[cfg(feature = "cache_pygates")]
+        let cache = self.py_ops.is_none().then_some(&instr.py_op);
+        self.unpack_py_op_cached(
+            py,
+            instr,
+            #[cfg(feature = "cache_pygates")]
+            cache,
+        )
+    }
+
+    /// Build a reference to the Python-space operation object of the instruction at `index`, as
+    /// in [CircuitData::unpack_py_op].
+    pub fn unpack_py_op_at(&self, py: Python, index: usize) -> PyResult<Py<PyAny>> {
+        self.unpack_py_op_cached(
+            py,
+            &self.data[index],
+            #[cfg(feature = "cache_pygates")]
+            Some(self.py_op_cache(index)),
+        )
+    }
+
+    fn unpack_py_op_cached(
+        &self,
+        py: Python,
+        instr: &PackedInstruction,
+        #[cfg(feature = "cache_pygates")] cache: Option<&OnceLock<Py<PyAny>>>,
+    ) -> PyResult<Py<PyAny>> {
         // `OnceLock::get_or_init` and the non-stabilised `get_or_try_init`, which would otherwise
         // be nice here are both non-reentrant.  This is a problem if the init yields control to the
         // Python interpreter as this one does, since that can allow CPython to freeze the thread
         // and for another to attempt the initialisation.
         #[cfg(feature = "cache_pygates")]
-        {
-            if let Some(ob) = instr.py_op.get() {
-                return Ok(ob.clone_ref(py));
-            }
+        if let Some(ob) = cache.and_then(OnceLock::get) {
+            return Ok(ob.clone_ref(py));
         }
         let params = self.unpack_blocks_to_circuit_parameters(instr.params.as_deref());
         let out = instruction::create_py_op(
@@ -1929,11 +2109,13 @@ impl CircuitData {
             params,
             instr.label.as_deref().map(String::as_str),
         )?;
-        #[cfg(feature = "cache_pygates")]
         // The unpacking operation can cause a thread pause and concurrency, since it can call
         // interpreted Python code for a standard gate, so we need to take care that some other
         // Python thread might have populated the cache before we do.
-        let _ = instr.py_op.set(out.clone_ref(py));
+        #[cfg(feature = "cache_pygates")]
+        if let Some(cache) = cache {
+            let _ = cache.set(out.clone_ref(py));
+        }
         Ok(out)
     }
 
@@ -2007,6 +2189,97 @@ impl CircuitData {
         ControlFlowView::try_from_instruction(instr, &self.blocks)
     }
 
+    /// Copy the circuit, optionally also copying the Python operation objects in its instructions
+    /// (`copy_instructions`), or deep-copying them (`deepcopy`).
+    ///
+    /// Unless the operations need copying, the copy shares the instruction storage with this
+    /// circuit until either of them is modified.
+    pub fn copy(&self, py: Python<'_>, copy_instructions: bool, deepcopy: bool) -> PyResult<Self> {
+        let mut res = self.copy_empty_like(VarsMode::Alike, BlocksMode::Keep)?;
+        res.qargs_interner = self.qargs_interner.clone();
+        res.cargs_interner = self.cargs_interner.clone();
+        res.param_table.clone_from(&self.param_table);
+
+        // Instructions that don't own a Python object are immutable, so unless they need
+        // deep-copying, they can be shared with the copy until either circuit is modified.
+        if !deepcopy && (!copy_instructions || self.data.iter().all(is_shareable)) {
+            res.data = self.data.clone();
+            #[cfg(feature = "cache_pygates")]
+            {
+                res.py_ops = if copy_instructions {
+                    // The copy must not hand out the same operation objects as this circuit, so
+                    // it starts with empty caches of its own, and this circuit keeps its caches.
+                    Some(self.data.iter().map(|_| OnceLock::new()).collect())
+                } else {
+                    self.py_ops.clone()
+                };
+            }
+            return Ok(res);
+        }
+
+        res.reserve(self.data().len());
+        let out = Arc::make_mut(&mut res.data);
+        if deepcopy {
+            let memo = PyDict::new(py);
+            for inst in self.data.iter() {
+                let new_op = match inst.op.view() {
+                    OperationRef::Gate(gate) => {
+                        PyOperationTypes::Gate(gate.py_deepcopy(py, Some(&memo))?).into()
+                    }
+                    OperationRef::ControlFlow(cf) => cf.clone().into(),
+                    OperationRef::Instruction(instruction) => {
+                        PyOperationTypes::Instruction(instruction.py_deepcopy(py, Some(&memo))?)
+                            .into()
+                    }
+                    OperationRef::Operation(operation) => {
+                        PyOperationTypes::Operation(operation.py_deepcopy(py, Some(&memo))?).into()
+                    }
+                    OperationRef::StandardGate(gate) => gate.into(),
+                    OperationRef::StandardInstruction(instruction) => instruction.into(),
+                    OperationRef::Unitary(unitary) => unitary.clone().into(),
+                    OperationRef::PauliProductMeasurement(ppm) => ppm.clone().into(),
+                };
+                out.push(PackedInstruction {
+                    op: new_op,
+                    qubits: inst.qubits,
+                    clbits: inst.clbits,
+                    params: inst.params.clone(),
+                    label: inst.label.clone(),
+                    #[cfg(feature = "cache_pygates")]
+                    py_op: OnceLock::new(),
+                });
+            }
+        } else {
+            for inst in self.data.iter() {
+                let new_op = match inst.op.view() {
+                    OperationRef::Gate(gate) => PyOperationTypes::Gate(gate.py_copy(py)?).into(),
+                    OperationRef::Instruction(instruction) => {
+                        PyOperationTypes::Instruction(instruction.py_copy(py)?).into()
+                    }
+                    OperationRef::Operation(operation) => {
+                        PyOperationTypes::Operation(operation.py_copy(py)?).into()
+                    }
+                    OperationRef::ControlFlow(cf) => cf.clone().into(),
+                    OperationRef::StandardGate(gate) => gate.into(),
+                    OperationRef::StandardInstruction(instruction) => instruction.into(),
+                    OperationRef::Unitary(unitary) => unitary.clone().into(),
+                    OperationRef::PauliProductMeasurement(ppm) => ppm.clone().into(),
+                };
+                out.push(PackedInstruction {
+                    op: new_op,
+                    qubits: inst.qubits,
+                    clbits: inst.clbits,
+                    params: inst.params.clone(),
+                    label: inst.label.clone(),
+                    #[cfg(feature = "cache_pygates")]
+                    py_op: OnceLock::new(),
+                });
+            }
+        }
+
+        Ok(res)
+    }
+
     pub fn copy_empty_like(
         &self,
         vars_mode: VarsMode,
@@ -2197,7 +2470,7 @@ impl CircuitData {
     {
         let instruction_iter = instructions.into_iter();
         let mut res = CircuitData {
-            data: Vec::with_capacity(instruction_iter.size_hint().0),
+            data: Arc::new(Vec::with_capacity(instruction_iter.size_hint().0)),
             qargs_interner,
             cargs_interner,
             qubits,
@@ -2205,6 +2478,9 @@ impl CircuitData {
             blocks,
             param_table: ParameterTable::new(),
             global_phase: Param::Float(0.0),
+            structural_hashes: StructuralHashCache::default(),
+            #[cfg(feature = "cache_pygates")]
+            py_ops: None,
             qregs,
             cregs,
             qubit_indices,
@@ -2292,7 +2568,7 @@ impl CircuitData {
         global_phase: Param,
     ) -> Result<Self, CircuitDataError> {
         let mut res = CircuitData {
-            data: Vec::with_capacity(instruction_capacity),
+            data: Arc::new(Vec::with_capacity(instruction_capacity)),
             qargs_interner: Interner::new(),
             cargs_interner: Interner::new(),
             qubits: ObjectRegistry::with_capacity(num_qubits as usize),
@@ -2300,6 +2576,9 @@ impl CircuitData {
             blocks: ControlFlowBlocks::new(),
             param_table: ParameterTable::new(),
             global_phase: Param::Float(0.0),
+            structural_hashes: StructuralHashCache::default(),
+            #[cfg(feature = "cache_pygates")]
+            py_ops: None,
             qregs: RegisterData::new(),
             cregs: RegisterData::new(),
             qubit_indices: BitLocator::with_capacity(num_qubits as usize),
@@ -2372,6 +2651,7 @@ impl CircuitData {
         self.qubits = registry;
         self.qregs = register_data;
         self.qubit_indices = locator;
+        self.structural_hashes.clear();
     }
 
     /// Append a standard gate to this CircuitData
@@ -2419,6 +2699,7 @@ impl CircuitData {
 
     /// Reset the global phase of the circuit to zero, updating any parameter tracking.
     fn clear_global_phase(&mut self) {
+        self.structural_hashes.clear();
         let old = ::std::mem::replace(&mut self.global_phase, Param::Float(0.0));
         let Param::ParameterExpression(expr) = old else {
             return;
@@ -2553,7 +2834,7 @@ impl CircuitData {
         // We need to delete in reverse order so we don't invalidate higher indices with a deletion.
         for index in indices.descending() {
             self.untrack_instruction_blocks(index);
-            self.data.remove(index);
+            self.data_mut().remove(index);
         }
         if !indices.is_empty() {
             self.reindex_parameter_table()?;
@@ -2704,6 +2985,24 @@ impl CircuitData {
         &self.cargs_interner
     }
 
+    /// Get the structural hash of the circuit, calculating it if it is not already cached.
+    ///
+    /// See [crate::structural_hash::structural_hash] for what the hash covers.
+    pub fn structural_hash(&self, options: StructuralHashOptions) -> u64 {
+        self.structural_hashes.get_or_init(options, || {
+            structural_hash(
+                self.num_qubits(),
+                self.num_clbits(),
+                &self.global_phase,
+                self.data.iter(),
+                &self.qargs_interner,
+                &self.cargs_interner,
+                |block| self.blocks[block].structural_hash(options),
+                options,
+            )
+        })
+    }
+
     /// Returns an immutable view of the Global Phase `Param` of the circuit
     pub fn global_phase(&self) -> &Param {
         &self.global_phase
@@ -2782,6 +3081,82 @@ impl CircuitData {
     pub fn add_cargs(&mut self, clbits: &[Clbit]) -> Interned<[Clbit]> {
         self.cargs_interner.insert(clbits)
     }
+
+    /// Compile every parameterized angle in the circuit, for
+    /// [CircuitData::assign_parameters_batch].
+    ///
+    /// The slot of each parameter in the compiled expressions is its position in sorted order.
+    /// The targets are the instruction and parameter index of each angle, or `None` for the global
+    /// phase.  Returns `None` if any parameter is used by something other than a standard gate or
+    /// the global phase, since those need the full binding machinery.
+    fn compile_parameters(&self) -> Option<(Vec<Option<(usize, usize)>>, Vec<CompiledExpr>)> {
+        let slots: HashMap<&Symbol, usize> = self
+            .param_table
+            .symbols()
+            .iter()
+            .enumerate()
+            .map(|(slot, symbol)| (symbol, slot))
+            .collect();
+        let slot = |symbol: &Symbol| slots.get(symbol).copied();
+        let mut targets = Vec::new();
+        let mut compiled = Vec::new();
+        if let Param::ParameterExpression(expr) = &self.global_phase {
+            targets.push(None);
+            compiled.push(expr.compile(&slot)?);
+        }
+        for (index, inst) in self.data.iter().enumerate() {
+            if !inst.blocks_view().is_empty() {
+                return None;
+            }
+            let is_standard_gate = inst.op.try_standard_gate().is_some();
+            for (parameter, param) in inst.params_view().iter().enumerate() {
+                match param {
+                    Param::Float(_) => (),
+                    Param::ParameterExpression(expr) if is_standard_gate => {
+                        targets.push(Some((index, parameter)));
+                        compiled.push(expr.compile(&slot)?);
+                    }
+                    _ => return None,
+                }
+            }
+        }
+        Some((targets, compiled))
+    }
+
+    /// Write the evaluated angles from [CircuitData::compile_parameters] into the circuit, which
+    /// leaves it with no parameters.
+    fn set_compiled_parameters(&mut self, targets: &[Option<(usize, usize)>], angles: &[f64]) {
+        self.param_table.clear();
+        self.structural_hashes.clear();
+        let mut global_phase = None;
+        let data = self.data_mut();
+        for (target, angle) in targets.iter().zip(angles) {
+            match target {
+                Some((instruction, parameter)) => {
+                    let inst = &mut data[*instruction];
+                    inst.params_mut()[*parameter] = Param::Float(*angle);
+                    #[cfg(feature = "cache_pygates")]
+                    inst.py_op.take();
+                }
+                None => global_phase = Some(*angle),
+            }
+        }
+        if let Some(global_phase) = global_phase {
+            self.set_global_phase_f64(global_phase);
+        }
+    }
+
+    /// Assign every parameter in the circuit from a slice of values in sorted parameter order.
+    fn assign_parameters_row(&mut self, row: &[f64]) -> Result<(), CircuitDataError> {
+        let mut old_table = std::mem::take(&mut self.param_table);
+        self.assign_parameters_inner(
+            row.iter()
+                .map(|value| Param::Float(*value))
+                .zip(old_table.drain_ordered())
+                .map(|(value, (obj, uses))| (obj, value, uses)),
+        )
+    }
+
     /// Internal method for assigning parameters.
     ///
     /// Note that currently if any [ParameterUse] identifies a basic block,
@@ -2795,6 +3170,9 @@ impl CircuitData {
         I: IntoIterator<Item = (Symbol, T, HashSet<ParameterUse>)>,
         T: AsRef<Param> + Clone,
     {
+        // Make the instruction storage unique (with this circuit's cached operation objects in
+        // it) up front, so the instructions can be edited in place below.
+        self.data_mut();
         let inconsistent = || panic!("internal error: parameter table is in an inconsistent state");
         // Bind a single `Parameter` into a `ParameterExpression`.
         let bind_expr = |expr: &ParameterExpression,
@@ -2869,7 +3247,7 @@ impl CircuitData {
                         let parameter = parameter as usize;
                         let previous_op = &self.data[instruction].op;
                         if let OperationRef::StandardGate(standard) = previous_op.view() {
-                            let previous = &mut self.data[instruction];
+                            let previous = &mut Arc::make_mut(&mut self.data)[instruction];
                             let params = previous.params_mut();
                             let Param::ParameterExpression(expr) = &params[parameter] else {
                                 panic!("internal error: parameter table contains non-parameters");
@@ -2924,7 +3302,7 @@ impl CircuitData {
                             }
                             #[cfg(feature = "cache_pygates")]
                             {
-                                let previous = &mut self.data[instruction];
+                                let previous = &mut Arc::make_mut(&mut self.data)[instruction];
                                 previous.py_op.take();
                             }
                         } else {
@@ -2949,10 +3327,8 @@ impl CircuitData {
                                 let validate_parameter_attr = intern!(py, "validate_parameter");
                                 let assign_parameters_attr = intern!(py, "assign_parameters");
 
-                                let op = self
-                                    .unpack_py_op(py, &self.data[instruction])?
-                                    .into_bound(py);
-                                let previous = &mut self.data[instruction];
+                                let op = self.unpack_py_op_at(py, instruction)?.into_bound(py);
+                                let previous = &mut Arc::make_mut(&mut self.data)[instruction];
                                 // All "user" operations (e.g. PyOperation) use Parameters::Param.
                                 let previous_param = &previous.params_view()[parameter];
                                 let new_param = match previous_param {
@@ -3095,10 +3471,44 @@ impl CircuitData {
         &self.data
     }
 
+    /// Get mutable access to the instruction listing, first cloning it if it is shared with a copy
+    /// of this circuit.
+    fn data_mut(&mut self) -> &mut Vec<PackedInstruction> {
+        self.structural_hashes.clear();
+        let data = Arc::make_mut(&mut self.data);
+        #[cfg(feature = "cache_pygates")]
+        if let Some(py_ops) = self.py_ops.take() {
+            // The instructions may hold the operation objects cached by the circuit this one was
+            // copied from, so replace them with this circuit's own.
+            for (inst, py_op) in data.iter_mut().zip(py_ops.into_vec()) {
+                inst.py_op = py_op;
+            }
+        }
+        data
+    }
+
+    /// The cache of the Python operation object of the instruction at `index`.
+    #[cfg(feature = "cache_pygates")]
+    fn py_op_cache(&self, index: usize) -> &OnceLock<Py<PyAny>> {
+        match &self.py_ops {
+            Some(py_ops) => &py_ops[index],
+            None => &self.data[index].py_op,
+        }
+    }
+
     /// Consume the CircuitData and create an iterator of the [`PackedInstruction`] objects in the
     /// circuit.
     pub fn into_data_iter(self) -> impl Iterator<Item = PackedInstruction> {
-        self.data.into_iter()
+        #[cfg(feature = "cache_pygates")]
+        let data = {
+            let mut slf = self;
+            // Make sure the instructions hold this circuit's own cached operation objects.
+            slf.data_mut();
+            slf.data
+        };
+        #[cfg(not(feature = "cache_pygates"))]
+        let data = self.data;
+        Arc::unwrap_or_clone(data).into_iter()
     }
 
     /// Returns an iterator over the stored identifiers in order of insertion
@@ -3115,7 +3525,7 @@ impl CircuitData {
     ///
     /// * index: The index of the instruction in the circuit to remove the label of.
     pub fn invalidate_label(&mut self, index: usize) {
-        self.data[index].label = None;
+        self.data_mut()[index].label = None;
     }
 
     /// Clone an empty CircuitData from a given reference.
@@ -3141,7 +3551,7 @@ impl CircuitData {
         blocks_mode: BlocksMode,
     ) -> Result<Self, CircuitDataError> {
         let mut res = CircuitData {
-            data: Vec::with_capacity(capacity.unwrap_or(other.data.len())),
+            data: Arc::new(Vec::with_capacity(capacity.unwrap_or(other.data.len()))),
             qargs_interner: other.qargs_interner.clone(),
             cargs_interner: other.cargs_interner.clone(),
             qubits: other.qubits.clone(),
@@ -3153,6 +3563,9 @@ impl CircuitData {
             },
             param_table: ParameterTable::new(),
             global_phase: Param::Float(0.0),
+            structural_hashes: StructuralHashCache::default(),
+            #[cfg(feature = "cache_pygates")]
+            py_ops: None,
             qregs: other.qregs.clone(),
             cregs: other.cregs.clone(),
             qubit_indices: other.qubit_indices.clone(),
@@ -3219,7 +3632,7 @@ impl CircuitData {
     ///   function to work. If they are not this will corrupt the circuit.
     pub fn push(&mut self, packed: PackedInstruction) -> Result<(), CircuitDataError> {
         let new_index = self.data.len();
-        self.data.push(packed);
+        self.data_mut().push(packed);
         self.track_instruction_blocks(new_index);
         self.track_instruction_parameters(new_index)
     }
@@ -3417,6 +3830,15 @@ impl<'a, 'py> FromPyObject<'a, 'py> for AssignParam {
     }
 }
 
+/// Whether the operation of an instruction is implemented natively, rather than by a Python
+/// object, so it need not be copied for a copy of the circuit to be independent of the original.
+fn is_shareable(inst: &PackedInstruction) -> bool {
+    !matches!(
+        inst.op.view(),
+        OperationRef::Gate(_) | OperationRef::Instruction(_) | OperationRef::Operation(_)
+    )
+}
+
 /// Get the `Vec` of bits referred to by the specifier `specifier`.
 ///
 /// Valid types for `specifier` are integers, bits of the correct type (as given in `type_`), or
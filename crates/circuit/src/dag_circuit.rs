@@ -40,6 +40,7 @@ use crate::packed_instruction::{PackedInstruction, PackedOperation};
 use crate::parameter::parameter_expression::ParameterExpression;
 use crate::register_data::RegisterData;
 use crate::slice::PySequenceIndex;
+use crate::structural_hash::{StructuralHashOptions, structural_hash};
 use crate::variable_mapper::VariableMapper;
 use crate::{
     Block, BlockMapper, BlocksMode, Clbit, ControlFlowBlocks, Qubit, Stretch, TupleLikeArg, Var,
@@ -91,7 +92,8 @@ use uuid::Uuid;
 
 static CONTROL_FLOW_OP_NAMES: [&str; 5] =
     ["for_loop", "while_loop", "if_else", "switch_case", "box"];
-static SEMANTIC_EQ_SYMMETRIC: [&str; 4] = ["barrier", "swap", "break_loop", "continue_loop"];
+pub(crate) static SEMANTIC_EQ_SYMMETRIC: [&str; 4] =
+    ["barrier", "swap", "break_loop", "continue_loop"];
 
 pub use rustworkx_core::petgraph::stable_graph::NodeIndex;
 
@@ -1949,6 +1951,35 @@ impl DAGCircuit {
         weak_components
     }
 
+    /// A hash of the structure of the DAG.
+    ///
+    /// This is calculated in a single pass over the operation nodes, and depends only on the
+    /// dependency structure of the DAG, not on the order the nodes were added in.  It is equal to
+    /// the canonical :meth:`.QuantumCircuit.structural_hash` of any circuit that converts to this
+    /// DAG.
+    ///
+    /// Args:
+    ///     ignore_global_phase: if ``True``, DAGs that differ only by their global phase have the
+    ///         same hash.
+    #[pyo3(signature = (*, ignore_global_phase=false))]
+    pub fn structural_hash(&self, ignore_global_phase: bool) -> u64 {
+        let options = StructuralHashOptions {
+            ignore_global_phase,
+            canonical: true,
+        };
+        structural_hash(
+            self.num_qubits(),
+            self.num_clbits(),
+            &self.global_phase,
+            self.topological_op_nodes(false)
+                .map(|node| self.dag[node].unwrap_operation()),
+            &self.qargs_interner,
+            &self.cargs_interner,
+            |block| self.blocks[block].structural_hash(ignore_global_phase),
+            options,
+        )
+    }
+
     fn __eq__(&self, py: Python, other: &DAGCircuit) -> PyResult<bool> {
         fn eq_inner(
             py: Python,
@@ -37,6 +37,7 @@ pub mod parameter;
 pub mod parameter_table;
 pub mod register_data;
 pub mod slice;
+pub mod structural_hash;
 pub mod util;
 pub mod vf2;
 
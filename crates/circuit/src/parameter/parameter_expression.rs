@@ -32,7 +32,7 @@ use crate::parameter::symbol_expr;
 use crate::parameter::symbol_expr::SymbolExpr;
 use crate::parameter::symbol_parser::parse_expression;
 
-use super::symbol_expr::{SYMEXPR_EPSILON, Symbol, Value};
+use super::symbol_expr::{CompiledExpr, SYMEXPR_EPSILON, Symbol, Value};
 
 /// Errors for dealing with parameters and parameter expressions.
 #[derive(Error, Debug)]
@@ -333,6 +333,13 @@ impl ParameterExpression {
         self.name_map.values()
     }
 
+    /// Compile the expression for repeated numeric evaluation.
+    ///
+    /// See [CompiledExpr::new] for the meaning of `slot`.
+    pub fn compile(&self, slot: &impl Fn(&Symbol) -> Option<usize>) -> Option<CompiledExpr> {
+        CompiledExpr::new(&self.expr, slot)
+    }
+
     /// Get the number of [Symbol]s in the expression.
     pub fn num_symbols(&self) -> usize {
         self.name_map.len()
@@ -22,6 +22,7 @@ use std::ops::{Add, Div, Mul, Neg, Sub};
 use std::sync::Arc;
 use uuid::Uuid;
 
+use ndarray::ArrayView2;
 use num_complex::Complex64;
 use pyo3::prelude::*;
 
@@ -293,6 +294,143 @@ fn _neg(expr: SymbolExpr) -> SymbolExpr {
     }
 }
 
+/// Evaluate a single unary operation on a value.
+fn eval_unary(op: &UnaryOp, val: Value) -> Value {
+    let ret = match op {
+        UnaryOp::Abs => val.abs(),
+        UnaryOp::Neg => -val,
+        UnaryOp::Sin => val.sin(),
+        UnaryOp::Asin => val.asin(),
+        UnaryOp::Cos => val.cos(),
+        UnaryOp::Acos => val.acos(),
+        UnaryOp::Tan => val.tan(),
+        UnaryOp::Atan => val.atan(),
+        UnaryOp::Exp => val.exp(),
+        UnaryOp::Log => val.log(),
+        UnaryOp::Sign => val.sign(),
+        UnaryOp::Conj => match val {
+            Value::Complex(v) => Value::Complex(v.conj()),
+            _ => val,
+        },
+    };
+    drop_negligible_imag(ret)
+}
+
+/// Evaluate a single binary operation on two values.
+fn eval_binary(op: &BinaryOp, lval: Value, rval: Value) -> Value {
+    let ret = match op {
+        BinaryOp::Add => lval + rval,
+        BinaryOp::Sub => lval - rval,
+        BinaryOp::Mul => lval * rval,
+        BinaryOp::Div => lval / rval,
+        BinaryOp::Pow => lval.pow(&rval),
+    };
+    drop_negligible_imag(ret)
+}
+
+/// Convert a complex value with a negligible imaginary part to a real value.
+#[inline(always)]
+fn drop_negligible_imag(val: Value) -> Value {
+    match val {
+        Value::Complex(c) if (-SYMEXPR_EPSILON..SYMEXPR_EPSILON).contains(&c.im) => {
+            Value::Real(c.re)
+        }
+        _ => val,
+    }
+}
+
+/// A single step of a [CompiledExpr].
+#[derive(Debug, Clone)]
+enum TapeOp {
+    /// Push the values bound to the symbol in this slot.
+    Slot(usize),
+    /// Push a constant.
+    Value(Value),
+    /// Replace the top of the stack with the result of the operation on it.
+    Unary(UnaryOp),
+    /// Pop the right-hand operand, and replace the left-hand operand below it with the result.
+    Binary(BinaryOp),
+}
+
+/// A [SymbolExpr] flattened into a postfix tape, for evaluating the same expression with many
+/// different sets of real values bound to its symbols.
+///
+/// Each node is evaluated with the same arithmetic as [SymbolExpr::eval], but the tree is only
+/// walked once, when compiling, and no intermediate expressions are built for each set of values.
+/// Each step of the tape is applied to every set of values at once.
+#[derive(Debug, Clone)]
+pub struct CompiledExpr {
+    tape: Vec<TapeOp>,
+}
+
+impl CompiledExpr {
+    /// Compile an expression.
+    ///
+    /// `slot` gives the column of each symbol in the values that will be passed to
+    /// [CompiledExpr::eval_rows].  Returns `None` if any symbol in the expression has no slot.
+    pub fn new(expr: &SymbolExpr, slot: &impl Fn(&Symbol) -> Option<usize>) -> Option<Self> {
+        let mut tape = Vec::new();
+        Self::compile_into(expr, slot, &mut tape)?;
+        Some(Self { tape })
+    }
+
+    fn compile_into(
+        expr: &SymbolExpr,
+        slot: &impl Fn(&Symbol) -> Option<usize>,
+        tape: &mut Vec<TapeOp>,
+    ) -> Option<()> {
+        match expr {
+            SymbolExpr::Symbol(symbol) => tape.push(TapeOp::Slot(slot(symbol.as_ref())?)),
+            SymbolExpr::Value(value) => tape.push(TapeOp::Value(*value)),
+            SymbolExpr::Unary { op, expr } => {
+                Self::compile_into(expr, slot, tape)?;
+                tape.push(TapeOp::Unary(op.clone()));
+            }
+            SymbolExpr::Binary { op, lhs, rhs } => {
+                Self::compile_into(lhs, slot, tape)?;
+                Self::compile_into(rhs, slot, tape)?;
+                tape.push(TapeOp::Binary(op.clone()));
+            }
+        }
+        Some(())
+    }
+
+    /// Evaluate the expression once for each row of `values`, whose columns are the slots of the
+    /// symbols.
+    pub fn eval_rows(&self, values: ArrayView2<f64>) -> Vec<Value> {
+        let num_rows = values.nrows();
+        let mut stack: Vec<Vec<Value>> = Vec::new();
+        for op in self.tape.iter() {
+            match op {
+                TapeOp::Slot(slot) => stack.push(
+                    values
+                        .column(*slot)
+                        .iter()
+                        .map(|value| Value::Real(*value))
+                        .collect(),
+                ),
+                TapeOp::Value(value) => stack.push(vec![*value; num_rows]),
+                TapeOp::Unary(op) => {
+                    let operand = stack.last_mut().expect("tape should be well formed");
+                    for value in operand.iter_mut() {
+                        *value = eval_unary(op, *value);
+                    }
+                }
+                TapeOp::Binary(op) => {
+                    let rhs = stack.pop().expect("tape should be well formed");
+                    let lhs = stack.last_mut().expect("tape should be well formed");
+                    for (value, rval) in lhs.iter_mut().zip(rhs) {
+                        *value = eval_binary(op, *value, rval);
+                    }
+                }
+            }
+        }
+        let out = stack.pop().expect("tape should be well formed");
+        debug_assert!(stack.is_empty());
+        out
+    }
+}
+
 impl fmt::Display for SymbolExpr {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
         write!(f, "{}", self.repr(false))
@@ -373,34 +511,7 @@ impl SymbolExpr {
                         _ => return None,
                     }
                 }
-                let ret = match op {
-                    UnaryOp::Abs => val.abs(),
-                    UnaryOp::Neg => -val,
-                    UnaryOp::Sin => val.sin(),
-                    UnaryOp::Asin => val.asin(),
-                    UnaryOp::Cos => val.cos(),
-                    UnaryOp::Acos => val.acos(),
-                    UnaryOp::Tan => val.tan(),
-                    UnaryOp::Atan => val.atan(),
-                    UnaryOp::Exp => val.exp(),
-                    UnaryOp::Log => val.log(),
-                    UnaryOp::Sign => val.sign(),
-                    UnaryOp::Conj => match val {
-                        Value::Complex(v) => Value::Complex(v.conj()),
-                        _ => val,
-                    },
-                };
-                match ret {
-                    Value::Real(_) => Some(ret),
-                    Value::Int(_) => Some(ret),
-                    Value::Complex(c) => {
-                        if (-SYMEXPR_EPSILON..SYMEXPR_EPSILON).contains(&c.im) {
-                            Some(Value::Real(c.re))
-                        } else {
-                            Some(ret)
-                        }
-                    }
-                }
+                Some(eval_unary(op, val))
             }
             SymbolExpr::Binary { op, lhs, rhs } => {
                 let lval: Value;
@@ -422,24 +533,7 @@ impl SymbolExpr {
                         _ => return None,
                     }
                 }
-                let ret = match op {
-                    BinaryOp::Add => lval + rval,
-                    BinaryOp::Sub => lval - rval,
-                    BinaryOp::Mul => lval * rval,
-                    BinaryOp::Div => lval / rval,
-                    BinaryOp::Pow => lval.pow(&rval),
-                };
-                match ret {
-                    Value::Real(_) => Some(ret),
-                    Value::Int(_) => Some(ret),
-                    Value::Complex(c) => {
-                        if (-SYMEXPR_EPSILON..SYMEXPR_EPSILON).contains(&c.im) {
-                            Some(Value::Real(c.re))
-                        } else {
-                            Some(ret)
-                        }
-                    }
-                }
+                Some(eval_binary(op, lval, rval))
             }
         }
     }
@@ -0,0 +1,294 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2025
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+//! Structural hashing of circuits, shared between [crate::circuit_data::CircuitData] and
+//! [crate::dag_circuit::DAGCircuit].
+
+use std::hash::{DefaultHasher, Hash, Hasher};
+use std::sync::OnceLock;
+
+use num_complex::Complex64;
+use pyo3::prelude::*;
+use smallvec::SmallVec;
+
+use crate::dag_circuit::SEMANTIC_EQ_SYMMETRIC;
+use crate::interner::Interner;
+use crate::operations::{
+    ArrayType, ControlFlow, ControlFlowInstruction, ForCollection, Operation, OperationRef, Param,
+};
+use crate::packed_instruction::PackedInstruction;
+use crate::{Block, Clbit, Qubit};
+
+/// The options controlling what a structural hash is invariant to.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub struct StructuralHashOptions {
+    /// Don't include the global phase in the hash.
+    pub ignore_global_phase: bool,
+    /// Make the hash independent of the order of instructions that act on disjoint wires, so
+    /// it only depends on the DAG of the circuit.
+    pub canonical: bool,
+}
+
+impl StructuralHashOptions {
+    fn index(&self) -> usize {
+        usize::from(self.ignore_global_phase) | (usize::from(self.canonical) << 1)
+    }
+}
+
+/// A cache of the structural hashes of a circuit, one for each set of [StructuralHashOptions].
+///
+/// The owner of the cache is responsible for calling [StructuralHashCache::clear] whenever the
+/// circuit is modified.
+#[derive(Clone, Debug, Default)]
+pub struct StructuralHashCache([OnceLock<u64>; 4]);
+
+impl StructuralHashCache {
+    /// Get the cached hash for these options, calculating it with `f` if it is not present.
+    pub fn get_or_init(&self, options: StructuralHashOptions, f: impl FnOnce() -> u64) -> u64 {
+        *self.0[options.index()].get_or_init(f)
+    }
+
+    /// Invalidate all the cached hashes.
+    pub fn clear(&mut self) {
+        *self = Self::default();
+    }
+}
+
+/// Calculate the structural hash of a circuit in a single pass over its instructions.
+///
+/// The hash covers the number of qubits and clbits, the global phase (unless ignored), and, for
+/// each instruction, its operation, the indices of its qubits and clbits, its parameters (by
+/// value for numbers, and by the symbolic expression otherwise) and, recursively, the hashes of
+/// its control-flow blocks.  Instruction labels are not included.  Python-space operations are
+/// hashed by their type, name, sizes and parameters only, and the qubits of the operations in
+/// [SEMANTIC_EQ_SYMMETRIC] are hashed as an unordered set.
+///
+/// In canonical mode, each wire carries the hash of the last instruction that acted on it, and
+/// each instruction's hash is seeded by the hashes on its incoming wires, so the result depends
+/// only on the dependency graph of the circuit, and not on which topological order
+/// `instructions` are given in.  Instructions that may act on classical variables (control flow
+/// and stores) are treated as all acting on one additional shared wire, and instructions that
+/// act on no wires at all are hashed as an unordered multiset.
+///
+/// Circuits that are structurally identical have equal hashes, but equal hashes do not imply
+/// equal circuits.  The hash is deterministic for a given version of Qiskit, but is not stable
+/// across versions.
+#[allow(clippy::too_many_arguments)]
+pub fn structural_hash<'a>(
+    num_qubits: usize,
+    num_clbits: usize,
+    global_phase: &Param,
+    instructions: impl Iterator<Item = &'a PackedInstruction>,
+    qargs_interner: &Interner<[Qubit]>,
+    cargs_interner: &Interner<[Clbit]>,
+    block_hash: impl Fn(Block) -> u64,
+    options: StructuralHashOptions,
+) -> u64 {
+    let mut state = DefaultHasher::new();
+    (num_qubits, num_clbits).hash(&mut state);
+    if !options.ignore_global_phase {
+        hash_param(global_phase, &mut state);
+    }
+    if !options.canonical {
+        for inst in instructions {
+            hash_instruction(
+                inst,
+                qargs_interner,
+                cargs_interner,
+                &block_hash,
+                &mut state,
+            );
+        }
+        return state.finish();
+    }
+    let classical_wire = num_qubits + num_clbits;
+    let mut wires = vec![0u64; classical_wire + 1];
+    let mut wireless = Vec::new();
+    for inst in instructions {
+        let mut node = DefaultHasher::new();
+        hash_instruction(inst, qargs_interner, cargs_interner, &block_hash, &mut node);
+        let mut inst_wires = qargs_interner
+            .get(inst.qubits)
+            .iter()
+            .map(|qubit| qubit.index())
+            .chain(
+                cargs_interner
+                    .get(inst.clbits)
+                    .iter()
+                    .map(|clbit| num_qubits + clbit.index()),
+            )
+            .chain(may_use_vars(inst).then_some(classical_wire))
+            .collect::<SmallVec<[usize; 4]>>();
+        if SEMANTIC_EQ_SYMMETRIC.contains(&inst.op.name()) {
+            inst_wires.sort_unstable();
+        }
+        for wire in inst_wires.iter() {
+            wires[*wire].hash(&mut node);
+        }
+        let node = node.finish();
+        if inst_wires.is_empty() {
+            wireless.push(node);
+        }
+        for wire in inst_wires {
+            wires[wire] = node;
+        }
+    }
+    wires.hash(&mut state);
+    wireless.sort_unstable();
+    wireless.hash(&mut state);
+    state.finish()
+}
+
+/// Whether the instruction may act on classical variables, which are not tracked as wires here.
+fn may_use_vars(inst: &PackedInstruction) -> bool {
+    match inst.op.view() {
+        OperationRef::ControlFlow(_) => true,
+        OperationRef::Instruction(inst) => inst.op_name == "store",
+        _ => false,
+    }
+}
+
+fn hash_instruction<H: Hasher>(
+    inst: &PackedInstruction,
+    qargs_interner: &Interner<[Qubit]>,
+    cargs_interner: &Interner<[Clbit]>,
+    block_hash: &impl Fn(Block) -> u64,
+    state: &mut H,
+) {
+    let op = inst.op.view();
+    (op.name(), op.num_qubits(), op.num_clbits()).hash(state);
+    match op {
+        OperationRef::StandardInstruction(instruction) => instruction.hash(state),
+        OperationRef::Unitary(unitary) => match &unitary.array {
+            ArrayType::NDArray(array) => array.iter().for_each(|x| hash_complex(x, state)),
+            ArrayType::OneQ(array) => array.iter().for_each(|x| hash_complex(x, state)),
+            ArrayType::TwoQ(array) => array.iter().for_each(|x| hash_complex(x, state)),
+        },
+        OperationRef::PauliProductMeasurement(ppm) => (&ppm.z, &ppm.x, ppm.neg).hash(state),
+        OperationRef::ControlFlow(control_flow) => hash_control_flow(control_flow, state),
+        OperationRef::Gate(py_op)
+        | OperationRef::Instruction(py_op)
+        | OperationRef::Operation(py_op) => {
+            Python::attach(|py| {
+                if let Ok(type_name) = py_op.instruction.bind(py).get_type().fully_qualified_name()
+                {
+                    type_name.to_string().hash(state);
+                }
+            });
+        }
+        OperationRef::StandardGate(_) => (),
+    }
+    let qubits = qargs_interner.get(inst.qubits);
+    if SEMANTIC_EQ_SYMMETRIC.contains(&op.name()) {
+        let mut qubits = qubits.to_vec();
+        qubits.sort_unstable();
+        qubits.hash(state);
+    } else {
+        qubits.hash(state);
+    }
+    cargs_interner.get(inst.clbits).hash(state);
+    let params = inst.params_view();
+    params.len().hash(state);
+    for param in params {
+        hash_param(param, state);
+    }
+    let blocks = inst.blocks_view();
+    blocks.len().hash(state);
+    for block in blocks {
+        block_hash(*block).hash(state);
+    }
+}
+
+fn hash_control_flow<H: Hasher>(control_flow: &ControlFlowInstruction, state: &mut H) {
+    // The conditions, targets and durations don't implement `Hash`, but their `Debug`
+    // representations are deterministic and distinguish exactly the values that compare unequal.
+    match &control_flow.control_flow {
+        ControlFlow::Box {
+            duration,
+            annotations,
+        } => {
+            0u8.hash(state);
+            format!("{duration:?}").hash(state);
+            annotations.len().hash(state);
+            Python::attach(|py| {
+                for annotation in annotations {
+                    if let Ok(repr) = annotation.bind(py).repr() {
+                        repr.to_string().hash(state);
+                    }
+                }
+            });
+        }
+        ControlFlow::BreakLoop => 1u8.hash(state),
+        ControlFlow::ContinueLoop => 2u8.hash(state),
+        ControlFlow::ForLoop {
+            collection,
+            loop_param,
+        } => {
+            3u8.hash(state);
+            match collection {
+                ForCollection::PyRange(range) => (range.start, range.stop, range.step).hash(state),
+                ForCollection::List(values) => values.hash(state),
+            }
+            loop_param.hash(state);
+        }
+        ControlFlow::IfElse { condition } => {
+            4u8.hash(state);
+            format!("{condition:?}").hash(state);
+        }
+        ControlFlow::Switch {
+            target,
+            label_spec,
+            cases,
+        } => {
+            5u8.hash(state);
+            format!("{target:?}").hash(state);
+            (label_spec, cases).hash(state);
+        }
+        ControlFlow::While { condition } => {
+            6u8.hash(state);
+            format!("{condition:?}").hash(state);
+        }
+    }
+}
+
+fn hash_f64<H: Hasher>(value: f64, state: &mut H) {
+    // Adding zero normalizes negative zero to positive zero, so the two hash the same.
+    (value + 0.0).to_bits().hash(state);
+}
+
+fn hash_complex<H: Hasher>(value: &Complex64, state: &mut H) {
+    hash_f64(value.re, state);
+    hash_f64(value.im, state);
+}
+
+fn hash_param<H: Hasher>(param: &Param, state: &mut H) {
+    match param {
+        Param::Float(value) => {
+            0u8.hash(state);
+            hash_f64(*value, state);
+        }
+        Param::ParameterExpression(expr) => {
+            1u8.hash(state);
+            expr.hash(state);
+        }
+        Param::Obj(obj) => {
+            2u8.hash(state);
+            // There's no general structural hash of Python objects, so use their `repr`, which is
+            // at least deterministic for the types of object used as instruction parameters.
+            Python::attach(|py| {
+                if let Ok(repr) = obj.bind(py).repr() {
+                    repr.to_string().hash(state);
+                }
+            });
+        }
+    }
+}
@@ -444,6 +444,7 @@ impl<N, H, S: Vf2Score> Semantics<N, H> for NoSemantics<S> {
 ///
 /// Typically this is constructed automatically by [Vf2::with_scoring], but you can also construct
 /// it directly with a scoring function.
+#[derive(Clone, Copy)]
 pub struct Scorer<F>(pub F);
 impl<F, N, H, S, E> Semantics<N, H> for Scorer<F>
 where
@@ -464,6 +465,7 @@ where
 ///
 /// Typically this is constructed automatically by [Vf2::with_matching] or
 /// [Vf2::with_node_matching], but you can also construct it directly with a matching function.
+#[derive(Clone, Copy)]
 pub struct Matcher<F>(pub F);
 impl<F, N, H, E> Semantics<N, H> for Matcher<F>
 where
@@ -957,10 +959,12 @@ where
             loop_stack,
             num_calls: 0,
             call_limit: self.call_limit,
+            root_shard: None,
         }
     }
 }
 
+#[derive(Clone)]
 struct State<G: GraphBase, OtherId> {
     graph: G,
     /// The current mapping from indices in this graph to indices in the other graph.  If a node is
@@ -1212,12 +1216,26 @@ impl PartialOrd for NeighborKind {
     }
 }
 
-#[derive(Debug)]
+#[derive(Clone, Debug)]
 enum Frame<N, H> {
-    ChooseNextHaystack { nodes: (N, H), kind: NeighborKind },
+    ChooseNextHaystack {
+        nodes: (N, H),
+        kind: NeighborKind,
+    },
     ChooseNextNeedle,
+    /// The call limit was reached just before this pair was added to the mapping.  The pair has
+    /// not been added, and the search resumes by trying it again.
+    Resume {
+        nodes: (N, H),
+        kind: NeighborKind,
+    },
 }
 
+/// The iterator over the isomorphisms found by [Vf2].
+///
+/// If the iterator stops because it reached its `call_limit`, it can be resumed by raising the
+/// limit and calling `next` again; [Vf2IntoIter::is_exhausted] tells the two cases apart.
+#[derive(Clone)]
 pub struct Vf2IntoIter<N, H, NId, HId, NS, ES>
 where
     N: for<'a> alias::Vf2Graph<'a>,
@@ -1239,6 +1257,9 @@ where
     loop_stack: Vec<Frame<N::NodeId, H::NodeId>>,
     num_calls: usize,
     pub call_limit: Option<usize>,
+    /// If set, `(shard, num_shards)`: only the haystack nodes whose index is `shard` modulo
+    /// `num_shards` are tried as the partner of the first needle node.
+    root_shard: Option<(usize, usize)>,
 }
 
 impl<N, H, NId, HId, NS, ES> Vf2IntoIter<N, H, NId, HId, NS, ES>
@@ -1250,6 +1271,73 @@ where
     NS: Semantics<N::NodeWeight, H::NodeWeight>,
     ES: Semantics<N::EdgeWeight, H::EdgeWeight, Score = NS::Score>,
 {
+    /// Only search the part of the tree of partial mappings in which the first needle node is
+    /// paired with one of the haystack nodes in the given shard.
+    ///
+    /// Every complete mapping pairs the first needle node with exactly one haystack node, so the
+    /// iterators of the `num_shards` different shards search disjoint parts of the tree, and
+    /// between them find every isomorphism.  They can be run independently, for example in
+    /// parallel threads.  The haystack nodes are dealt to the shards in turn, in the order they
+    /// are tried, so each shard gets an even share of the most promising nodes.
+    pub fn with_root_shard(self, shard: usize, num_shards: usize) -> Self {
+        assert!(
+            shard < num_shards,
+            "shard {shard} out of range for {num_shards} shards"
+        );
+        Self {
+            root_shard: Some((shard, num_shards)),
+            ..self
+        }
+    }
+
+    /// Has the whole search tree been explored?  If not, the last call to `next` that returned
+    /// `None` stopped because the iterator reached its `call_limit`.
+    #[inline]
+    pub fn is_exhausted(&self) -> bool {
+        self.loop_stack.is_empty()
+    }
+
+    /// The number of times the partial mapping has been extended so far.
+    #[inline]
+    pub fn num_calls(&self) -> usize {
+        self.num_calls
+    }
+
+    /// Restrict the isomorphisms returned from now on to those that score strictly less than
+    /// `bound`, if they were not already.
+    ///
+    /// This can be used to share the best score found so far between the iterators of several
+    /// shards of the same search (see [Vf2IntoIter::with_root_shard]), so each can prune the
+    /// branches that cannot improve on the best of all of them.
+    pub fn tighten_bound(&mut self, bound: &NS::Score) {
+        let is_better = |current: &NS::Score| NS::Score::cmp(bound, current) == Ordering::Less;
+        let Some(restriction) = self.restriction.as_mut() else {
+            self.restriction = Some(Restriction::BetterThan(bound.clone()));
+            return;
+        };
+        match restriction {
+            Restriction::BetterThan(current) => {
+                if is_better(current) {
+                    *current = bound.clone();
+                }
+            }
+            Restriction::Decreasing(current) => {
+                if current.as_ref().is_none_or(is_better) {
+                    *current = Some(bound.clone());
+                }
+            }
+        }
+    }
+
+    /// Is the haystack node excluded from being paired with the first needle node by the shard?
+    #[inline]
+    fn outside_root_shard(&self, haystack: H::NodeId) -> bool {
+        self.needle.generation == 0
+            && self
+                .root_shard
+                .is_some_and(|(shard, num_shards)| haystack.index() % num_shards != shard)
+    }
+
     fn mapping(&self) -> IndexMap<NId, HId, ::ahash::RandomState> {
         self.needle
             .mapping
@@ -1804,13 +1892,18 @@ where
         }
     }
 
-    /// Increase the call count of the mapper.  Returns `None` if we're already exhausted.
+    /// Increase the call count of the mapper.  Returns `None`, leaving the count unchanged, if
+    /// we're already exhausted.
     #[inline]
     fn try_add_call(&mut self) -> Option<()> {
+        if self
+            .call_limit
+            .is_some_and(|limit| self.num_calls + 1 >= limit)
+        {
+            return None;
+        }
         self.num_calls += 1;
-        self.call_limit
-            .is_none_or(|limit| self.num_calls < limit)
-            .then_some(())
+        Some(())
     }
 }
 
@@ -1847,6 +1940,7 @@ where
                         continue;
                     }
                 }
+                Frame::Resume { nodes, kind } => (nodes, kind),
                 Frame::ChooseNextNeedle => {
                     if let Some((needle, haystack, kind)) = self.next_candidates() {
                         ((needle, haystack), kind)
@@ -1871,14 +1965,23 @@ where
             // point we save our state in the haystack loop and move to finding the match to the
             // next needle node.  If none are feasible, we've finished this stack frame.
             loop {
-                let feasible = match self.is_feasible(nodes) {
-                    Ok(f) => f,
-                    Err(e) => return Some(Err(e)),
+                let feasible = if self.outside_root_shard(nodes.1) {
+                    None
+                } else {
+                    match self.is_feasible(nodes) {
+                        Ok(f) => f,
+                        Err(e) => return Some(Err(e)),
+                    }
                 };
                 if let Some(new_score) = feasible {
                     self.push_state(nodes, new_score);
                     if self.neighbor_counts_feasible() {
-                        self.try_add_call()?;
+                        if self.try_add_call().is_none() {
+                            // Save our place, so the search can be resumed with a higher limit.
+                            self.pop_state(nodes);
+                            self.loop_stack.push(Frame::Resume { nodes, kind });
+                            return None;
+                        }
                         self.loop_stack
                             .push(Frame::ChooseNextHaystack { nodes, kind });
                         if self.needle.is_complete() {
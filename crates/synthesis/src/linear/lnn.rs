@@ -305,10 +305,14 @@ pub fn py_synth_cnot_lnn_instructions(
 /// Returns: The CircuitData of the synthesized circuit.
 #[pyfunction]
 #[pyo3(signature = (mat))]
-pub fn py_synth_cnot_depth_line_kms(mat: PyReadonlyArray2<bool>) -> PyResult<CircuitData> {
-    let num_qubits = mat.as_array().nrows(); // is a quadratic matrix
+pub fn py_synth_cnot_depth_line_kms(
+    py: Python,
+    mat: PyReadonlyArray2<bool>,
+) -> PyResult<CircuitData> {
+    let view = mat.as_array();
+    let num_qubits = view.nrows(); // is a quadratic matrix
     let (cx_instructions_rows_m2nw, cx_instructions_rows_nw2id) =
-        synth_cnot_lnn_instructions(mat.as_array());
+        py.detach(|| synth_cnot_lnn_instructions(view));
 
     let instructions = cx_instructions_rows_m2nw
         .into_iter()
@@ -150,6 +150,7 @@ fn lower_cnot_synth(
 #[pyfunction]
 #[pyo3(signature = (matrix, section_size=None))]
 pub fn synth_cnot_count_full_pmh(
+    py: Python,
     matrix: PyReadonlyArray2<bool>,
     section_size: Option<i64>,
 ) -> PyResult<CircuitData> {
@@ -170,8 +171,11 @@ pub fn synth_cnot_count_full_pmh(
 
     // compute the synthesis for the lower triangular part of the matrix, and then
     // apply it on the transposed part for the full synthesis
-    let lower_cnots = lower_cnot_synth(mat.view_mut(), blocksize, false);
-    let upper_cnots = lower_cnot_synth(mat.view_mut(), blocksize, true);
+    let (lower_cnots, upper_cnots) = py.detach(|| {
+        let lower_cnots = lower_cnot_synth(mat.view_mut(), blocksize, false);
+        let upper_cnots = lower_cnot_synth(mat.view_mut(), blocksize, true);
+        (lower_cnots, upper_cnots)
+    });
 
     // iterator over the gates
     let instructions = upper_cnots
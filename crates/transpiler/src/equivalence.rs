@@ -10,7 +10,7 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
-use hashbrown::HashSet;
+use hashbrown::{HashMap, HashSet};
 use itertools::Itertools;
 
 use pyo3::exceptions::PyTypeError;
@@ -354,6 +354,16 @@ impl<'a, 'py> FromPyObject<'a, 'py> for CircuitFromPython {
 type GraphType = StableDiGraph<NodeData, Option<EdgeData>>;
 type KTIType = IndexMap<Key, NodeIndex, RandomState>;
 
+/// Key of a memoized basis search: the sorted ``(name, num_qubits)`` source gates and the sorted
+/// names of the target basis.
+pub(crate) type BasisSearchKey = (Vec<(String, u32)>, Vec<String>);
+/// Memoized outcome of a basis search, in the form produced by the basis translator.
+pub(crate) type BasisSearchResult =
+    Option<Vec<((String, u32), (SmallVec<[Param; 3]>, CircuitData))>>;
+
+/// The maximum number of basis searches memoized on a single library before the cache is reset.
+const MAX_CACHED_BASIS_SEARCHES: usize = 256;
+
 /// A library providing a one-way mapping of gates to their equivalent
 /// implementations as :class:`.QuantumCircuit` instances.
 #[pyclass(
@@ -367,6 +377,7 @@ pub struct EquivalenceLibrary {
     key_to_node_index: KTIType,
     rule_id: usize,
     _graph: Option<Py<PyAny>>,
+    basis_search_cache: HashMap<BasisSearchKey, BasisSearchResult>,
 }
 
 #[pymethods]
@@ -385,6 +396,7 @@ impl EquivalenceLibrary {
                 key_to_node_index: base.key_to_node_index.clone(),
                 rule_id: base.rule_id,
                 _graph: None,
+                basis_search_cache: base.basis_search_cache.clone(),
             }
         } else {
             Self {
@@ -392,6 +404,7 @@ impl EquivalenceLibrary {
                 key_to_node_index: KTIType::default(),
                 rule_id: 0_usize,
                 _graph: None,
+                basis_search_cache: HashMap::new(),
             }
         }
     }
@@ -597,6 +610,7 @@ impl EquivalenceLibrary {
             .map(|(key, val)| (key, NodeIndex::new(val)))
             .collect();
         slf._graph = None;
+        slf.basis_search_cache.clear();
         Ok(())
     }
 }
@@ -646,6 +660,7 @@ impl EquivalenceLibrary {
         }
         self.rule_id += 1;
         self._graph = None;
+        self.basis_search_cache.clear();
         Ok(())
     }
 
@@ -680,6 +695,7 @@ impl EquivalenceLibrary {
             self.add_equivalence(gate, params, equiv)?
         }
         self._graph = None;
+        self.basis_search_cache.clear();
         Ok(())
     }
 
@@ -722,6 +738,22 @@ impl EquivalenceLibrary {
     pub fn graph_mut(&mut self) -> &mut GraphType {
         &mut self.graph
     }
+
+    /// Get the memoized result of a previous basis search over this library, if any.
+    ///
+    /// The cache is reset whenever the library is modified, so a hit is always consistent with
+    /// the current equivalences.
+    pub(crate) fn cached_basis_search(&self, key: &BasisSearchKey) -> Option<&BasisSearchResult> {
+        self.basis_search_cache.get(key)
+    }
+
+    /// Memoize the result of a basis search over this library.
+    pub(crate) fn cache_basis_search(&mut self, key: BasisSearchKey, result: BasisSearchResult) {
+        if self.basis_search_cache.len() >= MAX_CACHED_BASIS_SEARCHES {
+            self.basis_search_cache.clear();
+        }
+        self.basis_search_cache.insert(key, result);
+    }
 }
 
 fn raise_if_param_mismatch(
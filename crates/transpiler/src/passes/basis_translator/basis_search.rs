@@ -25,13 +25,34 @@ use super::compose_transforms::{BasisTransformIn, GateIdentifier};
 type BasisTransforms = Vec<(GateIdentifier, BasisTransformIn)>;
 /// Search for a set of transformations from source_basis to target_basis.
 ///
+/// The result of the search only depends on the contents of the `EquivalenceLibrary` and the
+/// two bases, so it is memoized on the library and reused by later searches for the same bases
+/// until the library is next modified.
+pub(crate) fn basis_search(
+    equiv_lib: &mut EquivalenceLibrary,
+    source_basis: &IndexSet<GateIdentifier, ahash::RandomState>,
+    target_basis: &IndexSet<&str, ahash::RandomState>,
+) -> Option<BasisTransforms> {
+    let mut source_key: Vec<GateIdentifier> = source_basis.iter().cloned().collect();
+    source_key.sort_unstable();
+    let mut target_key: Vec<String> = target_basis.iter().map(|name| name.to_string()).collect();
+    target_key.sort_unstable();
+    let key = (source_key, target_key);
+    if let Some(cached) = equiv_lib.cached_basis_search(&key) {
+        return cached.clone();
+    }
+    let basis_transforms = search(equiv_lib, source_basis, target_basis);
+    equiv_lib.cache_basis_search(key, basis_transforms.clone());
+    basis_transforms
+}
+
 /// Performs a Dijkstra search algorithm on the `EquivalenceLibrary`'s core graph
 /// to rate and classify different possible equivalent circuits to the provided gates.
 ///
 /// This is done by connecting all the nodes represented in the `target_basis` to a dummy
 /// node, and then traversing the graph until all the nodes described in the `source
 /// basis` are reached.
-pub(crate) fn basis_search(
+fn search(
     equiv_lib: &mut EquivalenceLibrary,
     source_basis: &IndexSet<GateIdentifier, ahash::RandomState>,
     target_basis: &IndexSet<&str, ahash::RandomState>,
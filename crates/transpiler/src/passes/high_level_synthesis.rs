@@ -17,7 +17,7 @@ use ndarray::prelude::*;
 use pyo3::Bound;
 use pyo3::IntoPyObjectExt;
 use pyo3::prelude::*;
-use pyo3::types::PyAny;
+use pyo3::types::{PyAny, PyDict};
 use qiskit_circuit::bit::ShareableQubit;
 use qiskit_circuit::circuit_data::CircuitData;
 use qiskit_circuit::circuit_instruction::OperationFromPython;
@@ -326,6 +326,11 @@ pub struct HighLevelSynthesisData {
     // prioritize methods for Clifford+T basis set.
     #[pyo3(get)]
     optimize_clifford_t: bool,
+
+    // Results of previous plugin syntheses, when enabled by the high-level-synthesis config.
+    // This is only accessed from the Python space, and is not preserved by pickling.
+    #[pyo3(get)]
+    synthesis_cache: Py<PyDict>,
 }
 
 #[pymethods]
@@ -333,6 +338,7 @@ impl HighLevelSynthesisData {
     #[new]
     #[allow(clippy::too_many_arguments)]
     fn __new__(
+        py: Python,
         hls_config: Py<PyAny>,
         hls_plugin_manager: Py<PyAny>,
         hls_op_names: HashSet<String>,
@@ -357,6 +363,7 @@ impl HighLevelSynthesisData {
             min_qubits,
             unroll_definitions,
             optimize_clifford_t,
+            synthesis_cache: PyDict::new(py).unbind(),
         }
     }
 
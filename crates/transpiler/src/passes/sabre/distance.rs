@@ -0,0 +1,173 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2026
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use std::collections::VecDeque;
+use std::ops::Index;
+use std::sync::OnceLock;
+
+use ndarray::Array2;
+use rustworkx_core::shortest_path::distance_matrix;
+
+use crate::neighbors::Neighbors;
+use qiskit_circuit::PhysicalQubit;
+
+/// Above this number of physical qubits, a [DistanceOracle] calculates the rows of the distance
+/// matrix on demand, rather than the whole matrix up front.
+///
+/// This matches `_DENSE_DISTANCE_MAX_QUBITS` in `qiskit/transpiler/coupling.py`.
+pub const DENSE_DISTANCE_MAX_QUBITS: usize = 2048;
+
+/// The undirected distances between all pairs of physical qubits of a routing target, with
+/// `NaN` for pairs that are not connected.
+///
+/// Distances are looked up by indexing with `[a, b]`, just like a dense [Array2].  For small
+/// targets, the dense all-pairs distance matrix is calculated up front.  For large targets, the
+/// matrix would take memory and time quadratic in the number of qubits, so instead each row is
+/// calculated with a breadth-first search the first time it is needed.  A routing problem only
+/// ever needs the rows of the physical qubits near the ones its circuit occupies, so on a target
+/// much larger than the circuit, the rows that are calculated are a small fraction of the matrix.
+/// The rows are shared between all the routing trials that use the same target, including trials
+/// running concurrently in other threads.
+#[derive(Clone, Debug)]
+pub enum DistanceOracle {
+    Dense(Array2<f64>),
+    Lazy(LazyDistances),
+}
+
+impl DistanceOracle {
+    /// Create the distance oracle of a routing target, choosing the dense or on-demand form based
+    /// on the number of qubits in the target.
+    pub fn from_neighbors(neighbors: &Neighbors) -> Self {
+        if neighbors.num_qubits() > DENSE_DISTANCE_MAX_QUBITS {
+            Self::Lazy(LazyDistances::new(neighbors.clone()))
+        } else {
+            Self::Dense(distance_matrix(neighbors, usize::MAX, false, f64::NAN))
+        }
+    }
+
+    /// The number of physical qubits.
+    pub fn num_qubits(&self) -> usize {
+        match self {
+            Self::Dense(distance) => distance.nrows(),
+            Self::Lazy(lazy) => lazy.rows.len(),
+        }
+    }
+
+    /// Materialize the full dense distance matrix.
+    pub fn to_dense(&self) -> Array2<f64> {
+        match self {
+            Self::Dense(distance) => distance.clone(),
+            Self::Lazy(lazy) => {
+                let num_qubits = lazy.rows.len();
+                Array2::from_shape_fn((num_qubits, num_qubits), |(a, b)| *lazy.get(a, b))
+            }
+        }
+    }
+}
+
+impl Index<[usize; 2]> for DistanceOracle {
+    type Output = f64;
+
+    #[inline]
+    fn index(&self, [a, b]: [usize; 2]) -> &f64 {
+        match self {
+            Self::Dense(distance) => &distance[[a, b]],
+            Self::Lazy(lazy) => lazy.get(a, b),
+        }
+    }
+}
+
+/// Rows of the distance matrix that are each calculated on first use.
+#[derive(Clone, Debug)]
+pub struct LazyDistances {
+    neighbors: Neighbors,
+    rows: Box<[OnceLock<Box<[f64]>>]>,
+}
+
+impl LazyDistances {
+    pub fn new(neighbors: Neighbors) -> Self {
+        let rows = (0..neighbors.num_qubits())
+            .map(|_| OnceLock::new())
+            .collect();
+        Self { neighbors, rows }
+    }
+
+    /// Get the distance between two qubits, calculating a row of the matrix if neither of the
+    /// two rows that contain it has been calculated yet.
+    #[inline]
+    pub fn get(&self, a: usize, b: usize) -> &f64 {
+        // The matrix is symmetric, so reuse the row of `b` if only that one is already calculated.
+        match (self.rows[a].get(), self.rows[b].get()) {
+            (Some(row), _) => &row[b],
+            (None, Some(row)) => &row[a],
+            (None, None) => &self.rows[a].get_or_init(|| self.bfs_row(a))[b],
+        }
+    }
+
+    /// The number of rows of the matrix that have been calculated.
+    pub fn num_calculated_rows(&self) -> usize {
+        self.rows.iter().filter(|row| row.get().is_some()).count()
+    }
+
+    fn bfs_row(&self, source: usize) -> Box<[f64]> {
+        let mut row = vec![f64::NAN; self.rows.len()];
+        let mut queue = VecDeque::new();
+        row[source] = 0.0;
+        queue.push_back(PhysicalQubit::new(source as u32));
+        while let Some(qubit) = queue.pop_front() {
+            let next = row[qubit.index()] + 1.0;
+            for neighbor in self.neighbors[qubit].iter() {
+                if row[neighbor.index()].is_nan() {
+                    row[neighbor.index()] = next;
+                    queue.push_back(*neighbor);
+                }
+            }
+        }
+        row.into_boxed_slice()
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn lazy_matches_dense() {
+        // A line of 5 qubits, with a disconnected qubit at the end.
+        let lift = |idx: Vec<u32>| idx.into_iter().map(PhysicalQubit).collect::<Vec<_>>();
+        let neighbors = Neighbors::from_parts(
+            lift(vec![1, 0, 2, 1, 3, 2, 4, 3]),
+            vec![0, 1, 3, 5, 7, 8, 8],
+        )
+        .unwrap();
+        let dense = distance_matrix(&neighbors, usize::MAX, false, f64::NAN);
+        let lazy = LazyDistances::new(neighbors);
+        assert_eq!(lazy.num_calculated_rows(), 0);
+        for a in 0..6 {
+            for b in 0..6 {
+                let expected = dense[[a, b]];
+                let actual = *lazy.get(a, b);
+                assert!(expected == actual || (expected.is_nan() && actual.is_nan()));
+            }
+        }
+        assert_eq!(lazy.num_calculated_rows(), 6);
+
+        let lazy = DistanceOracle::Lazy(LazyDistances::new(lazy.neighbors.clone()));
+        assert_eq!(lazy[[0, 4]], 4.0);
+        assert_eq!(lazy[[4, 0]], 4.0);
+        // The second lookup reuses the row of qubit 0 calculated by the first.
+        let DistanceOracle::Lazy(inner) = &lazy else {
+            unreachable!()
+        };
+        assert_eq!(inner.num_calculated_rows(), 1);
+    }
+}
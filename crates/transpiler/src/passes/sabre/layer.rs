@@ -11,9 +11,9 @@
 // that they have been altered from the originals.
 
 use indexmap::IndexMap;
-use ndarray::prelude::*;
 use rustworkx_core::petgraph::prelude::*;
 
+use super::distance::DistanceOracle;
 use qiskit_circuit::PhysicalQubit;
 
 /// A container for the current non-routable parts of the front layer.  This only ever holds
@@ -86,7 +86,7 @@ impl FrontLayer {
 
     /// Calculate the score _difference_ caused by this swap, compared to not making the swap.
     #[inline(always)]
-    pub fn score(&self, swap: [PhysicalQubit; 2], dist: &ArrayView2<f64>) -> f64 {
+    pub fn score(&self, swap: [PhysicalQubit; 2], dist: &DistanceOracle) -> f64 {
         // At most there can be two affected gates in the front layer (one on each qubit in the
         // swap), since any gate whose closest path passes through the swapped qubit link has its
         // "virtual-qubit path" order changed, but not the total weight.  In theory, we should
@@ -105,7 +105,7 @@ impl FrontLayer {
     }
 
     /// Calculate the total absolute of the current front layer on the given layer.
-    pub fn total_score(&self, dist: &ArrayView2<f64>) -> f64 {
+    pub fn total_score(&self, dist: &DistanceOracle) -> f64 {
         self.iter()
             .map(|(_, &[a, b])| dist[[a.index(), b.index()]])
             .sum::<f64>()
@@ -183,7 +183,7 @@ impl ExtendedSet {
 
     /// Calculate the score of applying the given swap, relative to not applying it.
     #[inline(always)]
-    pub fn score(&self, swap: [PhysicalQubit; 2], dist: &ArrayView2<f64>) -> f64 {
+    pub fn score(&self, swap: [PhysicalQubit; 2], dist: &DistanceOracle) -> f64 {
         let [a, b] = swap;
         let mut total = 0.0;
         for other in self.qubits[a.index()].iter() {
@@ -204,7 +204,7 @@ impl ExtendedSet {
     }
 
     /// Calculate the total absolute score of this set of nodes over the given layout.
-    pub fn total_score(&self, dist: &ArrayView2<f64>) -> f64 {
+    pub fn total_score(&self, dist: &DistanceOracle) -> f64 {
         // Factor of two is to remove double-counting of each gate.
         self.qubits
             .iter()
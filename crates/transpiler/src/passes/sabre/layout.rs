@@ -10,11 +10,13 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+use std::time::{Duration, Instant};
+
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 
 use hashbrown::HashSet;
-use ndarray::aview2;
+use ndarray::{Array2, aview2};
 use rand::prelude::*;
 use rand_pcg::Pcg64Mcg;
 use rayon_cond::CondIterator;
@@ -33,12 +35,13 @@ use crate::passes::{
 use crate::target::{Target, TargetCouplingError};
 
 use super::dag::SabreDAG;
+use super::distance::DistanceOracle;
 use super::heuristic::Heuristic;
 use super::route::{RoutingProblem, RoutingResult, RoutingTarget, swap_map, swap_map_trial};
 
 #[allow(clippy::too_many_arguments)]
 #[pyfunction]
-#[pyo3(signature = (dag, target, heuristic, max_iterations, num_swap_trials, num_random_trials, seed=None, partial_layouts=vec![], skip_routing=false))]
+#[pyo3(signature = (dag, target, heuristic, max_iterations, num_swap_trials, num_random_trials, seed=None, partial_layouts=vec![], skip_routing=false, time_limit=None))]
 pub fn sabre_layout_and_routing(
     dag: &mut DAGCircuit,
     target: &Target,
@@ -49,6 +52,7 @@ pub fn sabre_layout_and_routing(
     seed: Option<u64>,
     partial_layouts: Vec<Vec<Option<PhysicalQubit>>>,
     skip_routing: bool,
+    time_limit: Option<f64>,
 ) -> PyResult<(DAGCircuit, NLayout, NLayout)> {
     let Some(num_physical_qubits) = target.num_qubits else {
         return Err(TranspilerError::new_err(
@@ -65,6 +69,23 @@ pub fn sabre_layout_and_routing(
             "partial layouts contained out-of-range physical qubits",
         ));
     }
+    let deadline = match time_limit {
+        Some(time_limit) => {
+            let budget = Duration::try_from_secs_f64(time_limit)
+                .map_err(|_| PyValueError::new_err(format!("invalid time limit: {time_limit}")))?;
+            Some(Instant::now() + budget)
+        }
+        None => None,
+    };
+    // Each random layout trial checks the deadline just before it starts, so the trials stop as
+    // soon as the time limit is reached, whether they are run in parallel or not.  The first
+    // random trial and the trials from the partial and heuristic layouts always run, so there is
+    // always a result.
+    let should_run = |index: usize| {
+        index == 0
+            || index >= num_random_trials
+            || deadline.is_none_or(|deadline| Instant::now() < deadline)
+    };
     let allow_parallel = getenv_use_multiple_threads();
     let coupling = match target.coupling_graph() {
         Ok(coupling) => coupling,
@@ -152,6 +173,7 @@ pub fn sabre_layout_and_routing(
                 allow_parallel && num_layout_trials > 1,
             )
             .enumerate()
+            .filter(|(index, _)| should_run(*index))
             .map(|(index, seed)| {
                 (
                     index,
@@ -258,6 +280,7 @@ pub fn sabre_layout_and_routing(
                     allow_parallel && num_layout_trials > 1,
                 )
                 .enumerate()
+                .filter(|(index, _)| should_run(*index))
                 .map(|(index, seed)| {
                     (
                         index,
@@ -416,10 +439,10 @@ fn layout_trial<'a>(
 
 fn compute_dense_starting_layout(
     num_qubits: usize,
-    target: &RoutingTarget,
+    distance: &Array2<f64>,
     run_in_parallel: bool,
 ) -> Vec<Option<PhysicalQubit>> {
-    let mut adj_matrix = target.distance.to_owned();
+    let mut adj_matrix = distance.to_owned();
     if run_in_parallel {
         adj_matrix.par_mapv_inplace(|x| if x == 1. { 1. } else { 0. });
     } else {
@@ -448,12 +471,15 @@ fn add_heuristic_layouts(
 ) {
     let lift = |i| Some(PhysicalQubit::new(i));
     let num_physical_qubits = problem.target.neighbors.num_qubits();
-    // Run a dense layout trial
-    starting_layouts.push(compute_dense_starting_layout(
-        problem.dag.num_qubits(),
-        problem.target,
-        run_in_parallel,
-    ));
+    // Run a dense layout trial.  This needs the dense adjacency matrix, so it's skipped for
+    // targets too large to have a dense distance matrix.
+    if let DistanceOracle::Dense(distance) = &problem.target.distance {
+        starting_layouts.push(compute_dense_starting_layout(
+            problem.dag.num_qubits(),
+            distance,
+            run_in_parallel,
+        ));
+    }
     starting_layouts.push((0..num_physical_qubits as u32).map(lift).collect());
     starting_layouts.push((0..num_physical_qubits as u32).rev().map(lift).collect());
     // This layout targets the largest ring on an IBM eagle device. It has been
@@ -11,6 +11,7 @@
 // that they have been altered from the originals.
 
 mod dag;
+mod distance;
 pub mod heuristic;
 mod layer;
 mod layout;
@@ -23,18 +23,18 @@ use pyo3::types::PyDict;
 
 use hashbrown::HashSet;
 use indexmap::IndexMap;
-use ndarray::Array2;
 use rand::prelude::*;
 use rand_pcg::Pcg64Mcg;
 use rayon_cond::CondIterator;
 use rustworkx_core::dictmap::*;
 use rustworkx_core::petgraph::prelude::*;
 use rustworkx_core::petgraph::visit::{EdgeCount, EdgeRef};
-use rustworkx_core::shortest_path::{dijkstra, distance_matrix};
+use rustworkx_core::shortest_path::dijkstra;
 use rustworkx_core::token_swapper::token_swapper;
 use smallvec::{SmallVec, smallvec};
 
 use super::dag::{InteractionKind, SabreDAG};
+use super::distance::DistanceOracle;
 use super::heuristic::{BasicHeuristic, DecayHeuristic, Heuristic, LookaheadHeuristic, SetScaling};
 use super::layer::{ExtendedSet, FrontLayer};
 use crate::TranspilerError;
@@ -277,12 +277,12 @@ impl RoutingResult<'_> {
 #[derive(Clone, Debug)]
 pub struct RoutingTarget {
     pub neighbors: Neighbors,
-    pub distance: Array2<f64>,
+    pub distance: DistanceOracle,
 }
 impl RoutingTarget {
     pub fn from_neighbors(neighbors: Neighbors) -> Self {
         Self {
-            distance: distance_matrix(&neighbors, usize::MAX, false, f64::NAN),
+            distance: DistanceOracle::from_neighbors(&neighbors),
             neighbors,
         }
     }
@@ -363,7 +363,9 @@ impl PyRoutingTarget {
     }
 
     fn distance_matrix<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyArray2<f64>>> {
-        self.0.as_ref().map(|target| target.distance.to_pyarray(py))
+        self.0
+            .as_ref()
+            .map(|target| target.distance.to_dense().to_pyarray(py))
     }
 }
 
@@ -698,7 +700,7 @@ impl<'a> RoutingState<'a> {
             }
         }
 
-        let dist = &self.target.distance.view();
+        let dist = &self.target.distance;
         let mut absolute_score = 0.0;
 
         if let Some(BasicHeuristic { weight, scale }) = self.heuristic.basic {
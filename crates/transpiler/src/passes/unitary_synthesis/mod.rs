@@ -13,7 +13,7 @@
 mod decomposers;
 
 use hashbrown::HashSet;
-use indexmap::IndexSet;
+use indexmap::{IndexMap, IndexSet};
 use nalgebra::{DMatrix, Matrix2};
 use ndarray::prelude::*;
 use num_complex::Complex64;
@@ -159,16 +159,113 @@ impl Default for UnitarySynthesisConfig {
 pub struct UnitarySynthesisState {
     config: UnitarySynthesisConfig,
     cache: DecomposerCache,
+    synthesis_2q_cache: Synthesis2qCache,
 }
 impl UnitarySynthesisState {
     pub fn new(config: UnitarySynthesisConfig) -> Self {
         Self {
             config,
             cache: Default::default(),
+            synthesis_2q_cache: Default::default(),
         }
     }
 }
 
+/// The maximum number of two-qubit synthesis results retained by a [Synthesis2qCache].
+const SYNTHESIS_2Q_CACHE_SIZE: usize = 1024;
+
+/// The grid that the matrix entries are rounded to in the key of a [Synthesis2qCache].
+const SYNTHESIS_2Q_CACHE_RESOLUTION: f64 = 1e-10;
+
+/// The largest difference in any matrix entry for which a [Synthesis2qCache] reuses a sequence.
+const SYNTHESIS_2Q_CACHE_ATOL: f64 = 1e-10;
+
+/// Key of a [Synthesis2qCache]: the physical qubits and the matrix entries, rounded to multiples
+/// of [SYNTHESIS_2Q_CACHE_RESOLUTION].
+type Synthesis2qKey = ([PhysicalQubit; 2], [i64; 32]);
+
+/// An entry of a [Synthesis2qCache].
+#[derive(Clone, Debug)]
+struct Synthesis2qEntry {
+    /// The matrix that the sequence was synthesized for.
+    unitary: [Complex64; 16],
+    direction: Direction2q,
+    sequence: TwoQubitGateSequence,
+}
+
+/// Bounded least-recently-used cache of the chosen decomposition of two-qubit unitaries.
+///
+/// Circuits with repeated structure (e.g. the layers of a variational ansatz) produce the same
+/// consolidated 2q blocks many times over, and all the decomposers are deterministic, so we can
+/// reuse the selected sequence rather than re-running every decomposer on the link and comparing
+/// their fidelities.  The repeated blocks are often not bit-for-bit identical, because they were
+/// consolidated from different floating-point calculations, so the key rounds the matrix entries.
+/// Rounding alone could reuse a sequence for a matrix that differs by up to the resolution in
+/// every entry, or more if the key collides, so each entry stores the matrix it was synthesized
+/// for, and is only reused if the new matrix is within [SYNTHESIS_2Q_CACHE_ATOL] of it.
+///
+/// Like the [DecomposerCache], this assumes that the hardware constraint doesn't change for the
+/// lifetime of the state, so only the physical qubits are part of the key.
+#[derive(Clone, Debug, Default)]
+struct Synthesis2qCache(IndexMap<Synthesis2qKey, Synthesis2qEntry, ::ahash::RandomState>);
+impl Synthesis2qCache {
+    fn key(unitary: ArrayView2<Complex64>, qargs_phys: [PhysicalQubit; 2]) -> Synthesis2qKey {
+        let mut grid = [0; 32];
+        for (i, value) in unitary.iter().enumerate() {
+            grid[2 * i] = (value.re / SYNTHESIS_2Q_CACHE_RESOLUTION).round() as i64;
+            grid[2 * i + 1] = (value.im / SYNTHESIS_2Q_CACHE_RESOLUTION).round() as i64;
+        }
+        (qargs_phys, grid)
+    }
+
+    /// Get a previously stored sequence for a matrix close enough to `unitary`, marking it as the
+    /// most recently used.
+    fn get(
+        &mut self,
+        key: &Synthesis2qKey,
+        unitary: ArrayView2<Complex64>,
+    ) -> Option<(Direction2q, TwoQubitGateSequence)> {
+        let index = self.0.get_index_of(key)?;
+        let (_, entry) = self.0.get_index(index)?;
+        if !entry
+            .unitary
+            .iter()
+            .zip(unitary.iter())
+            .all(|(cached, new)| (cached - new).norm() <= SYNTHESIS_2Q_CACHE_ATOL)
+        {
+            return None;
+        }
+        let last = self.0.len() - 1;
+        self.0.move_index(index, last);
+        self.0
+            .get_index(last)
+            .map(|(_, entry)| (entry.direction, entry.sequence.clone()))
+    }
+
+    /// Store a sequence, evicting the least recently used one if the cache is full.  An entry
+    /// with the same key is replaced.
+    fn insert(
+        &mut self,
+        key: Synthesis2qKey,
+        unitary: ArrayView2<Complex64>,
+        (direction, sequence): (Direction2q, TwoQubitGateSequence),
+    ) {
+        self.0.shift_remove(&key);
+        if self.0.len() >= SYNTHESIS_2Q_CACHE_SIZE {
+            self.0.shift_remove_index(0);
+        }
+        let mut entry = Synthesis2qEntry {
+            unitary: [Complex64::default(); 16],
+            direction,
+            sequence,
+        };
+        for (stored, value) in entry.unitary.iter_mut().zip(unitary.iter()) {
+            *stored = *value;
+        }
+        self.0.insert(key, entry);
+    }
+}
+
 /// The matcher for the set of standard gates that the TwoQubitControlledUDecomposer
 /// supports
 macro_rules! PARAM_SET {
@@ -425,12 +522,84 @@ fn synthesize_1q_matrix_onto(
 
 fn synthesize_2q_matrix_onto(
     out: &mut DAGCircuitBuilder,
-    mut unitary: CowArray<Complex64, Ix2>,
+    unitary: CowArray<Complex64, Ix2>,
     qargs_phys: [PhysicalQubit; 2],
     qargs_virt: [Qubit; 2],
     state: &mut UnitarySynthesisState,
     constraint: QpuConstraint,
 ) -> PyResult<bool> {
+    let cache_key = Synthesis2qCache::key(unitary.view(), qargs_phys);
+    let (dir, sequence) = match state.synthesis_2q_cache.get(&cache_key, unitary.view()) {
+        Some(pair) => pair,
+        None => {
+            // `best_2q_sequence` takes ownership of the matrix, which it modifies.
+            let source = unitary.to_owned();
+            let Some(pair) = best_2q_sequence(unitary, qargs_phys, state, constraint)? else {
+                return Ok(false);
+            };
+            state
+                .synthesis_2q_cache
+                .insert(cache_key, source.view(), pair.clone());
+            pair
+        }
+    };
+
+    let order = dir.as_indices();
+    let out_qargs = [qargs_virt[order[0] as usize], qargs_virt[order[1] as usize]];
+    let qubit_keys = [
+        out.insert_qargs(&[out_qargs[0]]),
+        out.insert_qargs(&[out_qargs[1]]),
+        out.insert_qargs(&[out_qargs[0], out_qargs[1]]),
+        out.insert_qargs(&[out_qargs[1], out_qargs[0]]),
+    ];
+    out.add_global_phase(&Param::Float(sequence.global_phase()))?;
+    for (gate, params, qubits) in sequence.gates() {
+        let qubits = match qubits.as_slice() {
+            [0] => qubit_keys[0],
+            [1] => qubit_keys[1],
+            [0, 1] => qubit_keys[2],
+            [1, 0] => qubit_keys[3],
+            _ => panic!("internal logic error: decomposed sequence contained unexpected qargs"),
+        };
+        let op = match gate.view() {
+            OperationRef::StandardGate(gate) => PackedOperation::from(gate),
+            OperationRef::Gate(py_gate) => Python::attach(|py| -> PyResult<_> {
+                let gate = py_gate.py_copy(py)?;
+                gate.instruction
+                    .setattr(py, intern!(py, "params"), params)?;
+                Ok(PackedOperation::from(Box::new(PyOperationTypes::Gate(
+                    gate,
+                ))))
+            })?,
+            _ => panic!("internal logic error: decomposed sequence contains a non-gate"),
+        };
+        let params = (!params.is_empty()).then(|| {
+            Box::new(Parameters::Params(
+                params.iter().copied().map(Param::Float).collect(),
+            ))
+        });
+        out.push_back(PackedInstruction {
+            op,
+            qubits,
+            clbits: Default::default(),
+            params,
+            label: None,
+            #[cfg(feature = "cache_pygates")]
+            py_op: OnceLock::new(),
+        })?;
+    }
+    Ok(true)
+}
+
+/// Run every 2q decomposer available on the link, and choose the sequence with the best fidelity.
+///
+/// Returns `None` if no decomposer could synthesize the matrix.
+fn best_2q_sequence(
+    mut unitary: CowArray<Complex64, Ix2>,
+    qargs_phys: [PhysicalQubit; 2],
+    state: &mut UnitarySynthesisState,
+    constraint: QpuConstraint,
+) -> PyResult<Option<(Direction2q, TwoQubitGateSequence)>> {
     let decomposer_cache = &mut state.cache;
     let config = &state.config;
 
@@ -483,7 +652,7 @@ fn synthesize_2q_matrix_onto(
         // inconsistent; either it should be an error in _all_ circumstances if synthesis fails or
         // in _none_.  It's tricky to recreate the pre-Qiskit-2.4 behaviour bug-for-bug in the new
         // refactor because of how the split between decomposer construction and use works now.
-        return Ok(false);
+        return Ok(None);
     };
 
     let fidelity = |pair: &(Direction2q, TwoQubitGateSequence)| -> f64 {
@@ -525,53 +694,7 @@ fn synthesize_2q_matrix_onto(
         }
     }
 
-    // ... now apply the best sequence.
-    let (dir, sequence) = best_pair;
-    let order = dir.as_indices();
-    let out_qargs = [qargs_virt[order[0] as usize], qargs_virt[order[1] as usize]];
-    let qubit_keys = [
-        out.insert_qargs(&[out_qargs[0]]),
-        out.insert_qargs(&[out_qargs[1]]),
-        out.insert_qargs(&[out_qargs[0], out_qargs[1]]),
-        out.insert_qargs(&[out_qargs[1], out_qargs[0]]),
-    ];
-    out.add_global_phase(&Param::Float(sequence.global_phase()))?;
-    for (gate, params, qubits) in sequence.gates() {
-        let qubits = match qubits.as_slice() {
-            [0] => qubit_keys[0],
-            [1] => qubit_keys[1],
-            [0, 1] => qubit_keys[2],
-            [1, 0] => qubit_keys[3],
-            _ => panic!("internal logic error: decomposed sequence contained unexpected qargs"),
-        };
-        let op = match gate.view() {
-            OperationRef::StandardGate(gate) => PackedOperation::from(gate),
-            OperationRef::Gate(py_gate) => Python::attach(|py| -> PyResult<_> {
-                let gate = py_gate.py_copy(py)?;
-                gate.instruction
-                    .setattr(py, intern!(py, "params"), params)?;
-                Ok(PackedOperation::from(Box::new(PyOperationTypes::Gate(
-                    gate,
-                ))))
-            })?,
-            _ => panic!("internal logic error: decomposed sequence contains a non-gate"),
-        };
-        let params = (!params.is_empty()).then(|| {
-            Box::new(Parameters::Params(
-                params.iter().copied().map(Param::Float).collect(),
-            ))
-        });
-        out.push_back(PackedInstruction {
-            op,
-            qubits,
-            clbits: Default::default(),
-            params,
-            label: None,
-            #[cfg(feature = "cache_pygates")]
-            py_op: OnceLock::new(),
-        })?;
-    }
-    Ok(true)
+    Ok(Some(best_pair))
 }
 
 /// Mutate the given 2q matrix in place to be `swap @ m @ swap`, i.e. "`m`, but applied to the qubit
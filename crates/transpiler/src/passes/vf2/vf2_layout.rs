@@ -18,6 +18,7 @@ use indexmap::{IndexMap, IndexSet};
 use rand::prelude::*;
 use rand_pcg::Pcg64Mcg;
 use rayon::prelude::*;
+use rayon_cond::CondIterator;
 use rustworkx_core::petgraph::data::Create;
 use rustworkx_core::petgraph::prelude::*;
 
@@ -28,7 +29,7 @@ use qiskit_circuit::dag_circuit::DAGCircuit;
 use qiskit_circuit::interner::{Interned, Interner};
 use qiskit_circuit::operations::{ControlFlowView, Operation};
 use qiskit_circuit::packed_instruction::PackedInstruction;
-use qiskit_circuit::{PhysicalQubit, VirtualQubit, vf2};
+use qiskit_circuit::{PhysicalQubit, VirtualQubit, getenv_use_multiple_threads, vf2};
 
 use super::error_map::ErrorMap;
 use crate::target::{Qargs, QargsRef, Target, TargetOperation};
@@ -56,6 +57,13 @@ pub struct Vf2PassConfiguration {
     /// best-scoring match.  Scoring the initial layout is useful for seeding the tree-pruner
     /// component of the search, if the incoming layout is expected to already be valid.
     pub score_initial_layout: bool,
+    /// The number of shards to split the search into, by the physical qubit that the first virtual
+    /// qubit in the search order is mapped to.  With more than one shard, the shards are searched
+    /// in parallel, in epochs of a fixed number of calls.  Between epochs, the best score found by
+    /// any shard is shared with all of them, so each shard prunes the branches that cannot improve
+    /// on the best layout so far.  The result depends only on the number of shards, not on the
+    /// number of threads or their timing.  The call limits and `max_trials` apply to each shard.
+    pub root_shards: usize,
 }
 impl Vf2PassConfiguration {
     /// A set of defaults that just runs everything completely unbounded.
@@ -66,6 +74,7 @@ impl Vf2PassConfiguration {
             max_trials: Some(0),
             shuffle_seed: None,
             score_initial_layout: false,
+            root_shards: 1,
         }
     }
 
@@ -80,6 +89,7 @@ impl Vf2PassConfiguration {
             max_trials: Some(1),
             shuffle_seed: None,
             score_initial_layout: false,
+            root_shards: 1,
         }
     }
 
@@ -93,19 +103,21 @@ impl Vf2PassConfiguration {
             max_trials: Some(0),
             shuffle_seed: None,
             score_initial_layout: true,
+            root_shards: 1,
         }
     }
 }
 #[pymethods]
 impl Vf2PassConfiguration {
     #[new]
-    #[pyo3(signature = (*, call_limit=(None, None), time_limit=None, max_trials=None, shuffle_seed=None, score_initial_layout=false))]
+    #[pyo3(signature = (*, call_limit=(None, None), time_limit=None, max_trials=None, shuffle_seed=None, score_initial_layout=false, root_shards=1))]
     fn py_new(
         call_limit: (Option<usize>, Option<usize>),
         time_limit: Option<f64>,
         max_trials: Option<usize>,
         shuffle_seed: Option<u64>,
         score_initial_layout: bool,
+        root_shards: usize,
     ) -> Self {
         Self {
             call_limit,
@@ -113,18 +125,20 @@ impl Vf2PassConfiguration {
             max_trials,
             shuffle_seed,
             score_initial_layout,
+            root_shards,
         }
     }
 
     /// Construct the VF2 configuration from the legacy interface to the Python passes.
     #[staticmethod]
-    #[pyo3(signature = (*, call_limit=None, time_limit=None, max_trials=None, shuffle_seed=None, score_initial_layout=false))]
+    #[pyo3(signature = (*, call_limit=None, time_limit=None, max_trials=None, shuffle_seed=None, score_initial_layout=false, root_shards=1))]
     fn from_legacy_api(
         call_limit: Option<Bound<PyAny>>,
         time_limit: Option<f64>,
         max_trials: Option<isize>,
         shuffle_seed: Option<i64>,
         score_initial_layout: bool,
+        root_shards: usize,
     ) -> PyResult<Self> {
         let call_limit = match call_limit {
             Some(call_limit) => {
@@ -158,6 +172,7 @@ impl Vf2PassConfiguration {
             max_trials,
             shuffle_seed,
             score_initial_layout,
+            root_shards,
         })
     }
 }
@@ -641,6 +656,10 @@ where
     HO: vf2::NodeSorter<H>,
     NS: vf2::Semantics<N::NodeWeight, H::NodeWeight, Error = Infallible>,
     ES: vf2::Semantics<N::EdgeWeight, H::EdgeWeight, Score = NS::Score, Error = Infallible>,
+    vf2::Vf2IntoIter<NG, HG, N::NodeId, H::NodeId, NS, ES>: Clone + Send,
+    N::NodeId: Send,
+    H::NodeId: Send,
+    NS::Score: Send,
 {
     let start_time = Instant::now();
     let mut times_up = false;
@@ -649,6 +668,9 @@ where
         .max_trials
         .unwrap_or_else(|| 15 + vf2.needle().edge_count().max(vf2.haystack().edge_count()));
     let time_limit = config.time_limit.unwrap_or(f64::INFINITY);
+    if config.root_shards > 1 {
+        return minimize_vf2_sharded(vf2.into_iter(), config, max_trials);
+    }
     let mut can_continue = || {
         if times_up {
             return false;
@@ -672,6 +694,101 @@ where
     Some(mapping)
 }
 
+/// The number of times each shard of a sharded VF2 search may extend its partial mapping between
+/// two synchronisations of the best score.
+const SHARD_EPOCH_CALLS: usize = 1 << 14;
+
+/// The sharded form of [minimize_vf2], which splits the search between
+/// [Vf2PassConfiguration::root_shards] shards by the partner of the first needle node.
+///
+/// The shards run in parallel in epochs of [SHARD_EPOCH_CALLS] calls.  Within an epoch, each shard
+/// only prunes against the best score it has found itself; at the end of each epoch, every shard's
+/// bound is tightened to the best score of all the shards.  Since nothing is shared during an
+/// epoch, the result does not depend on how the shards are scheduled onto threads.
+fn minimize_vf2_sharded<N, H, NId, HId, NS, ES>(
+    vf2: vf2::Vf2IntoIter<N, H, NId, HId, NS, ES>,
+    config: &Vf2PassConfiguration,
+    max_trials: usize,
+) -> Option<IndexMap<NId, HId, ::ahash::RandomState>>
+where
+    N: for<'a> vf2::alias::Vf2Graph<'a>,
+    H: for<'a> vf2::alias::Vf2Graph<'a, EdgeType = N::EdgeType>,
+    NId: std::hash::Hash + Eq + Copy + Send,
+    HId: Copy + Send,
+    NS: vf2::Semantics<N::NodeWeight, H::NodeWeight, Error = Infallible>,
+    ES: vf2::Semantics<N::EdgeWeight, H::EdgeWeight, Score = NS::Score, Error = Infallible>,
+    vf2::Vf2IntoIter<N, H, NId, HId, NS, ES>: Clone + Send,
+    NS::Score: Send,
+{
+    use vf2::Vf2Score;
+
+    struct Shard<I, M, S> {
+        iter: I,
+        best: Option<(M, S)>,
+        trials: usize,
+        done: bool,
+    }
+
+    let start_time = Instant::now();
+    let time_limit = config.time_limit.unwrap_or(f64::INFINITY);
+    let num_shards = config.root_shards;
+    let mut shards = (0..num_shards)
+        .map(|shard| Shard {
+            iter: vf2.clone().with_root_shard(shard, num_shards),
+            best: None,
+            trials: 0,
+            done: false,
+        })
+        .collect::<Vec<_>>();
+    let run_in_parallel = getenv_use_multiple_threads();
+    let mut epoch_end = 0;
+    loop {
+        epoch_end += SHARD_EPOCH_CALLS;
+        CondIterator::new(&mut shards, run_in_parallel).for_each(|shard| {
+            while !shard.done {
+                let limit = if shard.best.is_some() {
+                    config.call_limit.1
+                } else {
+                    config.call_limit.0
+                };
+                shard.iter.call_limit = Some(limit.map_or(epoch_end, |l| l.min(epoch_end)));
+                let Some(result) = shard.iter.next() else {
+                    // The shard either searched its whole tree, or used up its calls for
+                    // this epoch, or for the whole search.
+                    shard.done = shard.iter.is_exhausted() || limit.is_some_and(|l| l <= epoch_end);
+                    break;
+                };
+                shard.best = Some(result.expect("error is infallible"));
+                shard.trials += 1;
+                shard.done = max_trials != 0 && shard.trials >= max_trials;
+            }
+        });
+        // `min_by` returns the first of several equal minima, so ties go to the lowest shard.
+        let best = shards
+            .iter()
+            .filter_map(|shard| shard.best.as_ref().map(|(_, score)| score))
+            .min_by(|left, right| NS::Score::cmp(left, right))
+            .cloned();
+        if let Some(best) = best.as_ref() {
+            for shard in shards.iter_mut() {
+                shard.iter.tighten_bound(best);
+            }
+        }
+        let trials = shards.iter().map(|shard| shard.trials).sum::<usize>();
+        if shards.iter().all(|shard| shard.done)
+            || (max_trials != 0 && trials >= max_trials)
+            || start_time.elapsed().as_secs_f64() >= time_limit
+        {
+            break;
+        }
+    }
+    shards
+        .into_iter()
+        .filter_map(|shard| shard.best)
+        .min_by(|(_, left), (_, right)| NS::Score::cmp(left, right))
+        .map(|(mapping, _)| mapping)
+}
+
 /// Produce an initial score for the identity mapping of the interaction graph onto the coupling
 /// graph.
 ///
@@ -873,8 +990,19 @@ pub fn vf2_layout_pass_exact(
     Ok(Vf2PassReturn::Solution(mapping))
 }
 
+/// Build the average error map that :func:`vf2_layout_pass_average` uses for a target if it is not
+/// given one, or ``None`` if the target has a global 2q operation.
+///
+/// This lets Python space cache the error map on the :class:`.Target` between calls.
+#[pyfunction]
+#[pyo3(name = "build_average_error_map")]
+pub fn py_build_average_error_map(target: &Target) -> Option<ErrorMap> {
+    build_average_error_map(target)
+}
+
 pub fn vf2_layout_mod(m: &Bound<PyModule>) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(vf2_layout_pass_average))?;
+    m.add_wrapped(wrap_pyfunction!(py_build_average_error_map))?;
     m.add_wrapped(wrap_pyfunction!(vf2_layout_pass_exact))?;
     m.add("MultiQEncountered", m.py().get_type::<MultiQEncountered>())?;
     m.add(
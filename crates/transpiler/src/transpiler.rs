@@ -127,6 +127,7 @@ pub fn layout_stage(
             max_trials: None,
             shuffle_seed: None,
             score_initial_layout: false,
+            root_shards: 1,
         },
         OptimizationLevel::Level3 => vf2::Vf2PassConfiguration {
             call_limit: (Some(30_000_000), Some(100_000)),
@@ -134,6 +135,7 @@ pub fn layout_stage(
             max_trials: None,
             shuffle_seed: None,
             score_initial_layout: false,
+            root_shards: 1,
         },
     };
 
@@ -167,6 +169,7 @@ pub fn layout_stage(
                 seed,
                 Vec::new(),
                 false,
+                None,
             )?;
             *dag = result;
             *transpile_layout =
@@ -190,6 +193,7 @@ pub fn layout_stage(
                 seed,
                 Vec::new(),
                 false,
+                None,
             )?;
             *dag = result;
             *transpile_layout =
@@ -212,6 +216,7 @@ pub fn layout_stage(
             seed,
             Vec::new(),
             false,
+            None,
         )?;
         *dag = result;
         *transpile_layout =
@@ -20,6 +20,7 @@ import warnings
 import collections.abc
 import copy as _copy
 
+import functools
 import itertools
 import multiprocessing
 import typing
@@ -448,6 +449,7 @@ class QuantumCircuit:
     :meth:`assign_parameters`.
 
     .. automethod:: assign_parameters
+    .. automethod:: assign_parameters_batch
 
     The circuit tracks parameters by :class:`.Parameter` instances themselves, and forbids having
     multiple parameters of the same name to avoid some problems when interoperating with OpenQASM or
@@ -574,6 +576,13 @@ class QuantumCircuit:
 
     .. automethod:: _append
 
+    If you are building a large circuit made only of standard gates acting on qubits, you can
+    instead describe all of it with arrays of gates, qubit indices and numeric parameters and add
+    the whole lot with a single call to :meth:`append_standard_gates`.  This avoids creating any
+    Python-space objects for the individual instructions.
+
+    .. automethod:: append_standard_gates
+
     In other cases, you may want to join two circuits together, applying the instructions from one
     circuit onto specified qubits and clbits on another circuit.  This "inlining" operation is
     called :meth:`compose` in Qiskit.  :meth:`compose` is, in general, more powerful than
@@ -957,6 +966,7 @@ class QuantumCircuit:
     .. automethod:: num_tensor_factors
     .. automethod:: num_unitary_factors
     .. automethod:: size
+    .. automethod:: structural_hash
     .. automethod:: width
 
     Accessing scheduling information
@@ -2820,6 +2830,98 @@ class QuantumCircuit:
             instructions._add_ref(circuit_scope.instructions, len(circuit_scope.instructions) - 1)
         return instructions
 
+    def append_standard_gates(
+        self,
+        gates: np.ndarray | Sequence[StandardGate | str | int],
+        qubits: np.ndarray | Sequence[Sequence[int]] | None = None,
+        params: np.ndarray | Sequence[Sequence[float]] | None = None,
+    ) -> None:
+        """Append many standard-library gates to the circuit in a single call.
+
+        The instructions are described column-wise: ``gates[i]`` is the gate of instruction ``i``,
+        row ``qubits[i]`` contains the integer indices of the qubits it acts on, and row
+        ``params[i]`` contains its numeric parameters.  Each gate only reads as many columns as it
+        needs, so instructions of different sizes can be mixed in one call by padding the rows to
+        a common width.  The whole batch is appended in one call into Qiskit's native code,
+        without constructing any :class:`.CircuitInstruction` or :class:`~.circuit.Gate` objects.
+
+        Instead of separate arrays, ``gates`` can also be a NumPy structured array with the fields
+        ``"gate"``, ``"qubits"`` and (optionally) ``"params"``, in which case ``qubits`` and
+        ``params`` must not be given.
+
+        Unlike :meth:`append`, this does not broadcast arguments and only accepts qubit indices,
+        not :class:`.Qubit` instances, and floating-point parameters, not symbolic ones.  It cannot
+        be used inside a control-flow builder block.
+
+        Args:
+            gates: the gate of each instruction, given either as the name of a standard gate (such
+                as ``"cx"``), a ``StandardGate`` value, or its integer value.
+            qubits: a two-dimensional array of qubit indices, with one row per instruction.
+            params: a two-dimensional array of parameter values, with one row per instruction.
+                This can be omitted if none of the gates take parameters.
+
+        Raises:
+            CircuitError: if any qubit index is not an integer, is out of range or is repeated
+                within a row, if an integer gate identifier is not a standard gate, if a row does
+                not have enough qubits or parameters for its gate, or if the circuit is currently
+                inside a control-flow builder block.
+            ValueError: if the array shapes do not match, or a gate name is not valid.
+
+        Examples:
+
+            Build a layer of Hadamards, followed by a layer of parametrized two-qubit rotations.
+
+            .. plot::
+                :include-source:
+                :nofigs:
+
+                import numpy as np
+                from qiskit.circuit import QuantumCircuit
+
+                num_qubits = 6
+                gates = ["h"] * num_qubits + ["rzz"] * (num_qubits - 1)
+                qubits = [[q, 0] for q in range(num_qubits)]
+                qubits += [[q, q + 1] for q in range(num_qubits - 1)]
+                params = np.zeros((len(gates), 1))
+                params[num_qubits:, 0] = np.linspace(0, np.pi, num_qubits - 1)
+
+                qc = QuantumCircuit(num_qubits)
+                qc.append_standard_gates(gates, qubits, params)
+        """
+        if self._control_flow_scopes:
+            raise CircuitError(
+                "Cannot bulk-append standard gates inside a control-flow builder block."
+            )
+        if isinstance(gates, np.ndarray) and gates.dtype.names is not None:
+            if qubits is not None or params is not None:
+                raise ValueError(
+                    "'qubits' and 'params' cannot be given separately with a structured array."
+                )
+            names = gates.dtype.names
+            qubits = gates["qubits"]
+            params = gates["params"] if "params" in names else None
+            gates = gates["gate"]
+        elif qubits is None:
+            raise ValueError("'qubits' must be given unless 'gates' is a structured array.")
+        if not isinstance(gates, np.ndarray) or gates.dtype.kind in "OSU":
+            gates = [_standard_gate_id(gate) for gate in gates]
+        gates = _checked_index_array(gates, np.uint8, "standard gate id")
+        qubits = np.asarray(qubits)
+        if qubits.ndim == 1:
+            qubits = qubits[:, np.newaxis]
+        qubits = _checked_index_array(qubits, np.uint32, "qubit index")
+        if params is not None:
+            params = np.asarray(params, dtype=np.float64)
+            if params.ndim == 1:
+                params = params[:, np.newaxis]
+            params = np.ascontiguousarray(params)
+        if gates.ndim != 1 or qubits.ndim != 2 or (params is not None and params.ndim != 2):
+            raise ValueError(
+                "Expected a one-dimensional array of gates, and two-dimensional arrays of qubits "
+                "and parameters."
+            )
+        self._data.extend_standard_gates(gates, qubits, params)
+
     def append(
         self,
         instruction: Operation | CircuitInstruction,
@@ -4035,6 +4137,65 @@ class QuantumCircuit:
             measure_arrows=measure_arrows,
         )
 
+    def structural_hash(self, *, ignore_global_phase: bool = False, canonical: bool = False) -> int:
+        """Get a hash of the structure of the circuit.
+
+        The hash covers the number of qubits and clbits, the global phase, and the operation,
+        qubit and clbit indices, and parameters of each instruction.  Unassigned parameters are
+        hashed by their symbolic expression, and control-flow blocks are hashed recursively.  It
+        is computed in a single pass of Qiskit's native code, and cached until the circuit is next
+        modified, so it is a cheap way to bucket circuits before comparing them with ``==``.
+
+        Circuits with exactly the same structure have the same hash, but an equal hash is only a
+        necessary condition for equality, not a sufficient one, so circuits with the same hash
+        should still be compared with ``==`` if an exact answer is needed.  Operations defined in
+        Python are hashed by their type, name, number of qubits and clbits, and parameters, not by
+        their definitions.  Numeric parameters are hashed by their exact values, whereas ``==``
+        allows a small tolerance, so circuits whose parameters differ only by rounding errors can
+        compare equal but hash differently.  Instruction labels, bit and register objects, and
+        circuit metadata are not part of the hash.
+
+        The hash is deterministic between processes that use the same version of Qiskit, but is
+        not stable across versions.
+
+        .. note::
+
+            The cache is invalidated by all the methods of :class:`QuantumCircuit`, but not by
+            modifying an instruction's :class:`~.circuit.Instruction` object in place.
+
+        Args:
+            ignore_global_phase: if ``True``, circuits that differ only in their global phase have
+                the same hash.
+            canonical: if ``True``, the hash only depends on the dependency graph of the circuit,
+                so it does not change if instructions that act on disjoint bits are reordered.
+                This is the same as :meth:`.DAGCircuit.structural_hash` of the converted circuit.
+
+        Returns:
+            int: the structural hash, as an unsigned 64-bit integer.
+
+        Examples:
+
+            .. plot::
+                :include-source:
+                :nofigs:
+
+                from qiskit.circuit import QuantumCircuit
+
+                a = QuantumCircuit(2)
+                a.h(0)
+                a.x(1)
+
+                b = QuantumCircuit(2)
+                b.x(1)
+                b.h(0)
+
+                assert a.structural_hash() != b.structural_hash()
+                assert a.structural_hash(canonical=True) == b.structural_hash(canonical=True)
+        """
+        return self._data.structural_hash(
+            ignore_global_phase=ignore_global_phase, canonical=canonical
+        )
+
     def size(
         self,
         filter_function: Callable[..., int] = lambda x: not getattr(
@@ -5039,6 +5200,61 @@ class QuantumCircuit:
 
         return None if inplace else target
 
+    def assign_parameters_batch(
+        self, values: np.ndarray | Sequence[Sequence[float]]
+    ) -> list[QuantumCircuit]:
+        """Create many copies of the circuit, each with all of its parameters assigned.
+
+        This is equivalent to calling :meth:`assign_parameters` once for each row of ``values``,
+        but all the bindings are made in a single call into Qiskit's native code, which is much
+        faster for large parameter sweeps.
+
+        Args:
+            values: A two-dimensional array of numeric values, with one row for each circuit to
+                create, and one column for each parameter of the circuit, in the order of
+                :attr:`parameters`.
+
+        Raises:
+            ValueError: If ``values`` is not two dimensional, or the number of columns does not
+                match the number of parameters in the circuit.
+
+        Returns:
+            A list of the bound circuits, one for each row of ``values``.
+
+        Examples:
+
+            Bind a circuit to each point on a grid of values.
+
+            .. code-block:: python
+
+                import numpy as np
+                from qiskit.circuit import QuantumCircuit, Parameter
+
+                circuit = QuantumCircuit(1)
+                circuit.rx(Parameter("a"), 0)
+                circuit.rz(Parameter("b"), 0)
+
+                grid = np.linspace(0, np.pi, 100)
+                values = np.stack(np.meshgrid(grid, grid), axis=-1).reshape(-1, 2)
+                bound_circuits = circuit.assign_parameters_batch(values)
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if values.ndim != 2:
+            raise ValueError(
+                "Expected a two-dimensional array of values, "
+                f"but received {values.ndim} dimensions."
+            )
+        # Warm the cache of the sorted parameter order, so it's shared by every copy made in Rust.
+        _ = self._data.parameters
+        out = []
+        for data in self._data.assign_parameters_batch(values):
+            target = self.copy_empty_like(vars_mode="drop")
+            target._data = data
+            target._increment_instances()
+            target._name_update()
+            out.append(target)
+        return out
+
     def has_control_flow_op(self) -> bool:
         """Checks whether the circuit has an instance of :class:`.ControlFlowOp`
         present amongst its operations."""
@@ -7790,3 +8006,34 @@ def _copy_metadata(original, cpy):
     cpy._builder_api = _OuterCircuitScopeInterface(cpy)
     cpy._ancillas = original._ancillas.copy()
     cpy._metadata = _copy.deepcopy(original._metadata)
+
+
+@functools.cache
+def _standard_gates_by_name() -> dict[str, StandardGate]:
+    return {gate.name: gate for gate in StandardGate.all_gates()}
+
+
+def _checked_index_array(values, dtype, description: str) -> np.ndarray:
+    """Convert integer identifiers to a contiguous array of the unsigned ``dtype``, raising a
+    :class:`.CircuitError` rather than truncating any that are not integers or do not fit."""
+    values = np.asarray(values)
+    # An empty list becomes a float array, so only non-empty arrays are checked.
+    if values.size:
+        if values.dtype.kind not in "iu":
+            raise CircuitError(f"Each {description} must be an integer, not '{values.dtype}'.")
+        limits = np.iinfo(dtype)
+        if (low := values.min()) < limits.min:
+            raise CircuitError(f"Invalid {description} {low}.")
+        if (high := values.max()) > limits.max:
+            raise CircuitError(f"Invalid {description} {high}.")
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+def _standard_gate_id(gate: StandardGate | str | int) -> int:
+    """Get the integer identifier of a standard gate given by name, enum value or integer."""
+    if isinstance(gate, str):
+        try:
+            gate = _standard_gates_by_name()[gate]
+        except KeyError:
+            raise ValueError(f"'{gate}' is not the name of a standard gate.") from None
+    return int(gate)
@@ -22,7 +22,7 @@ from collections.abc import Iterator
 import rustworkx as rx
 
 from qiskit.circuit.commutation_library import SessionCommutationChecker as scc
-from qiskit.circuit.controlflow import condition_resources
+from qiskit.circuit.controlflow import CONTROL_FLOW_OP_NAMES, condition_resources
 from qiskit.circuit import QuantumRegister, Qubit
 from qiskit.circuit import ClassicalRegister, Clbit
 from qiskit.dagcircuit.exceptions import DAGDependencyError
@@ -118,6 +118,14 @@ class DAGDependency:
 
         self.comm_checker = scc
 
+        # Per-wire bookkeeping used to limit the nodes visited by ``_update_edges``.  Each wire maps
+        # to the ids of the nodes on it, in the order they were added; ``_wire_positions[i]`` maps
+        # the wires of node ``i`` to its position on them, and ``_wire_cuts[i]`` maps them to the
+        # last position on the wire up to which all nodes are known to be ancestors of node ``i``.
+        self._wire_nodes = {}
+        self._wire_positions = []
+        self._wire_cuts = []
+
     @property
     def global_phase(self):
         """Return the global phase of the circuit."""
@@ -422,21 +430,70 @@ class DAGDependency:
         nodes can be made adjacent by commuting them with other nodes), but the two nodes
         themselves do not commute.
 
+        Operations on disjoint wires always commute, so the commutation checker is only called for
+        previous nodes that share a wire with max_node.  Moreover, the nodes are only analyzed back
+        to the point where all the earlier nodes on the wires of max_node are known not to reach
+        it, which is tracked through the per-wire bookkeeping of ``_track_node``.  This makes the
+        construction of a DAGDependency close to linear in the number of gates for typical
+        circuits, rather than quadratic.
+
         Currently. this function is only used when creating a new DAGDependency from another
         representation of a circuit, and hence there are no removed nodes (this is why
-        iterating over all nodes is fine).
+        iterating over node indices is fine).
         """
         max_node_id = len(self._multi_graph) - 1
         max_node = self.get_node(max_node_id)
+        if len(self._wire_positions) != max_node_id:
+            self._rebuild_wire_index()
+
+        # Control-flow operations are treated as not commuting with anything, so all previous
+        # nodes have to be analyzed.
+        control_flow = max_node.op.name in CONTROL_FLOW_OP_NAMES
+        max_wires = set(self._node_wires(max_node))
+        # The last position on each wire of max_node up to which all nodes are known not to reach
+        # max_node, and the id of the first node on any of these wires not known to.
+        proven = {wire: -1 for wire in max_wires if wire in self._wire_nodes}
+
+        def lowest_unproven():
+            if control_flow:
+                return 0
+            return min(
+                (
+                    self._wire_nodes[wire][position + 1]
+                    for wire, position in proven.items()
+                    if position + 1 < len(self._wire_nodes[wire])
+                ),
+                default=max_node_id,
+            )
 
-        reachable = [True] * max_node_id
+        def mark_unreachable(node_id):
+            # None of the predecessors of a node that does not commute with max_node, or that
+            # cannot reach it, can reach max_node.
+            unreachable.update(self._multi_graph.predecessor_indices(node_id))
+            cuts = self._wire_cuts[node_id]
+            updated = False
+            for wire, cut in cuts.items():
+                if wire in proven and cut > proven[wire]:
+                    proven[wire] = cut
+                    updated = True
+            return updated
+
+        unreachable = set()
+        ancestors = set()
+        lowest = lowest_unproven()
 
         # Analyze nodes in the reverse topological order.
         # An improvement to the original algorithm is to consider only direct predecessors
         # and to avoid constructing the lists of forward and backward reachable predecessors
         # for every node when not required.
-        for prev_node_id in range(max_node_id - 1, -1, -1):
-            if reachable[prev_node_id]:
+        prev_node_id = max_node_id - 1
+        while prev_node_id >= lowest:
+            if prev_node_id in unreachable:
+                # If prev_node cannot reach max_node, then none of its predecessors can
+                # reach max_node either.
+                if mark_unreachable(prev_node_id):
+                    lowest = lowest_unproven()
+            elif control_flow or not max_wires.isdisjoint(self._wire_positions[prev_node_id]):
                 prev_node = self.get_node(prev_node_id)
 
                 if not self.comm_checker.commute(
@@ -451,16 +508,72 @@ class DAGDependency:
                     # between the two, and mark all direct predecessors of prev_node
                     # as not reaching max_node.
                     self._multi_graph.add_edge(prev_node_id, max_node_id, {"commute": False})
-
-                    predecessor_ids = self._multi_graph.predecessor_indices(prev_node_id)
-                    for predecessor_id in predecessor_ids:
-                        reachable[predecessor_id] = False
-            else:
-                # If prev_node cannot reach max_node, then none of its predecessors can
-                # reach max_node either.
-                predecessor_ids = self._multi_graph.predecessor_indices(prev_node_id)
-                for predecessor_id in predecessor_ids:
-                    reachable[predecessor_id] = False
+                    ancestors.add(prev_node_id)
+                    if mark_unreachable(prev_node_id):
+                        lowest = lowest_unproven()
+            prev_node_id -= 1
+
+        # All the nodes that cannot reach max_node are its ancestors, which tightens the cuts of
+        # max_node beyond what can be derived from its direct predecessors alone.
+        ancestors |= unreachable
+        cuts = {}
+        for wire, position in proven.items():
+            wire_nodes = self._wire_nodes[wire]
+            while position + 1 < len(wire_nodes) and wire_nodes[position + 1] in ancestors:
+                position += 1
+            cuts[wire] = position
+        self._track_node(max_node_id, cuts)
+
+    def _node_wires(self, node):
+        """Return the wires the node is considered to act on when building the graph.
+
+        Control-flow operations do not commute with any other operation, so they are placed on
+        every wire of the circuit."""
+        if node.op.name in CONTROL_FLOW_OP_NAMES:
+            return list(self.qubits) + list(self.clbits)
+        return list(node.qargs) + list(node.cargs)
+
+    def _track_node(self, node_id, known_cuts=None):
+        """Add the node, whose incoming edges must already be in the graph, to the per-wire
+        bookkeeping used by ``_update_edges``.
+
+        ``known_cuts`` optionally maps wires to positions up to which all nodes on the wire are
+        already known to be ancestors of the node."""
+        node = self.get_node(node_id)
+        predecessors = self._multi_graph.predecessor_indices(node_id)
+        positions = {}
+        cuts = {}
+        for wire in self._node_wires(node):
+            if wire in positions:
+                continue
+            wire_nodes = self._wire_nodes.setdefault(wire, [])
+            # All nodes on the wire up to the cut of an ancestor are themselves ancestors, and so
+            # is the ancestor itself if its cut reaches the position right before it.
+            on_wire = {}
+            cut = -1 if known_cuts is None else known_cuts.get(wire, -1)
+            for pred_id in predecessors:
+                pred_position = self._wire_positions[pred_id].get(wire)
+                if pred_position is None:
+                    continue
+                on_wire[pred_position] = pred_id
+                pred_cut = self._wire_cuts[pred_id][wire]
+                cut = max(cut, pred_position if pred_cut == pred_position - 1 else pred_cut)
+            while cut + 1 in on_wire:
+                cut += 1
+            positions[wire] = len(wire_nodes)
+            cuts[wire] = cut
+            wire_nodes.append(node_id)
+        self._wire_positions.append(positions)
+        self._wire_cuts.append(cuts)
+
+    def _rebuild_wire_index(self):
+        """Rebuild the per-wire bookkeeping of ``_update_edges`` for all but the last node, for
+        example for a DAGDependency that was copied or built without ``add_op_node``."""
+        self._wire_nodes = {}
+        self._wire_positions = []
+        self._wire_cuts = []
+        for node_id in range(len(self._multi_graph) - 1):
+            self._track_node(node_id)
 
     def _add_successors(self):
         """
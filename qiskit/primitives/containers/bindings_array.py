@@ -247,6 +247,19 @@ class BindingsArray(ShapedMixin):
             An object array of the same shape containing all bound circuits.
         """
         arr = np.empty(self.shape, dtype=object)
+        if self.num_parameters == circuit.num_parameters:
+            try:
+                values = self.as_array(circuit.parameters)
+            except ValueError:
+                # The names don't match, so defer to `bind` to produce the error.
+                pass
+            else:
+                circuits = circuit.assign_parameters_batch(
+                    values.reshape(self.size, self.num_parameters)
+                )
+                for idx, bound in zip(np.ndindex(self.shape), circuits):
+                    arr[idx] = bound
+                return arr
         for idx in np.ndindex(self.shape):
             arr[idx] = self.bind(circuit, idx)
         return arr
@@ -19,7 +19,7 @@ from collections.abc import Iterable
 
 import numpy as np
 
-from qiskit.quantum_info import SparsePauliOp
+from qiskit.quantum_info import SparsePauliOp, Statevector
 
 from .base import BaseEstimatorV2
 from .containers import DataBin, EstimatorPubLike, PrimitiveResult, PubResult
@@ -112,16 +112,25 @@ class StatevectorEstimator(BaseEstimatorV2):
     """
 
     def __init__(
-        self, *, default_precision: float = 0.0, seed: np.random.Generator | int | None = None
+        self,
+        *,
+        default_precision: float = 0.0,
+        seed: np.random.Generator | int | None = None,
+        dtype: type | np.dtype = np.complex128,
     ):
         """
         Args:
             default_precision: The default precision for the estimator if not specified during run.
             seed: The seed or Generator object for random number generation.
                 If None, a random seeded default RNG will be used.
+            dtype: The complex data type of the simulated statevectors; either
+                ``numpy.complex128`` (the default) or ``numpy.complex64``.  Single precision halves
+                the memory required for the simulation.  Expectation values are always accumulated
+                in double precision.
         """
         self._default_precision = default_precision
         self._seed = seed
+        self._dtype = Statevector._validate_dtype(dtype)
 
     @property
     def default_precision(self) -> float:
@@ -133,6 +142,11 @@ class StatevectorEstimator(BaseEstimatorV2):
         """Return the seed or Generator object for random number generation."""
         return self._seed
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Return the complex data type of the simulated statevectors."""
+        return self._dtype
+
     def run(
         self, pubs: Iterable[EstimatorPubLike], *, precision: float | None = None
     ) -> PrimitiveJob[PrimitiveResult[PubResult]]:
@@ -160,7 +174,7 @@ class StatevectorEstimator(BaseEstimatorV2):
         for index in np.ndindex(*bc_circuits.shape):
             bound_circuit = bc_circuits[index]
             observable = bc_obs[index]
-            final_state = _statevector_from_circuit(bound_circuit, rng)
+            final_state = _statevector_from_circuit(bound_circuit, rng, dtype=self._dtype)
             paulis, coeffs = zip(*observable.items())
             obs = SparsePauliOp(paulis, coeffs)  # TODO: support non Pauli operators
             expectation_value = np.real_if_close(final_state.expectation_value(obs))
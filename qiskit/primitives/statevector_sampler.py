@@ -133,15 +133,25 @@ class StatevectorSampler(BaseSamplerV2):
 
     """
 
-    def __init__(self, *, default_shots: int = 1024, seed: np.random.Generator | int | None = None):
+    def __init__(
+        self,
+        *,
+        default_shots: int = 1024,
+        seed: np.random.Generator | int | None = None,
+        dtype: type | np.dtype = np.complex128,
+    ):
         """
         Args:
             default_shots: The default shots for the sampler if not specified during run.
             seed: The seed or Generator object for random number generation.
                 If None, a random seeded default RNG will be used.
+            dtype: The complex data type of the simulated statevectors; either
+                ``numpy.complex128`` (the default) or ``numpy.complex64``.  Single precision halves
+                the memory required for the simulation.
         """
         self._default_shots = default_shots
         self._seed = seed
+        self._dtype = Statevector._validate_dtype(dtype)
 
     @property
     def default_shots(self) -> int:
@@ -153,6 +163,11 @@ class StatevectorSampler(BaseSamplerV2):
         """Return the seed or Generator object for random number generation."""
         return self._seed
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Return the complex data type of the simulated statevectors."""
+        return self._dtype
+
     def run(
         self, pubs: Iterable[SamplerPubLike], *, shots: int | None = None
     ) -> PrimitiveJob[PrimitiveResult[SamplerPubResult]]:
@@ -184,13 +199,14 @@ class StatevectorSampler(BaseSamplerV2):
             for item in meas_info
         }
         for index, bound_circuit in np.ndenumerate(bound_circuits):
-            final_state = Statevector(bound_circuit_to_instruction(bound_circuit))
-            final_state.seed(self._seed)
+            final_state = Statevector(
+                bound_circuit_to_instruction(bound_circuit), dtype=self._dtype
+            )
             if qargs:
-                samples = final_state.sample_memory(shots=pub.shots, qargs=qargs)
+                outcomes = final_state.outcome_sampler(qargs).sample(pub.shots, seed=self._seed)
             else:
-                samples = [""] * pub.shots
-            samples_array = np.array([np.fromiter(sample, dtype=np.uint8) for sample in samples])
+                outcomes = np.zeros(pub.shots, dtype=np.int64)
+            samples_array = _outcomes_to_bits(outcomes, len(qargs))
             for item in meas_info:
                 ary = _samples_to_packed_array(samples_array, item.num_bits, item.qreg_indices)
                 arrays[item.creg_name][index] = ary
@@ -232,6 +248,13 @@ def _preprocess_circuit(circuit: QuantumCircuit):
     return circuit, qargs, meas_info
 
 
+def _outcomes_to_bits(outcomes: NDArray[np.int64], num_bits: int) -> NDArray[np.uint8]:
+    # Convert integer outcomes into an array of bits in the same order as the string labels of
+    # `Statevector.sample_memory`, i.e. qubit_last, ..., qubit_1, qubit_0.
+    shifts = np.arange(num_bits - 1, -1, -1, dtype=np.int64)
+    return ((outcomes[:, np.newaxis] >> shifts) & 1).astype(np.uint8)
+
+
 def _samples_to_packed_array(
     samples: NDArray[np.uint8], num_bits: int, indices: list[int]
 ) -> NDArray[np.uint8]:
@@ -21,7 +21,7 @@ from qiskit.quantum_info import Statevector
 
 
 def _statevector_from_circuit(
-    circuit: QuantumCircuit, rng: np.random.Generator | None
+    circuit: QuantumCircuit, rng: np.random.Generator | None, dtype: np.dtype = np.complex128
 ) -> Statevector:
     """Generate a statevector from a circuit. Used in StatevectorEstimator class.
 
@@ -34,10 +34,14 @@ def _statevector_from_circuit(
     Args:
         circuit: The quantum circuit.
         seed: The random number generator or None.
+        dtype: The complex data type of the statevector.
     """
-    sv = Statevector.from_int(0, 2**circuit.num_qubits)
+    data = np.zeros(2**circuit.num_qubits, dtype=dtype)
+    data[0] = 1
+    sv = Statevector(data, dtype=dtype)
     sv.seed(rng)
-    return sv.evolve(bound_circuit_to_instruction(circuit))
+    sv.evolve(bound_circuit_to_instruction(circuit), inplace=True)
+    return sv
 
 
 def bound_circuit_to_instruction(circuit: QuantumCircuit) -> Instruction:
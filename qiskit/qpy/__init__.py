@@ -101,6 +101,27 @@ API documentation
 .. autofunction:: dump
 .. autofunction:: get_qpy_version
 
+Large files can also be opened for lazy, random-access reading, where each circuit is only
+deserialized when it is accessed:
+
+.. autofunction:: open
+.. autoclass:: QPYReader
+    :members:
+
+Circuits can similarly be written one at a time, without holding them all in memory, and appended
+to an existing file:
+
+.. autoclass:: QPYWriter
+    :members:
+
+A family of circuits that only differ in their parameter values can be stored far more compactly as
+a single parameterized template and an array of values:
+
+.. autofunction:: dump_sweep
+.. autofunction:: load_sweep
+.. autoclass:: ParameterSweep
+    :members:
+
 These functions will raise a custom subclass of :exc:`.QiskitError` if they encounter problems
 during serialization or deserialization.
 
@@ -2224,7 +2245,17 @@ References
 """
 
 from .exceptions import QpyError, UnsupportedFeatureForVersion, QPYLoadingDeprecatedFeatureWarning
-from .interface import dump, load, get_qpy_version
+from .interface import (
+    dump,
+    load,
+    get_qpy_version,
+    QPYReader,
+    QPYWriter,
+    ParameterSweep,
+    dump_sweep,
+    load_sweep,
+)
+from .interface import open  # pylint: disable=redefined-builtin
 
 # For backward compatibility. Provide, Runtime, Experiment call these private functions.
 from .binary_io import (
@@ -101,6 +101,16 @@ CIRCUIT_TABLE_ENTRY = namedtuple("CIRCUIT_TABLE_ENTRY", ["offset"])
 CIRCUIT_TABLE_ENTRY_PACK = "!Q"
 CIRCUIT_TABLE_ENTRY_SIZE = struct.calcsize(CIRCUIT_TABLE_ENTRY_PACK)
 
+# SWEEP_HEADER
+SWEEP_HEADER = namedtuple(
+    "SWEEP_HEADER", ["preface", "sweep_version", "ndim", "num_parameters", "template_size"]
+)
+SWEEP_HEADER_PACK = "!8sBBQQ"
+SWEEP_HEADER_SIZE = struct.calcsize(SWEEP_HEADER_PACK)
+
+SWEEP_SHAPE_ENTRY_PACK = "!Q"
+SWEEP_SHAPE_ENTRY_SIZE = struct.calcsize(SWEEP_SHAPE_ENTRY_PACK)
+
 # REGISTER
 REGISTER_V4 = namedtuple("REGISTER", ["type", "standalone", "size", "name_size", "in_circuit"])
 REGISTER_V4_PACK = "!1c?IH?"
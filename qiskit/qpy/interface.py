@@ -14,21 +14,30 @@
 
 from __future__ import annotations
 
+import builtins
 import gzip
 import io
+import math
+import mmap
+import operator
+import os
 import shutil
+import tempfile
 from json import JSONEncoder, JSONDecoder
 from typing import Union, List, BinaryIO, Type, Optional, Callable, TYPE_CHECKING
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 import struct
 import warnings
 import re
 
+import numpy as np
+
 from qiskit.circuit import QuantumCircuit
 from qiskit.exceptions import QiskitError
 from qiskit.qpy import formats, common, binary_io, type_keys
 from qiskit.qpy.exceptions import QpyError
 from qiskit import user_config
+from qiskit.utils.parallel import parallel_map
 from qiskit.version import __version__
 
 if TYPE_CHECKING:
@@ -45,6 +54,10 @@ QPY_SUPPORTED_TYPES = QuantumCircuit
 # See https://github.com/Qiskit/qiskit/issues/15157#issuecomment-3389209015 for more detail.
 KNOWN_BAD_SEEKERS = (gzip.GzipFile,)
 
+# Identifier and format version of the container written by `dump_sweep`.
+_SWEEP_PREFACE = b"QPYSWEEP"
+_SWEEP_VERSION = 1
+
 # This version pattern is taken from the pypa packaging project:
 # https://github.com/pypa/packaging/blob/21.3/packaging/version.py#L223-L254
 # which is dual licensed Apache 2.0 and BSD see the source for the original
@@ -93,6 +106,7 @@ def dump(
     use_symengine: bool = False,
     version: int = common.QPY_VERSION,
     annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+    num_processes: Optional[int] = 1,
 ):
     """Write QPY binary data to a file
 
@@ -172,7 +186,12 @@ def dump(
             :class:`.Annotation` objects.  The subsequent call to :func:`load` will need to use
             similar serializer objects, that understand the custom output format of those
             serializers.
-
+        num_processes: The maximum number of processes to use to serialize the programs
+            concurrently.  If ``None``, the default number of processes (see
+            :func:`.default_num_processes`) is used.  The programs and the other arguments to this
+            function must be picklable to be serialized in parallel.  The output is identical to
+            the output of a serial call, and this function falls back to serial serialization
+            if :func:`.should_run_in_parallel` returns ``False``.
 
     Raises:
         TypeError: When invalid data type is input.
@@ -197,35 +216,46 @@ def dump(
 
     use_rust = version >= common.QPY_RUST_MIN_VERSION
 
-    version_match = VERSION_PATTERN_REGEX.search(__version__)
-    version_parts = [int(x) for x in version_match.group("release").split(".")]
     encoding = type_keys.SymExprEncoding.assign(use_symengine)
-    header = struct.pack(
-        formats.FILE_HEADER_V10_PACK,
-        b"QISKIT",
-        version,
-        version_parts[0],
-        version_parts[1],
-        version_parts[2],
-        len(programs),
-        encoding,
-    )
-    file_obj.write(header)
-    common.write_type_key(file_obj, type_keys.Program.CIRCUIT)
-    header_bytes_written = formats.FILE_HEADER_V10_SIZE + formats.TYPE_KEY_SIZE
+    header_bytes_written = _write_file_header(file_obj, version, len(programs), encoding)
+
+    write_kwargs = {
+        "metadata_serializer": metadata_serializer,
+        "use_symengine": bool(use_symengine),
+        "version": version,
+        "annotation_factories": annotation_factories,
+        "use_rust": use_rust,
+    }
 
     def _write_circuit(out_stream, circuit):
-        binary_io.write_circuit(
-            out_stream,
-            circuit,
-            metadata_serializer=metadata_serializer,
-            use_symengine=bool(use_symengine),
-            version=version,
-            annotation_factories=annotation_factories,
-            use_rust=use_rust,
+        binary_io.write_circuit(out_stream, circuit, **write_kwargs)
+
+    if num_processes != 1 and len(programs) > 1:
+        # Each program's payload doesn't depend on where it is placed in the file, so they can be
+        # serialized independently, and then stitched together with the circuit table.
+        payloads = parallel_map(
+            _write_circuit_to_bytes,
+            programs,
+            task_kwargs=write_kwargs,
+            num_processes=num_processes,
         )
-
-    if version >= 16:
+        if version >= 16:
+            if file_obj.seekable() and not isinstance(file_obj, KNOWN_BAD_SEEKERS):
+                payload_start = file_obj.tell()
+            else:
+                payload_start = header_bytes_written
+            payload_start += len(programs) * formats.CIRCUIT_TABLE_ENTRY_SIZE
+            for payload in payloads:
+                file_obj.write(
+                    struct.pack(
+                        formats.CIRCUIT_TABLE_ENTRY_PACK,
+                        *formats.CIRCUIT_TABLE_ENTRY(payload_start),
+                    )
+                )
+                payload_start += len(payload)
+        for payload in payloads:
+            file_obj.write(payload)
+    elif version >= 16:
         # We need a circuit table.
         if file_obj.seekable() and not isinstance(file_obj, KNOWN_BAD_SEEKERS):
             # Fast path for properly seekable streams
@@ -238,12 +268,7 @@ def dump(
                 _write_circuit(file_obj, program)
             # Seek back to the table start and write it out.
             file_obj.seek(table_start)
-            for offset in file_offsets:
-                file_obj.write(
-                    struct.pack(
-                        formats.CIRCUIT_TABLE_ENTRY_PACK, *formats.CIRCUIT_TABLE_ENTRY(offset)
-                    )
-                )
+            _write_circuit_table(file_obj, file_offsets)
             # Seek to the end of the stream.
             file_obj.seek(0, 2)
         else:
@@ -274,10 +299,200 @@ def dump(
             _write_circuit(file_obj, program)
 
 
+class QPYWriter:
+    """Incremental writer of QPY files.
+
+    Unlike :func:`dump`, which needs all the programs up front, a writer accepts programs one at a
+    time as they are produced, and writes the complete file (including the circuit table) when it
+    is closed.  Serialized programs are spooled to a temporary file in the meantime, so memory use
+    does not grow with the size of the archive.  For example::
+
+        from qiskit import qpy
+
+        with qpy.QPYWriter("circuits.qpy") as writer:
+            for circuit in produce_circuits():
+                writer.write(circuit)
+
+    A writer opened on a path in append mode (``mode="a"``) adds programs to the end of an existing
+    QPY file.  The updated file is written next to the original, and atomically replaces it when
+    the writer is closed, keeping the permissions of the original.
+
+    .. warning::
+
+        Appending to large archives is not supported.  The QPY format stores its circuit table at
+        the start of the file, and the table grows with every program added, so append mode
+        rewrites the whole file.  Its time and temporary disk space are proportional to the size
+        of the existing archive, not to the number of programs appended.  Append mode is meant for
+        adding to small files; to build up a large archive, keep a single writer open for all of
+        its programs.
+
+    If the body of a ``with`` block raises an exception, the destination is left untouched.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, os.PathLike, BinaryIO],
+        mode: str = "w",
+        *,
+        metadata_serializer: Optional[Type[JSONEncoder]] = None,
+        version: Optional[int] = None,
+        annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+    ):
+        """
+        Args:
+            file: Either the path to the output file, or a binary file like object to write the
+                QPY data to.  A file object is not closed by the writer.
+            mode: ``"w"`` to write a new file, or ``"a"`` to append to an existing file.  Append
+                mode is only supported when ``file`` is a path, and rewrites the whole existing
+                file, so it is not suitable for large archives.
+            metadata_serializer: An optional JSONEncoder class used to serialize the circuit
+                metadata, as in :func:`dump`.
+            version: The QPY format version to emit, as in :func:`dump`.  In append mode, this
+                defaults to the version of the existing file, and must match it if given.
+            annotation_factories: Mapping of namespaces to functions that create new instances of
+                :class:`.annotation.QPYSerializer`, as in :func:`dump`.
+
+        Raises:
+            ValueError: if the mode or version is not supported.
+            QpyError: if the existing file in append mode can't be appended to.
+        """
+        if mode not in ("w", "a"):
+            raise ValueError(f"Unsupported mode '{mode}'; expected 'w' or 'a'.")
+        is_path = isinstance(file, (str, os.PathLike))
+        if mode == "a" and not is_path:
+            raise ValueError("Append mode is only supported when writing to a path.")
+        self._file = file
+        self._is_path = is_path
+        # Byte offsets and total size of the existing programs, when appending.
+        self._existing = None
+        self._existing_offsets = []
+        use_symengine = False
+        if mode == "a" and os.path.exists(file):
+            with builtins.open(file, "rb") as fd:
+                data, use_symengine, _ = _read_file_header(fd)
+                if data.qpy_version < common.QPY_COMPATIBILITY_VERSION:
+                    raise QpyError(
+                        f"Cannot append to a file in QPY version {data.qpy_version}; the minimum "
+                        f"version that can be written is {common.QPY_COMPATIBILITY_VERSION}."
+                    )
+                if version is not None and version != data.qpy_version:
+                    raise ValueError(
+                        f"Cannot append QPY version {version} programs to a file in QPY "
+                        f"version {data.qpy_version}."
+                    )
+                version = data.qpy_version
+                if version >= 16:
+                    self._existing_offsets = _read_circuit_table(fd, data.num_programs)
+                self._existing = (fd.tell(), data.num_programs, os.fstat(fd.fileno()).st_size)
+        if version is None:
+            version = common.QPY_VERSION
+        elif common.QPY_COMPATIBILITY_VERSION > version or version > common.QPY_VERSION:
+            raise ValueError(
+                f"Writing payloads with the specified QPY version ({version}) is not supported by "
+                f"this version of Qiskit. Try selecting a version between "
+                f"{common.QPY_COMPATIBILITY_VERSION} and {common.QPY_VERSION}."
+            )
+        self._version = version
+        # New programs must use the same symbolic encoding as any existing ones, since the header
+        # records a single encoding for the whole file.
+        self._encoding = type_keys.SymExprEncoding.assign(use_symengine)
+        self._write_kwargs = {
+            "metadata_serializer": metadata_serializer,
+            "use_symengine": use_symengine,
+            "version": version,
+            "annotation_factories": annotation_factories,
+            "use_rust": version >= common.QPY_RUST_MIN_VERSION,
+        }
+        self._spool = tempfile.TemporaryFile()
+        self._offsets = []
+
+    @property
+    def qpy_version(self) -> int:
+        """The QPY format version being written."""
+        return self._version
+
+    def write(self, program: QPY_SUPPORTED_TYPES):
+        """Add a program to the end of the file.
+
+        Raises:
+            TypeError: if ``program`` is not a supported type.
+            ValueError: if the writer has been closed.
+        """
+        if self._spool is None:
+            raise ValueError("Cannot write to a closed QPYWriter.")
+        if not issubclass(type(program), QuantumCircuit):
+            raise TypeError(f"'{type(program)}' is not a supported data type.")
+        self._offsets.append(self._spool.tell())
+        binary_io.write_circuit(self._spool, program, **self._write_kwargs)
+
+    def close(self):
+        """Write the complete file to the destination, and release the temporary storage."""
+        if self._spool is None:
+            return
+        try:
+            if not self._is_path:
+                self._finish(self._file)
+                return
+            directory = os.path.dirname(os.path.abspath(self._file))
+            with tempfile.NamedTemporaryFile(dir=directory, delete=False) as out:
+                try:
+                    self._finish(out)
+                    # Temporary files are only accessible by their owner, but the destination
+                    # should have the same permissions as if it had been written directly.
+                    os.chmod(out.name, _destination_mode(self._file))
+                except BaseException:
+                    out.close()
+                    os.remove(out.name)
+                    raise
+            os.replace(out.name, self._file)
+        finally:
+            self._discard()
+
+    def _discard(self):
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    def _finish(self, file_obj):
+        existing_start, num_existing, existing_end = self._existing or (0, 0, 0)
+        num_programs = num_existing + len(self._offsets)
+        if file_obj.seekable() and not isinstance(file_obj, KNOWN_BAD_SEEKERS):
+            file_start = file_obj.tell()
+        else:
+            file_start = 0
+        header_size = _write_file_header(file_obj, self._version, num_programs, self._encoding)
+        table_size = 0
+        if self._version >= 16:
+            table_size = num_programs * formats.CIRCUIT_TABLE_ENTRY_SIZE
+            # Offsets in the table are absolute.  The existing programs move by however much the
+            # table grew, and the new ones follow directly after them.
+            shift = (num_programs - num_existing) * formats.CIRCUIT_TABLE_ENTRY_SIZE
+            new_start = file_start + header_size + table_size + (existing_end - existing_start)
+            offsets = [offset + shift for offset in self._existing_offsets]
+            offsets.extend(new_start + offset for offset in self._offsets)
+            _write_circuit_table(file_obj, offsets)
+        if self._existing is not None:
+            with builtins.open(self._file, "rb") as existing:
+                existing.seek(existing_start)
+                shutil.copyfileobj(existing, file_obj)
+        self._spool.seek(0)
+        shutil.copyfileobj(self._spool, file_obj)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+
 def load(
     file_obj: BinaryIO,
     metadata_deserializer: Optional[Type[JSONDecoder]] = None,
     annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+    num_processes: Optional[int] = 1,
 ) -> List[QPY_SUPPORTED_TYPES]:
     """Load a QPY binary file
 
@@ -318,6 +533,12 @@ def load(
         annotation_factories: Mapping of namespaces to functions that create new instances of
             :class:`.annotation.QPUSerializer`, for handling the loading of custom
             :class:`.Annotation` objects.
+        num_processes: The maximum number of processes to use to deserialize the programs
+            concurrently.  If ``None``, the default number of processes (see
+            :func:`.default_num_processes`) is used.  This requires the circuit table of QPY
+            format version 16 or later, and the other arguments to this function must be
+            picklable.  Otherwise, or if :func:`.should_run_in_parallel` returns ``False``, the
+            programs are deserialized serially.
 
     Returns:
         The list of Qiskit programs contained in the QPY data.
@@ -333,6 +554,454 @@ def load(
         QpyError: if known but unsupported data type is loaded.
     """
 
+    data, use_symengine, use_rust = _read_file_header(file_obj)
+
+    if data.qpy_version >= 16:
+        # Obtain the byte offsets for each program
+        program_offsets = _read_circuit_table(file_obj, data.num_programs)
+
+    read_kwargs = {
+        "metadata_deserializer": metadata_deserializer,
+        "use_symengine": bool(use_symengine),
+        "annotation_factories": annotation_factories,
+        "use_rust": use_rust,
+    }
+    if num_processes != 1 and data.qpy_version >= 16 and data.num_programs > 1:
+        file_obj.seek(0, 2)
+        payload_ends = _payload_ends(program_offsets, file_obj.tell())
+        payloads = []
+        for start, end in zip(program_offsets, payload_ends):
+            file_obj.seek(start)
+            payloads.append(file_obj.read(end - start))
+        return parallel_map(
+            _read_circuit_from_bytes,
+            payloads,
+            task_args=(data.qpy_version,),
+            task_kwargs=read_kwargs,
+            num_processes=num_processes,
+        )
+
+    programs = []
+    for i in range(data.num_programs):
+        if data.qpy_version >= 16:
+            # Deserialize each program using their byte offsets
+            file_obj.seek(program_offsets[i])
+        programs.append(binary_io.read_circuit(file_obj, data.qpy_version, **read_kwargs))
+    return programs
+
+
+class QPYReader(Sequence):
+    """Lazy, random-access view of the programs in a QPY file.
+
+    This is typically constructed by :func:`.qpy.open`.  Only the file header and the circuit
+    table are read when the reader is created; each program is deserialized from the file when it
+    is accessed, so a handful of circuits can be loaded from a large archive without paying for
+    all of them.  The reader is a :class:`~collections.abc.Sequence`, and supports :func:`len`,
+    integer and slice indexing, and iteration.  For example::
+
+        from qiskit import qpy
+
+        with qpy.open("circuits.qpy") as circuits:
+            print(len(circuits))
+            first = circuits[0]
+            last_ten = circuits[-10:]
+
+    Each access deserializes the program again, so the returned circuits are independent objects.
+    Random access needs the circuit table that was added in QPY version 16; for files in an older
+    format version, reaching a program requires reading all the programs before it the first time.
+
+    The file object must stay open for the lifetime of the reader.
+    """
+
+    def __init__(
+        self,
+        file_obj: BinaryIO,
+        metadata_deserializer: Optional[Type[JSONDecoder]] = None,
+        annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+    ):
+        """
+        Args:
+            file_obj: A seekable file like object that contains the QPY binary data.
+            metadata_deserializer: An optional JSONDecoder class used to deserialize the circuit
+                metadata, as in :func:`.qpy.load`.
+            annotation_factories: Mapping of namespaces to functions that create new instances of
+                :class:`.annotation.QPUSerializer`, as in :func:`.qpy.load`.
+
+        Raises:
+            QiskitError: if ``file_obj`` is not a valid QPY file.
+            TypeError: if the file does not contain circuits.
+        """
+        self._file_obj = file_obj
+        self._metadata_deserializer = metadata_deserializer
+        self._annotation_factories = annotation_factories
+        self._on_close = []
+        data, self._use_symengine, self._use_rust = _read_file_header(file_obj)
+        self._version = data.qpy_version
+        self._num_programs = data.num_programs
+        if self._version >= 16:
+            self._offsets = _read_circuit_table(file_obj, self._num_programs)
+            file_obj.seek(0, 2)
+            # Bounding each read means we only ever copy a single program's bytes out of the file.
+            self._ends = _payload_ends(self._offsets, file_obj.tell())
+        else:
+            # Without a circuit table, we only know where each program starts once the one before
+            # it has been read.
+            self._offsets = [file_obj.tell()]
+            self._ends = None
+
+    @property
+    def qpy_version(self) -> int:
+        """The QPY format version of the file."""
+        return self._version
+
+    def __len__(self):
+        return self._num_programs
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._read(i) for i in range(*index.indices(self._num_programs))]
+        index = operator.index(index)
+        if index < 0:
+            index += self._num_programs
+        if not 0 <= index < self._num_programs:
+            raise IndexError(f"program index {index} out of range")
+        return self._read(index)
+
+    def __iter__(self):
+        for index in range(self._num_programs):
+            yield self._read(index)
+
+    def _read(self, index):
+        if self._ends is None:
+            while len(self._offsets) <= index:
+                self._read_at(len(self._offsets) - 1)
+                self._offsets.append(self._file_obj.tell())
+            return self._read_at(index)
+        start = self._offsets[index]
+        self._file_obj.seek(start)
+        with io.BytesIO(self._file_obj.read(self._ends[index] - start)) as payload:
+            return self._read_circuit(payload)
+
+    def _read_at(self, index):
+        self._file_obj.seek(self._offsets[index])
+        return self._read_circuit(self._file_obj)
+
+    def _read_circuit(self, stream):
+        return binary_io.read_circuit(
+            stream,
+            self._version,
+            metadata_deserializer=self._metadata_deserializer,
+            use_symengine=self._use_symengine,
+            annotation_factories=self._annotation_factories,
+            use_rust=self._use_rust,
+        )
+
+    def close(self):
+        """Release any resources that were acquired by :func:`.qpy.open` for this reader.
+
+        A file object passed in by the caller is not closed.
+        """
+        while self._on_close:
+            self._on_close.pop()()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open(  # pylint: disable=redefined-builtin
+    file: Union[str, os.PathLike, BinaryIO],
+    metadata_deserializer: Optional[Type[JSONDecoder]] = None,
+    annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+) -> QPYReader:
+    """Open a QPY file for lazy, random-access reading.
+
+    Unlike :func:`load`, this only reads the file header and circuit table up front, and returns
+    a :class:`.QPYReader` that deserializes each program when it is accessed.  For example:
+
+    .. code-block:: python
+
+        from qiskit import qpy
+
+        with qpy.open("circuits.qpy") as circuits:
+            selected = [circuits[i] for i in (3, 1_000, 99_999)]
+
+    If ``file`` is a path, the file is memory mapped, so reading a program only touches the pages
+    of the file that hold it.  The mapping is released when the reader is closed, either
+    explicitly with :meth:`.QPYReader.close` or by using the reader as a context manager.
+
+    Args:
+        file: Either the path to a QPY file, or a seekable file like object that contains the
+            QPY binary data.  A file object is not closed by the reader.
+        metadata_deserializer: An optional JSONDecoder class used to deserialize the circuit
+            metadata, as in :func:`load`.
+        annotation_factories: Mapping of namespaces to functions that create new instances of
+            :class:`.annotation.QPUSerializer`, as in :func:`load`.
+
+    Returns:
+        A lazy sequence of the programs in the file.
+
+    Raises:
+        QiskitError: if ``file`` is not a valid QPY file.
+        TypeError: if the file does not contain circuits.
+    """
+    if not isinstance(file, (str, os.PathLike)):
+        return QPYReader(
+            file,
+            metadata_deserializer=metadata_deserializer,
+            annotation_factories=annotation_factories,
+        )
+    with builtins.open(file, "rb") as fd:
+        # The mapping remains valid after the file descriptor is closed.
+        mapped = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        reader = QPYReader(
+            mapped,
+            metadata_deserializer=metadata_deserializer,
+            annotation_factories=annotation_factories,
+        )
+    except Exception:
+        mapped.close()
+        raise
+    reader._on_close.append(mapped.close)  # pylint: disable=protected-access
+    return reader
+
+
+class ParameterSweep(Sequence):
+    """A parameterized template circuit, together with an array of values to bind to it.
+
+    This is the container read and written by :func:`.qpy.load_sweep` and :func:`.qpy.dump_sweep`.
+    The values use the layout of a :class:`.BindingsArray`: a float64 array whose last axis is over
+    the parameters of :attr:`template` (in the order of :attr:`.QuantumCircuit.parameters`), and
+    whose leading axes are the :attr:`shape` of the sweep.
+
+    The sweep is also a :class:`~collections.abc.Sequence` of the bound circuits, in row-major
+    order over :attr:`shape`.  Each circuit is only bound when it is accessed, so a sweep can be
+    stored and loaded without ever materializing all of its circuits.  For example::
+
+        from qiskit import qpy
+
+        with open("sweep.qpy", "rb") as fd:
+            sweep = qpy.load_sweep(fd)
+        template, values = sweep.template, sweep.values
+        bound = sweep[17]
+    """
+
+    def __init__(self, template: QuantumCircuit, values):
+        """
+        Args:
+            template: The parameterized circuit.
+            values: The values to bind, either as a :class:`.BindingsArray` or as an array-like
+                whose last axis is over the parameters of ``template``, in the order of
+                :attr:`.QuantumCircuit.parameters`.
+
+        Raises:
+            ValueError: if the last axis of ``values`` does not match the number of parameters of
+                ``template``.
+        """
+        # The primitives are imported lazily, since they aren't otherwise needed by QPY.
+        from qiskit.primitives.containers.bindings_array import BindingsArray
+
+        if isinstance(values, BindingsArray):
+            values = values.as_array(template.parameters)
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 0 or values.shape[-1] != template.num_parameters:
+            raise ValueError(
+                f"Expected values with a last axis of size {template.num_parameters}, matching the "
+                f"parameters of the template, but received an array of shape {values.shape}."
+            )
+        self._template = template
+        self._values = values
+
+    @property
+    def template(self) -> QuantumCircuit:
+        """The parameterized circuit."""
+        return self._template
+
+    @property
+    def values(self) -> np.ndarray:
+        """The array of values, with the parameters of :attr:`template` along the last axis."""
+        return self._values
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """The shape of the sweep, excluding the parameter axis."""
+        return self._values.shape[:-1]
+
+    def bindings_array(self):
+        """Return the values of the sweep as a :class:`.BindingsArray`."""
+        from qiskit.primitives.containers.bindings_array import BindingsArray
+
+        if not self._template.num_parameters:
+            return BindingsArray(shape=self.shape)
+        return BindingsArray({tuple(self._template.parameters): self._values}, shape=self.shape)
+
+    def __len__(self):
+        return math.prod(self.shape)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._template.assign_parameters_batch(self._rows()[index])
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"binding index {index} out of range")
+        return self._template.assign_parameters(self._rows()[index])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def _rows(self):
+        return self._values.reshape(len(self), self._template.num_parameters)
+
+
+def dump_sweep(
+    template: QuantumCircuit,
+    values,
+    file_obj: BinaryIO,
+    metadata_serializer: Optional[Type[JSONEncoder]] = None,
+    version: int = common.QPY_VERSION,
+    annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+):
+    """Write a parameter sweep as a template circuit and a table of values.
+
+    Storing ``N`` bound copies of the same parameterized circuit repeats its structure ``N`` times.
+    This writes the template once, as a complete QPY payload, followed by the values as a dense
+    float64 array, so the size of the output grows only by the size of each binding.  The output
+    is read back with :func:`load_sweep`.  For example:
+
+    .. code-block:: python
+
+        import numpy as np
+        from qiskit import qpy
+        from qiskit.circuit.library import real_amplitudes
+
+        template = real_amplitudes(5)
+        values = np.random.default_rng(0).uniform(size=(10_000, template.num_parameters))
+        with open("sweep.qpy", "wb") as fd:
+            qpy.dump_sweep(template, values, fd)
+
+    .. note::
+
+        The output is a container around a QPY payload, not a QPY file itself, so it can't be
+        read by :func:`load`.
+
+    Args:
+        template: The parameterized circuit.
+        values: The values to bind, either as a :class:`.BindingsArray` or as an array-like whose
+            last axis is over the parameters of ``template``, in the order of
+            :attr:`.QuantumCircuit.parameters`.  The leading axes are the shape of the sweep.
+        file_obj: The file like object to write the sweep to.
+        metadata_serializer: An optional JSONEncoder class used to serialize the template's
+            metadata, as in :func:`dump`.
+        version: The QPY format version to emit the template with, as in :func:`dump`.
+        annotation_factories: Mapping of namespaces to functions that create new instances of
+            :class:`.annotation.QPYSerializer`, as in :func:`dump`.
+
+    Raises:
+        TypeError: if ``template`` is not a :class:`.QuantumCircuit`.
+        ValueError: if the values don't match the parameters of the template, or the version is
+            not supported.
+    """
+    if not isinstance(template, QuantumCircuit):
+        raise TypeError(f"'{type(template)}' is not a supported data type.")
+    sweep = ParameterSweep(template, values)
+    with io.BytesIO() as buffer:
+        dump(
+            template,
+            buffer,
+            metadata_serializer=metadata_serializer,
+            version=version,
+            annotation_factories=annotation_factories,
+        )
+        template_payload = buffer.getvalue()
+    shape = sweep.shape
+    file_obj.write(
+        struct.pack(
+            formats.SWEEP_HEADER_PACK,
+            *formats.SWEEP_HEADER(
+                _SWEEP_PREFACE,
+                _SWEEP_VERSION,
+                len(shape),
+                template.num_parameters,
+                len(template_payload),
+            ),
+        )
+    )
+    for size in shape:
+        file_obj.write(struct.pack(formats.SWEEP_SHAPE_ENTRY_PACK, size))
+    file_obj.write(template_payload)
+    file_obj.write(np.ascontiguousarray(sweep.values, dtype="<f8").tobytes())
+
+
+def load_sweep(
+    file_obj: BinaryIO,
+    metadata_deserializer: Optional[Type[JSONDecoder]] = None,
+    annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+) -> ParameterSweep:
+    """Read a parameter sweep written by :func:`dump_sweep`.
+
+    Only the template circuit is deserialized; the bound circuits are created when they are
+    accessed from the returned :class:`.ParameterSweep`.
+
+    Args:
+        file_obj: A file like object that contains the sweep.
+        metadata_deserializer: An optional JSONDecoder class used to deserialize the template's
+            metadata, as in :func:`load`.
+        annotation_factories: Mapping of namespaces to functions that create new instances of
+            :class:`.annotation.QPYSerializer`, as in :func:`load`.
+
+    Returns:
+        The template circuit and its values.
+
+    Raises:
+        QpyError: if ``file_obj`` does not contain a sweep that can be read by this version of
+            Qiskit.
+    """
+    header = formats.SWEEP_HEADER._make(
+        struct.unpack(formats.SWEEP_HEADER_PACK, file_obj.read(formats.SWEEP_HEADER_SIZE))
+    )
+    if header.preface != _SWEEP_PREFACE:
+        raise QpyError("Input file is not a QPY parameter sweep.")
+    if header.sweep_version > _SWEEP_VERSION:
+        raise QpyError(
+            f"The parameter sweep format version being read, {header.sweep_version}, isn't "
+            "supported by this Qiskit version."
+        )
+    shape = tuple(
+        struct.unpack(
+            formats.SWEEP_SHAPE_ENTRY_PACK, file_obj.read(formats.SWEEP_SHAPE_ENTRY_SIZE)
+        )[0]
+        for _ in range(header.ndim)
+    )
+    with io.BytesIO(file_obj.read(header.template_size)) as buffer:
+        (template,) = load(
+            buffer,
+            metadata_deserializer=metadata_deserializer,
+            annotation_factories=annotation_factories,
+        )
+    num_values = math.prod(shape) * header.num_parameters
+    raw_values = file_obj.read(8 * num_values)
+    if len(raw_values) != 8 * num_values:
+        raise QpyError("The parameter sweep is truncated.")
+    values = np.frombuffer(raw_values, dtype="<f8")
+    return ParameterSweep(
+        template, values.astype(np.float64, copy=False).reshape(shape + (header.num_parameters,))
+    )
+
+
+def _read_file_header(file_obj: BinaryIO):
+    """Read and validate the file header and program type key at the start of a QPY file.
+
+    Returns:
+        A tuple of the file header, whether symbolic expressions are encoded with ``symengine``,
+        and whether the payload is deserialized by the Rust engine.  The cursor of ``file_obj`` is
+        left at the start of the circuit table (or the first program, for files without one).
+    """
     # identify file header version
     version = struct.unpack("!6sB", file_obj.read(7))[1]
     file_obj.seek(0)
@@ -413,35 +1082,85 @@ def load(
     else:
         use_symengine = data.symbolic_encoding == type_keys.SymExprEncoding.SYMENGINE
 
-    if data.qpy_version >= 16:
-        # Obtain the byte offsets for each program
-        program_offsets = []
-        for _ in range(data.num_programs):
-            program_offsets.append(
-                formats.CIRCUIT_TABLE_ENTRY(
-                    *struct.unpack(
-                        formats.CIRCUIT_TABLE_ENTRY_PACK,
-                        file_obj.read(formats.CIRCUIT_TABLE_ENTRY_SIZE),
-                    )
-                ).offset
-            )
+    return data, bool(use_symengine), use_rust
 
-    programs = []
-    for i in range(data.num_programs):
-        if data.qpy_version >= 16:
-            # Deserialize each program using their byte offsets
-            file_obj.seek(program_offsets[i])
-        programs.append(
-            binary_io.read_circuit(
-                file_obj,
-                data.qpy_version,
-                metadata_deserializer=metadata_deserializer,
-                use_symengine=bool(use_symengine),
-                annotation_factories=annotation_factories,
-                use_rust=use_rust,
+
+def _read_circuit_table(file_obj: BinaryIO, num_programs: int) -> List[int]:
+    """Read the byte offsets of each program from the circuit table of a QPY file."""
+    return [
+        formats.CIRCUIT_TABLE_ENTRY(
+            *struct.unpack(
+                formats.CIRCUIT_TABLE_ENTRY_PACK,
+                file_obj.read(formats.CIRCUIT_TABLE_ENTRY_SIZE),
             )
+        ).offset
+        for _ in range(num_programs)
+    ]
+
+
+def _destination_mode(path: Union[str, os.PathLike]) -> int:
+    """The permission bits for a file written to ``path``: those of the existing file, or the
+    defaults for a new file under the current umask."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        # The umask can only be read by setting it, so immediately restore it.
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _write_file_header(file_obj: BinaryIO, version: int, num_programs: int, encoding) -> int:
+    """Write the file header and program type key of a QPY file.
+
+    Returns:
+        The number of bytes written.
+    """
+    version_match = VERSION_PATTERN_REGEX.search(__version__)
+    version_parts = [int(x) for x in version_match.group("release").split(".")]
+    header = struct.pack(
+        formats.FILE_HEADER_V10_PACK,
+        b"QISKIT",
+        version,
+        version_parts[0],
+        version_parts[1],
+        version_parts[2],
+        num_programs,
+        encoding,
+    )
+    file_obj.write(header)
+    common.write_type_key(file_obj, type_keys.Program.CIRCUIT)
+    return formats.FILE_HEADER_V10_SIZE + formats.TYPE_KEY_SIZE
+
+
+def _write_circuit_table(file_obj: BinaryIO, offsets: Iterable[int]):
+    """Write the circuit table of a QPY file from the byte offsets of each program."""
+    for offset in offsets:
+        file_obj.write(
+            struct.pack(formats.CIRCUIT_TABLE_ENTRY_PACK, *formats.CIRCUIT_TABLE_ENTRY(offset))
         )
-    return programs
+
+
+def _payload_ends(offsets: List[int], file_end: int) -> List[int]:
+    """Get the byte offset of the end of each program's payload, from the circuit table.
+
+    Each program's payload ends where the next one in the file starts."""
+    starts = sorted(offsets)
+    next_start = dict(zip(starts, starts[1:] + [file_end]))
+    return [next_start[offset] for offset in offsets]
+
+
+def _write_circuit_to_bytes(circuit: QuantumCircuit, **kwargs) -> bytes:
+    """Serialize a single circuit payload.  This is the task of a parallel :func:`dump`."""
+    with io.BytesIO() as buffer:
+        binary_io.write_circuit(buffer, circuit, **kwargs)
+        return buffer.getvalue()
+
+
+def _read_circuit_from_bytes(payload: bytes, version: int, **kwargs) -> QuantumCircuit:
+    """Deserialize a single circuit payload.  This is the task of a parallel :func:`load`."""
+    with io.BytesIO(payload) as buffer:
+        return binary_io.read_circuit(buffer, version, **kwargs)
 
 
 def get_qpy_version(
@@ -51,6 +51,7 @@ States
    Statevector
    DensityMatrix
    StabilizerState
+   OutcomeSampler
 
 Channels
 ========
@@ -160,6 +161,7 @@ from .random import (
 )
 from .states import (
     DensityMatrix,
+    OutcomeSampler,
     StabilizerState,
     Statevector,
     concurrence,
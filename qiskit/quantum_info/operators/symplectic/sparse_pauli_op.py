@@ -17,6 +17,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List
 
 from collections.abc import Mapping, Sequence, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from numbers import Number
 from copy import deepcopy
 
@@ -42,11 +43,19 @@ from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.symplectic.pauli import BasePauli
 from qiskit.quantum_info.operators.symplectic.pauli_list import PauliList
 from qiskit.quantum_info.operators.symplectic.pauli import Pauli
+from qiskit.utils.parallel import default_num_processes, should_run_in_parallel
 
 
 if TYPE_CHECKING:
     from qiskit.transpiler.layout import TranspileLayout
 
+# Default number of composed terms that are materialized at once by
+# :meth:`SparsePauliOp.compose_and_simplify`.
+_COMPOSE_CHUNK_SIZE = 1 << 20
+
+# Lookup table from the exponent of ``-i`` to the corresponding complex phase.
+_PHASE_LOOKUP = np.array([1 + 0j, -1j, -1 + 0j, 1j], dtype=complex)
+
 
 class SparsePauliOp(LinearOp):
     """Sparse N-qubit operator in a Pauli basis representation.
@@ -380,6 +389,152 @@ class SparsePauliOp(LinearOp):
         coeffs = np.multiply.outer(self.coeffs, other.coeffs).ravel()
         return SparsePauliOp(pauli_list, coeffs, copy=False)
 
+    def compose_and_simplify(
+        self,
+        other: SparsePauliOp,
+        qargs: list | None = None,
+        front: bool = False,
+        *,
+        atol: float | None = None,
+        rtol: float | None = None,
+        chunk_size: int | None = None,
+        force_serial: bool = False,
+    ) -> SparsePauliOp:
+        """Return the simplified composition of this operator with ``other``.
+
+        This is equivalent to ``self.compose(other, qargs, front).simplify(atol, rtol)``, but the
+        outer product of the terms is never formed in full.  Instead, the composed terms are
+        generated in chunks of at most ``chunk_size`` terms, the duplicate terms within each chunk
+        are immediately summed by hashing, and each reduced chunk is merged into a running total.
+        Terms whose accumulated coefficient is zero to within the given tolerances are pruned from
+        the running total after every merge, so the peak memory use is bounded by the size of the
+        (pruned) result plus a few chunks, rather than by ``self.size * other.size``.
+
+        Since the pruning happens during the accumulation, a term whose contributions from
+        several chunks are each individually negligible is dropped, even if the sum of all its
+        contributions would not have been.  The result can therefore differ from that of
+        :meth:`simplify` by terms with coefficients of the order of the tolerances.
+
+        Args:
+            other: the operator to compose with.
+            qargs: the subsystems to compose on, as in :meth:`compose`.
+            front: if ``True``, compose using right operator multiplication, as in :meth:`compose`.
+            atol: absolute tolerance for pruning zero coefficients (Default: :attr:`atol`).
+            rtol: relative tolerance for pruning zero coefficients (Default: :attr:`rtol`).
+            chunk_size: the approximate maximum number of composed terms to generate at once.
+                Each chunk contains a whole number of rows of ``self``, so a chunk always contains
+                at least ``other.size`` terms.
+            force_serial: if ``True``, generate the chunks in serial.  Otherwise, if
+                :func:`.should_run_in_parallel` allows it, up to :func:`.default_num_processes`
+                chunks are generated concurrently in a thread pool, so the usual
+                ``QISKIT_PARALLEL`` and ``QISKIT_NUM_PROCS`` controls apply.
+
+        Returns:
+            SparsePauliOp: the simplified composed operator.
+
+        Raises:
+            QiskitError: if the operators have incompatible dimensions for composition.
+        """
+        if qargs is None:
+            qargs = getattr(other, "qargs", None)
+
+        if not isinstance(other, SparsePauliOp):
+            other = SparsePauliOp(other)
+
+        if self.coeffs.dtype == object or other.coeffs.dtype == object:
+            # Fallback to slow Python-space method.
+            return self.compose(other, qargs=qargs, front=front).simplify(atol=atol, rtol=rtol)
+
+        # Validate composition dimensions and qargs match
+        self._op_shape.compose(other._op_shape, qargs, front)
+
+        if atol is None:
+            atol = self.atol
+        if rtol is None:
+            rtol = self.rtol
+        if chunk_size is None:
+            chunk_size = _COMPOSE_CHUNK_SIZE
+
+        rows = max(1, chunk_size // max(other.size, 1))
+        bounds = [(start, min(start + rows, self.size)) for start in range(0, self.size, rows)]
+
+        def chunk(bound):
+            return self._compose_chunk(other, qargs, front, *bound)
+
+        def accumulate(total, part):
+            if total is not None:
+                part = _sum_terms(np.vstack((total[0], part[0])), np.hstack((total[1], part[1])))
+            keys, coeffs = part
+            non_zero = np.logical_not(np.isclose(coeffs, 0, atol=atol, rtol=rtol))
+            return keys[non_zero], coeffs[non_zero]
+
+        if force_serial or not should_run_in_parallel():
+            num_threads = 1
+        else:
+            num_threads = min(default_num_processes(), len(bounds))
+        total = None
+        if num_threads > 1:
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                # Only generate one chunk per thread at a time, so that the reduced chunks waiting
+                # to be merged don't grow without bound.
+                for window in range(0, len(bounds), num_threads):
+                    for part in executor.map(chunk, bounds[window : window + num_threads]):
+                        total = accumulate(total, part)
+        else:
+            for bound in bounds:
+                total = accumulate(total, chunk(bound))
+        keys, coeffs = (None, None) if total is None else total
+
+        if keys is None or keys.shape[0] == 0:
+            # Check edge case that we deleted all Paulis
+            # In this case we return an identity Pauli with a zero coefficient
+            x = np.zeros((1, self.num_qubits), dtype=bool)
+            z = np.zeros((1, self.num_qubits), dtype=bool)
+            coeffs = np.array([0j])
+        else:
+            x, z = _unpack_zx(keys, self.num_qubits)
+        return SparsePauliOp(
+            PauliList.from_symplectic(z, x), coeffs, ignore_pauli_phase=True, copy=False
+        )
+
+    def _compose_chunk(self, other, qargs, front, start, stop):
+        """Compose rows ``start:stop`` of ``self`` with all of ``other``, and combine duplicates.
+
+        This returns the packed ZX keys (see :func:`_pack_zx`) of the unique composed terms, and
+        their coefficients with the Pauli phases absorbed."""
+        x_full, z_full = self.paulis.x[start:stop], self.paulis.z[start:stop]
+        if qargs is not None:
+            x1, z1 = x_full[:, qargs], z_full[:, qargs]
+        else:
+            x1, z1 = x_full, z_full
+        x2, z2 = other.paulis.x, other.paulis.z
+        num_qubits = other.num_qubits
+
+        # This is the same outer product as in `compose`, restricted to a slice of `self`.
+        phase = np.add.outer(self.paulis._phase[start:stop], other.paulis._phase).reshape(-1)
+        if front:
+            q = np.logical_and(x1[:, np.newaxis], z2).reshape((-1, num_qubits))
+        else:
+            q = np.logical_and(z1[:, np.newaxis], x2).reshape((-1, num_qubits))
+        phase = phase + 2 * q.sum(axis=1, dtype=np.uint8)
+
+        x = np.logical_xor(x1[:, np.newaxis], x2).reshape((-1, num_qubits))
+        z = np.logical_xor(z1[:, np.newaxis], z2).reshape((-1, num_qubits))
+        if qargs is not None:
+            x_out = np.repeat(x_full, other.size, axis=0)
+            z_out = np.repeat(z_full, other.size, axis=0)
+            x_out[:, qargs] = x
+            z_out[:, qargs] = z
+            x, z = x_out, z_out
+
+        # Move the group phase into the coefficients, as in `SparsePauliOp.__init__`.
+        count_y = np.logical_and(x, z).sum(axis=1, dtype=np.uint8)
+        coeffs = _PHASE_LOOKUP[(phase - count_y) % 4] * np.multiply.outer(
+            self.coeffs[start:stop], other.coeffs
+        ).ravel()
+
+        return _sum_terms(_pack_zx(x, z), coeffs)
+
     def tensor(self, other: SparsePauliOp) -> SparsePauliOp:
         if not isinstance(other, SparsePauliOp):
             other = SparsePauliOp(other)
@@ -453,7 +608,7 @@ class SparsePauliOp(LinearOp):
             rtol = self.rtol
 
         # Compose with adjoint
-        val = self.compose(self.adjoint()).simplify(atol=atol, rtol=rtol)
+        val = self.compose_and_simplify(self.adjoint(), atol=atol, rtol=rtol)
         # See if the result is an identity
         return (
             val.size == 1
@@ -484,10 +639,7 @@ class SparsePauliOp(LinearOp):
         paulis_z = self.paulis.z
         nz_coeffs = self.coeffs
 
-        array = np.packbits(paulis_x, axis=1).astype(np.uint16) * 256 + np.packbits(
-            paulis_z, axis=1
-        )
-        indexes, inverses = unordered_unique(array)
+        indexes, inverses = unordered_unique(_pack_zx(paulis_x, paulis_z))
 
         coeffs = np.zeros(indexes.shape[0], dtype=self.coeffs.dtype)
         np.add.at(coeffs, inverses, nz_coeffs)
@@ -1252,6 +1404,29 @@ class SparsePauliOp(LinearOp):
         return new_op.compose(self, qargs=layout)
 
 
+def _pack_zx(x, z):
+    """Pack the symplectic representation of a list of Paulis into a 2D ``uint16`` array, with one
+    row per Pauli, suitable for hashing with :func:`unordered_unique`."""
+    return np.packbits(x, axis=1).astype(np.uint16) * 256 + np.packbits(z, axis=1)
+
+
+def _unpack_zx(keys, num_qubits):
+    """Inverse of :func:`_pack_zx`, returning the ``(x, z)`` Boolean arrays."""
+    x = np.unpackbits((keys >> 8).astype(np.uint8), axis=1, count=num_qubits).astype(bool)
+    z = np.unpackbits((keys & 0xFF).astype(np.uint8), axis=1, count=num_qubits).astype(bool)
+    return x, z
+
+
+def _sum_terms(keys, coeffs):
+    """Sum the coefficients of duplicate packed terms, without pruning any zeros.
+
+    The order of first appearance of each term is preserved."""
+    indexes, inverses = unordered_unique(keys)
+    summed = np.zeros(indexes.shape[0], dtype=complex)
+    np.add.at(summed, inverses, coeffs)
+    return keys[indexes], summed
+
+
 def sparsify_label(pauli_string):
     """Return a sparse format of a Pauli string, e.g. "XIIIZ" -> ("XZ", [0, 4])."""
     qubits = [i for i, label in enumerate(reversed(pauli_string)) if label != "I"]
@@ -16,6 +16,7 @@ from __future__ import annotations
 from .statevector import Statevector
 from .stabilizerstate import StabilizerState
 from .densitymatrix import DensityMatrix
+from .quantum_state import OutcomeSampler
 from .utils import partial_trace, schmidt_decomposition, shannon_entropy
 from .measures import (
     state_fidelity,
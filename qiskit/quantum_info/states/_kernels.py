@@ -0,0 +1,152 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+In-place kernels for applying qubit matrices to quantum-state tensors.
+
+All the kernels here act on a writeable ``numpy`` array of shape ``(2,) * m`` (or a strided view
+of one), where each axis is one qubit, and apply a ``2**k x 2**k`` matrix to the ``k`` tensor axes
+given by ``axes``.  The matrix is in Qiskit's little-endian convention with respect to ``axes``, so
+``axes[0]`` corresponds to the least significant bit of the matrix index.  No transposition of the
+full state is ever made; instead, the kernels work on the ``2**k`` strided views of the tensor that
+correspond to each basis state of the target qubits.  Only general dense matrices on many qubits
+are applied by contracting them with the tensor, which needs one temporary copy of it.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Dense matrices on more qubits than this are applied by a single contraction with the whole
+# tensor, since the loop over pairs of basis states in :func:`apply_dense` grows as ``4**k``.
+_MAX_DENSE_LOOP_QUBITS = 3
+
+
+def subview(tensor: np.ndarray, axes: list[int], index: int) -> np.ndarray:
+    """Return a writeable view of ``tensor`` with the qubit ``axes`` fixed to the bits of ``index``.
+
+    The fixed axes are kept as length-1 dimensions, so axis numbers of the view are the same as
+    those of the input."""
+    slices = [slice(None)] * tensor.ndim
+    for i, axis in enumerate(axes):
+        bit = (index >> i) & 1
+        slices[axis] = slice(bit, bit + 1)
+    return tensor[tuple(slices)]
+
+
+def permutation(mat: np.ndarray) -> np.ndarray | None:
+    """Return the column index of the only non-zero entry of each row of ``mat``, or ``None`` if
+    ``mat`` is not a (phased) permutation matrix."""
+    nonzero = mat != 0
+    if not np.all(nonzero.sum(axis=1) == 1) or not np.all(nonzero.sum(axis=0) == 1):
+        return None
+    return np.argmax(nonzero, axis=1)
+
+
+def apply_diagonal(tensor: np.ndarray, diag: np.ndarray, axes: list[int]):
+    """Multiply ``tensor`` in place by a diagonal matrix with the given diagonal on ``axes``."""
+    for index, value in enumerate(diag):
+        if value != 1:
+            subview(tensor, axes, index)[...] *= value
+
+
+def apply_permutation(tensor: np.ndarray, mat: np.ndarray, perm: np.ndarray, axes: list[int]):
+    """Apply the phased permutation matrix ``mat`` to ``tensor`` in place.
+
+    ``perm`` is the output of :func:`permutation` for ``mat``.  Only the parts of the tensor that
+    are actually moved by the permutation are copied."""
+    sources = {
+        int(source): subview(tensor, axes, int(source)).copy()
+        for row, source in enumerate(perm)
+        if row != source
+    }
+    for row, source in enumerate(perm):
+        source = int(source)
+        value = mat[row, source]
+        out = subview(tensor, axes, row)
+        if row == source:
+            if value != 1:
+                out *= value
+        elif value == 1:
+            out[...] = sources[source]
+        else:
+            np.multiply(sources[source], value, out=out)
+
+
+def apply_dense(tensor: np.ndarray, mat: np.ndarray, axes: list[int]):
+    """Apply a general matrix ``mat`` to ``tensor`` in place."""
+    inputs = [subview(tensor, axes, col).copy() for col in range(mat.shape[1])]
+    scratch = np.empty_like(inputs[0])
+    for row in range(mat.shape[0]):
+        out = subview(tensor, axes, row)
+        out[...] = 0
+        for col, value in enumerate(mat[row]):
+            if value == 0:
+                continue
+            if value == 1:
+                out += inputs[col]
+            else:
+                np.multiply(inputs[col], value, out=scratch)
+                out += scratch
+
+
+def apply_contraction(tensor: np.ndarray, mat: np.ndarray, axes: list[int]):
+    """Apply a general matrix ``mat`` to ``tensor`` by contracting it with the target axes, and
+    write the result back into ``tensor``.
+
+    This needs one temporary copy of ``tensor``, but works efficiently for any number of axes."""
+    num_axes = len(axes)
+    # In C order, the first axis of the reshaped matrix is the most significant bit.
+    reversed_axes = axes[::-1]
+    mat = np.reshape(mat, (2,) * (2 * num_axes))
+    out = np.tensordot(mat, tensor, axes=(list(range(num_axes, 2 * num_axes)), reversed_axes))
+    tensor[...] = np.moveaxis(out, list(range(num_axes)), reversed_axes)
+
+
+def apply_matrix(tensor: np.ndarray, mat: np.ndarray, axes: list[int]):
+    """Apply ``mat`` to ``tensor`` in place, dispatching to the most specialized kernel for the
+    structure of the matrix."""
+    mat = np.asarray(mat)
+    if np.count_nonzero(mat - np.diag(np.diagonal(mat))) == 0:
+        apply_diagonal(tensor, np.diagonal(mat), axes)
+    elif (perm := permutation(mat)) is not None:
+        apply_permutation(tensor, mat, perm, axes)
+    elif len(axes) > _MAX_DENSE_LOOP_QUBITS:
+        apply_contraction(tensor, mat, axes)
+    else:
+        apply_dense(tensor, mat, axes)
+
+
+def controlled_subview(tensor: np.ndarray, gate, axes: list[int]):
+    """If ``gate`` is a controlled standard gate whose action is fully described by its base gate,
+    return the view of ``tensor`` on which the controls are active and the axes of the target
+    qubits.  Otherwise, return ``None``."""
+    # pylint: disable=cyclic-import
+    from qiskit.circuit import ControlledGate
+    from qiskit.circuit.library import CUGate
+
+    # `CUGate` carries an extra phase on the controlled subspace that its base gate does not have.
+    if (
+        not isinstance(gate, ControlledGate)
+        or gate._standard_gate is None
+        or isinstance(gate, CUGate)
+    ):
+        return None
+    num_ctrl_qubits = gate.num_ctrl_qubits
+    view = subview(tensor, axes[:num_ctrl_qubits], gate.ctrl_state)
+    return view, axes[num_ctrl_qubits:]
+
+
+def tensor_axes(num_qubits: int, qargs: list[int], offset: int = 0) -> list[int]:
+    """Return the tensor axes corresponding to ``qargs`` in a C-ordered array of shape
+    ``(2,) * num_qubits`` (optionally shifted by ``offset`` leading axes)."""
+    return [offset + num_qubits - 1 - qubit for qubit in qargs]
@@ -25,6 +25,7 @@ from qiskit import _numpy_compat
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.states import _kernels
 from qiskit.quantum_info.states.quantum_state import QuantumState
 from qiskit.quantum_info.operators.mixins.tolerances import TolerancesMixin
 from qiskit.quantum_info.operators.op_shape import OpShape
@@ -35,9 +36,10 @@ from qiskit.quantum_info.operators.predicates import is_hermitian_matrix
 from qiskit.quantum_info.operators.predicates import is_positive_semidefinite_matrix
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.superop import SuperOp
+from qiskit.quantum_info.operators.channel.kraus import Kraus
 
 from qiskit._accelerate.pauli_expval import density_expval_pauli_no_x, density_expval_pauli_with_x
-from qiskit.quantum_info.states.statevector import Statevector
+from qiskit.quantum_info.states.statevector import Statevector, _MAX_KERNEL_QUBITS
 
 if TYPE_CHECKING:
     from qiskit import circuit
@@ -50,6 +52,8 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         self,
         data: np.ndarray | list | QuantumCircuit | circuit.instruction.Instruction | QuantumState,
         dims: int | tuple | list | None = None,
+        *,
+        dtype: type | np.dtype | None = None,
     ):
         """Initialize a density matrix object.
 
@@ -60,6 +64,10 @@ class DensityMatrix(QuantumState, TolerancesMixin):
                 If a quantum instruction, the density matrix is constructed by assuming all
                 qubits are initialized in the zero state.
             dims: The subsystem dimension of the state (See additional information).
+            dtype: The complex data type of the density matrix; either ``numpy.complex128`` or
+                ``numpy.complex64``.  Single precision halves the memory required to store and
+                evolve the state.  If ``None``, single-precision arrays and states keep their
+                precision, and all other inputs are converted to ``numpy.complex128``.
 
         Raises:
             QiskitError: if input data is not valid.
@@ -77,14 +85,15 @@ class DensityMatrix(QuantumState, TolerancesMixin):
               If it is not a power of two the state will have a single
               d-dimensional subsystem.
         """
+        dtype = self._default_dtype(data) if dtype is None else self._validate_dtype(dtype)
         if isinstance(data, (list, np.ndarray)):
             # Finally we check if the input is a raw matrix in either a
             # python list or numpy array format.
-            self._data = np.asarray(data, dtype=complex)
+            self._data = np.asarray(data, dtype=dtype)
         elif isinstance(data, (QuantumCircuit, Instruction)):
             # If the data is a circuit or an instruction use the classmethod
             # to construct the DensityMatrix object
-            self._data = DensityMatrix.from_instruction(data)._data
+            self._data = DensityMatrix.from_instruction(data, dtype=dtype)._data
         elif hasattr(data, "to_operator"):
             # If the data object has a 'to_operator' attribute this is given
             # higher preference than the 'to_matrix' method for initializing
@@ -100,6 +109,7 @@ class DensityMatrix(QuantumState, TolerancesMixin):
             self._data = np.asarray(data.to_matrix(), dtype=complex)
         else:
             raise QiskitError("Invalid input data format for DensityMatrix")
+        self._data = self._data.astype(dtype, copy=False)
         # Convert statevector into a density matrix
         ndim = self._data.ndim
         shape = self._data.shape
@@ -189,6 +199,8 @@ class DensityMatrix(QuantumState, TolerancesMixin):
     @property
     def data(self):
         """Return data."""
+        # The caller may modify the returned array in place.
+        self._clear_outcome_samplers()
         return self._data
 
     def is_valid(self, atol=None, rtol=None):
@@ -213,7 +225,7 @@ class DensityMatrix(QuantumState, TolerancesMixin):
 
     def conjugate(self):
         """Return the conjugate of the density matrix."""
-        return DensityMatrix(np.conj(self.data), dims=self.dims())
+        return DensityMatrix(np.conj(self.data), dims=self.dims(), dtype=self._data.dtype)
 
     def trace(self):
         """Return the trace of the density matrix."""
@@ -332,9 +344,14 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         # Currently the class that has `to_quantumchannel` is QuantumError of Qiskit Aer, so we can't
         # use QuantumError as a type hint.
         if hasattr(other, "to_quantumchannel"):
-            return other.to_quantumchannel()._evolve(self, qargs=qargs)
+            other = other.to_quantumchannel()
+        if isinstance(other, Kraus) and (ret := self._evolve_kraus(other, qargs)) is not None:
+            return ret
         if isinstance(other, QuantumChannel):
-            return other._evolve(self, qargs=qargs)
+            ret = other._evolve(self, qargs=qargs)
+            # Keep the precision of the input state.
+            ret._data = ret._data.astype(self._data.dtype, copy=False)
+            return ret
 
         # Unitary evolution by an Operator
         if not isinstance(other, Operator):
@@ -407,6 +424,10 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         Returns:
             complex: the expectation value.
         """
+        if isinstance(oper, (Pauli, SparsePauliOp)) and self._data.dtype != np.complex128:
+            # The Pauli expectation-value kernels work in double precision, so convert once.
+            return DensityMatrix(self, dtype=complex).expectation_value(oper, qargs)
+
         if isinstance(oper, Pauli):
             return self._expectation_value_pauli(oper, qargs)
 
@@ -526,7 +547,7 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         if qargs is None:
             # Resetting all qubits does not require sampling or RNG
             ret = _copy.copy(self)
-            state = np.zeros(self._op_shape.shape, dtype=complex)
+            state = np.zeros(self._op_shape.shape, dtype=self._data.dtype)
             state[0, 0] = 1
             ret._data = state
             return ret
@@ -603,7 +624,10 @@ class DensityMatrix(QuantumState, TolerancesMixin):
 
     @classmethod
     def from_instruction(
-        cls, instruction: circuit.instruction.Instruction | QuantumCircuit
+        cls,
+        instruction: circuit.instruction.Instruction | QuantumCircuit,
+        *,
+        dtype: type | np.dtype = complex,
     ) -> DensityMatrix:
         """Return the output density matrix of an instruction.
 
@@ -613,6 +637,8 @@ class DensityMatrix(QuantumState, TolerancesMixin):
 
         Args:
             instruction: instruction or circuit
+            dtype: The complex data type of the density matrix; either ``numpy.complex128`` (the
+                default) or ``numpy.complex64``.  The state is evolved in this precision.
 
         Returns:
             The final density matrix.
@@ -626,9 +652,10 @@ class DensityMatrix(QuantumState, TolerancesMixin):
             instruction = instruction.to_instruction()
         # Initialize an the statevector in the all |0> state
         num_qubits = instruction.num_qubits
-        init = np.zeros((2**num_qubits, 2**num_qubits), dtype=complex)
+        dtype = cls._validate_dtype(dtype)
+        init = np.zeros((2**num_qubits, 2**num_qubits), dtype=dtype)
         init[0, 0] = 1
-        vec = DensityMatrix(init, dims=num_qubits * (2,))
+        vec = DensityMatrix(init, dims=num_qubits * (2,), dtype=dtype)
         vec._append_instruction(instruction)
         return vec
 
@@ -726,9 +753,11 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         new_shape._num_qargs_r = new_shape._num_qargs_l
 
         ret = _copy.copy(self)
+        # Evolve in the precision of the state, not of the operator.
+        dtype = self._data.dtype
         if qargs is None:
             # Evolution on full matrix
-            op_mat = other.data
+            op_mat = other.data.astype(dtype, copy=False)
             ret._data = np.dot(op_mat, self.data).dot(op_mat.T.conj())
             ret._op_shape = new_shape
             return ret
@@ -739,11 +768,11 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         num_indices = len(self.dims())
         indices = [num_indices - 1 - qubit for qubit in qargs]
         # Left multiple by mat
-        mat = np.reshape(other.data, other._op_shape.tensor_shape)
+        mat = np.reshape(other.data.astype(dtype, copy=False), other._op_shape.tensor_shape)
         tensor = Operator._einsum_matmul(tensor, mat, indices)
         # Right multiply by mat ** dagger
         adj = other.adjoint()
-        mat_adj = np.reshape(adj.data, adj._op_shape.tensor_shape)
+        mat_adj = np.reshape(adj.data.astype(dtype, copy=False), adj._op_shape.tensor_shape)
         tensor = Operator._einsum_matmul(tensor, mat_adj, indices, num_indices, True)
         # Replace evolved dimensions
         ret._data = np.reshape(tensor, new_shape.shape)
@@ -755,6 +784,10 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         from qiskit.circuit.reset import Reset
         from qiskit.circuit.barrier import Barrier
 
+        # Try evolving a qubit gate in place, without building the full operator
+        if self._evolve_kernel(other, qargs=qargs):
+            return
+
         # Try evolving by a matrix operator (unitary-like evolution)
         mat = Operator._instruction_to_matrix(other)
         if mat is not None:
@@ -768,11 +801,15 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         if isinstance(other, Barrier):
             return
 
+        # Apply Kraus instructions term-by-term, without building their superoperator
+        if other.name == "kraus" and self._evolve_kraus_kernel(other.params, None, qargs=qargs):
+            return
+
         # Otherwise try evolving by a Superoperator
         chan = SuperOp._instruction_to_superop(other)
         if chan is not None:
             # Evolve current state by the superoperator
-            self._data = chan._evolve(self, qargs=qargs).data
+            self._data = chan._evolve(self, qargs=qargs).data.astype(self._data.dtype, copy=False)
             return
         # If the instruction doesn't have a matrix defined we use its
         # circuit decomposition definition if it exists, otherwise we
@@ -802,9 +839,96 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         if isinstance(obj, QuantumCircuit):
             obj = obj.to_instruction()
         vec = _copy.copy(self)
+        # The kernels update the data in place, so it must not be shared with this state.
+        vec._data = self._data.copy()
         vec._append_instruction(obj, qargs=qargs)
         return vec
 
+    def _evolve_kraus(self, chan, qargs=None):
+        """Return a new density matrix by applying a Kraus channel term-by-term, or ``None`` if the
+        channel is not suitable for the in-place kernels."""
+        ret = _copy.copy(self)
+        ret._data = self._data.copy()
+        if not ret._evolve_kraus_kernel(*chan._data, qargs=qargs):
+            return None
+        return ret
+
+    def _evolve_kernel(self, obj, qargs=None):
+        r"""Try to update a qubit density matrix in place by applying a gate as
+        :math:`\rho \mapsto U \rho U^\dagger` with the specialized kernels.
+
+        Returns ``True`` if the gate was applied, or ``False`` if it is not suitable for any of the
+        kernels, in which case the density matrix is unchanged."""
+        num_qubits = self.num_qubits
+        if num_qubits is None:
+            return False
+        if qargs is None:
+            qargs = list(range(num_qubits))
+        if getattr(obj, "num_qubits", None) != len(qargs):
+            return False
+        tensor = self._tensor_view()
+        row_view, row_axes = tensor, _kernels.tensor_axes(num_qubits, qargs)
+        col_view, col_axes = tensor, _kernels.tensor_axes(num_qubits, qargs, offset=num_qubits)
+        if (controlled := _kernels.controlled_subview(tensor, obj, row_axes)) is not None:
+            row_view, row_axes = controlled
+            col_view, col_axes = _kernels.controlled_subview(tensor, obj, col_axes)
+            obj = obj.base_gate
+        if len(row_axes) > _MAX_KERNEL_QUBITS:
+            return False
+        mat = Operator._instruction_to_matrix(obj)
+        if mat is None:
+            return False
+        _kernels.apply_matrix(row_view, mat, row_axes)
+        _kernels.apply_matrix(col_view, np.conj(mat), col_axes)
+        return True
+
+    def _evolve_kraus_kernel(self, kraus_l, kraus_r=None, qargs=None):
+        r"""Try to update a qubit density matrix in place by applying the map
+        :math:`\rho \mapsto \sum_i A_i \rho B_i^\dagger`, where the :math:`A_i` are ``kraus_l``
+        and the :math:`B_i` are ``kraus_r`` (or ``kraus_l`` if it is ``None``).
+
+        Each term is applied with the kernels on the target qubits only, for any number of target
+        qubits, so no superoperator is formed.  Returns ``True`` if the map was applied, or
+        ``False`` if it is not suitable for the kernels, in which case the density matrix is
+        unchanged."""
+        num_qubits = self.num_qubits
+        if num_qubits is None or not kraus_l:
+            return False
+        if qargs is None:
+            qargs = list(range(num_qubits))
+        if any(np.shape(op) != (2 ** len(qargs), 2 ** len(qargs)) for op in kraus_l):
+            return False
+        if kraus_r is None:
+            kraus_r = kraus_l
+        tensor = self._tensor_view()
+        row_axes = _kernels.tensor_axes(num_qubits, qargs)
+        col_axes = _kernels.tensor_axes(num_qubits, qargs, offset=num_qubits)
+        # The first term is applied to the data directly, and later ones to copies of the input,
+        # so at most two extra copies of the density matrix are alive at any time.
+        original = tensor.copy() if len(kraus_l) > 1 else None
+        for i, (left, right) in enumerate(zip(kraus_l, kraus_r)):
+            if i == 0:
+                term = tensor
+            elif i < len(kraus_l) - 1:
+                term = original.copy()
+            else:
+                term = original
+            _kernels.apply_matrix(term, left, row_axes)
+            _kernels.apply_matrix(term, np.conj(right), col_axes)
+            if i > 0:
+                tensor += term
+        return True
+
+    def _tensor_view(self):
+        """Return the data of this qubit density matrix as a writeable tensor view with one axis
+        per qubit, making the data contiguous and writeable first if needed.
+
+        The first ``num_qubits`` axes are the row (ket) qubits and the last ``num_qubits`` axes
+        are the column (bra) qubits, each in the order of :func:`._kernels.tensor_axes`."""
+        if not (self._data.flags.c_contiguous and self._data.flags.writeable):
+            self._data = self._data.copy()
+        return self._data.reshape((2,) * (2 * self.num_qubits))
+
     def to_statevector(self, atol: float | None = None, rtol: float | None = None) -> Statevector:
         """Return a statevector from a pure density matrix.
 
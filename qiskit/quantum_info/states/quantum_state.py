@@ -20,6 +20,7 @@ from abc import abstractmethod
 
 import numpy as np
 
+from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.op_shape import OpShape
@@ -44,10 +45,21 @@ class QuantumState:
         self._op_shape = op_shape
         # RNG for measure functions
         self._rng_generator = None
+        # Cache of `OutcomeSampler` objects for the current data, as the tuple
+        # `(data, {qargs: sampler})`.  It is invalid if `data` is not the current `_data`, and it is
+        # dropped whenever the data is (or may be) modified in place.
+        self._outcome_samplers = None
 
     # Set higher priority than Numpy array and matrix classes
     __array_priority__ = 20
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Cached samplers are cheap to rebuild, and would otherwise keep stale data alive in
+        # copies of the state and bloat pickles.
+        state["_outcome_samplers"] = None
+        return state
+
     def __eq__(self, other):
         return isinstance(other, self.__class__) and self.dims() == other.dims()
 
@@ -75,6 +87,31 @@ class QuantumState:
         """Make a copy of current operator."""
         return copy.deepcopy(self)
 
+    @staticmethod
+    def _validate_dtype(dtype) -> np.dtype:
+        """Return ``dtype`` as a :class:`numpy.dtype`, checking it is a supported state data type.
+
+        Raises:
+            QiskitError: if ``dtype`` is not ``complex64`` or ``complex128``.
+        """
+        out = np.dtype(dtype)
+        if out not in (np.complex64, np.complex128):
+            raise QiskitError(f"Unsupported data type for a quantum state: '{out}'")
+        return out
+
+    @staticmethod
+    def _default_dtype(data) -> np.dtype:
+        """Return the data type to store ``data`` in, if no data type is requested explicitly.
+
+        Single-precision arrays and states keep their precision, and all other inputs are stored in
+        double precision.
+        """
+        if isinstance(data, QuantumState):
+            data = data._data
+        if isinstance(data, np.ndarray) and data.dtype == np.complex64:
+            return data.dtype
+        return np.dtype(np.complex128)
+
     def seed(self, value=None):
         """Set the seed for the quantum state RNG."""
         if value is None:
@@ -243,6 +280,45 @@ class QuantumState:
             string_labels=True,
         )
 
+    def outcome_sampler(self, qargs: None | list = None) -> OutcomeSampler:
+        """Return a reusable sampler of computational-basis measurement outcomes.
+
+        The measurement probabilities of ``qargs`` are computed (and marginalized) once, when the
+        sampler is created, and the sampler is cached on the state for each ``qargs`` until the
+        state is modified, so repeatedly sampling the same state is cheap.  :meth:`sample_memory`
+        and :meth:`sample_counts` use this sampler internally.  A sampler is a snapshot: it does
+        not reflect later changes to the state.
+
+        .. note::
+
+            The cache is dropped by in-place evolution and by every access to the ``data``
+            attribute, since the returned array may be modified in place.  Writing into an array
+            that was obtained from ``data`` *before* the last sampling is not detected.
+
+        Args:
+            qargs (None or list): subsystems to sample measurements for,
+                                if None sample measurement of all
+                                subsystems (Default: None).
+
+        Returns:
+            OutcomeSampler: the sampler of measurement outcomes.
+        """
+        key = None if qargs is None else tuple(qargs)
+        data = self._data
+        cache = getattr(self, "_outcome_samplers", None)
+        if cache is None or cache[0] is not data:
+            cache = (data, {})
+        if (sampler := cache[1].get(key)) is None:
+            sampler = OutcomeSampler(self.probabilities(qargs), self.dims(qargs))
+            cache[1][key] = sampler
+        # Store the cache after computing the probabilities, since reading `data` drops it.
+        self._outcome_samplers = cache
+        return sampler
+
+    def _clear_outcome_samplers(self):
+        """Drop the cached outcome samplers, because the data may be modified in place."""
+        self._outcome_samplers = None
+
     def sample_memory(self, shots: int, qargs: None | list = None) -> np.ndarray:
         """Sample a list of qubit measurement outcomes in the computational basis.
 
@@ -264,15 +340,11 @@ class QuantumState:
 
             The seed for random number generator used for sampling can be
             set to a fixed value by using the stats :meth:`seed` method.
-        """
-        # Get measurement probabilities for measured qubits
-        probs = self.probabilities(qargs)
 
-        # Generate list of possible outcome string labels
-        labels = self._index_to_ket_array(
-            np.arange(len(probs)), self.dims(qargs), string_labels=True
-        )
-        return self._rng.choice(labels, p=probs, size=shots)
+            The measurement probabilities are cached between calls; see
+            :meth:`outcome_sampler`.
+        """
+        return self.outcome_sampler(qargs).sample_memory(shots, seed=self._rng)
 
     def sample_counts(self, shots: int, qargs: None | list = None) -> Counts:
         """Sample a dict of qubit measurement outcomes in the computational basis.
@@ -501,3 +573,81 @@ class QuantumState:
 
     def __neg__(self):
         return self._multiply(-1)
+
+
+class OutcomeSampler:
+    """A reusable sampler of computational-basis measurement outcomes of a quantum state.
+
+    Instances of this class are returned by :meth:`.Statevector.outcome_sampler` and
+    :meth:`.DensityMatrix.outcome_sampler`.  The cumulative distribution of the (marginalized)
+    measurement probabilities is computed once, on construction, so that each subsequent call only
+    costs time proportional to the number of shots, rather than to the dimension of the state.
+
+    Outcomes are drawn by inverting the cumulative distribution with uniform random numbers, in the
+    same way as :meth:`numpy.random.Generator.choice`, so sampling with a given seed gives the same
+    outcomes as the previous implementation of :meth:`.QuantumState.sample_memory`.
+    """
+
+    def __init__(self, probabilities: np.ndarray, dims: tuple):
+        """
+        Args:
+            probabilities: the probability vector of the outcomes.
+            dims: the subsystem dimensions of the outcomes.
+        """
+        cdf = np.cumsum(np.asarray(probabilities, dtype=np.float64))
+        cdf /= cdf[-1]
+        self._cdf = cdf
+        self._dims = tuple(dims)
+
+    @property
+    def dims(self) -> tuple:
+        """The subsystem dimensions of the outcomes."""
+        return self._dims
+
+    @property
+    def num_outcomes(self) -> int:
+        """The number of distinct outcomes."""
+        return self._cdf.size
+
+    def sample(self, shots: int, seed: np.random.Generator | int | None = None) -> np.ndarray:
+        """Sample outcomes as integer indices of the computational basis.
+
+        Args:
+            shots: number of samples to generate.
+            seed: the random number generator, or a seed for a new one.
+
+        Returns:
+            np.ndarray: a 1D ``int64`` array of the sampled outcome indices, in the order sampled.
+        """
+        rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        return self._cdf.searchsorted(rng.random(shots), side="right").astype(np.int64, copy=False)
+
+    def sample_memory(
+        self, shots: int, seed: np.random.Generator | int | None = None
+    ) -> np.ndarray:
+        """Sample outcomes as ket string labels.
+
+        Args:
+            shots: number of samples to generate.
+            seed: the random number generator, or a seed for a new one.
+
+        Returns:
+            np.ndarray: an array of the sampled outcome labels, in the order sampled.
+        """
+        return QuantumState._index_to_ket_array(
+            self.sample(shots, seed), self._dims, string_labels=True
+        )
+
+    def sample_counts(self, shots: int, seed: np.random.Generator | int | None = None) -> Counts:
+        """Sample a dictionary of outcome counts.
+
+        Args:
+            shots: number of samples to generate.
+            seed: the random number generator, or a seed for a new one.
+
+        Returns:
+            Counts: sampled counts dictionary.
+        """
+        inds, counts = np.unique(self.sample(shots, seed), return_counts=True)
+        labels = QuantumState._index_to_ket_array(inds, self._dims, string_labels=True)
+        return Counts(zip(labels, counts))
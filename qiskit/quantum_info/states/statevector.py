@@ -26,6 +26,7 @@ from qiskit import _numpy_compat
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.states import _kernels
 from qiskit.quantum_info.states.quantum_state import QuantumState
 from qiskit.quantum_info.operators.mixins.tolerances import TolerancesMixin
 from qiskit.quantum_info.operators.operator import Operator, BaseOperator
@@ -41,6 +42,10 @@ from qiskit._accelerate.pauli_expval import (
 if TYPE_CHECKING:
     from qiskit import circuit
 
+# Gates acting on more qubits than this (after removing their controls) are applied by contraction
+# with their matrix rather than by the in-place kernels, which loop over the basis states.
+_MAX_KERNEL_QUBITS = 3
+
 
 class Statevector(QuantumState, TolerancesMixin):
     """Statevector class"""
@@ -56,6 +61,8 @@ class Statevector(QuantumState, TolerancesMixin):
             | circuit.instruction.Instruction
         ),
         dims: int | tuple | list | None = None,
+        *,
+        dtype: type | np.dtype | None = None,
     ):
         """Initialize a statevector object.
 
@@ -66,6 +73,10 @@ class Statevector(QuantumState, TolerancesMixin):
                 the statevector is constructed by assuming that all qubits are initialized to the
                 zero state.
             dims: The subsystem dimension of the state (See additional information).
+            dtype: The complex data type of the statevector; either ``numpy.complex128`` or
+                ``numpy.complex64``.  Single precision halves the memory required to store and
+                evolve the state.  If ``None``, single-precision arrays and states keep their
+                precision, and all other inputs are converted to ``numpy.complex128``.
 
         Raises:
             QiskitError: if input data is not valid.
@@ -83,12 +94,13 @@ class Statevector(QuantumState, TolerancesMixin):
               If it is not a power of two the state will have a single
               d-dimensional subsystem.
         """
+        dtype = self._default_dtype(data) if dtype is None else self._validate_dtype(dtype)
         if isinstance(data, (list, np.ndarray)):
             # Finally we check if the input is a raw vector in either a
             # python list or numpy array format.
-            self._data = np.asarray(data, dtype=complex)
+            self._data = np.asarray(data, dtype=dtype)
         elif isinstance(data, Statevector):
-            self._data = data._data
+            self._data = data._data.astype(dtype, copy=False)
             if dims is None:
                 dims = data._op_shape._dims_l
         elif isinstance(data, Operator):
@@ -96,9 +108,9 @@ class Statevector(QuantumState, TolerancesMixin):
             input_dim, _ = data.dim
             if input_dim != 1:
                 raise QiskitError("Input Operator is not a column-vector.")
-            self._data = np.ravel(data.data)
+            self._data = np.ravel(data.data).astype(dtype, copy=False)
         elif isinstance(data, (QuantumCircuit, Instruction)):
-            self._data = Statevector.from_instruction(data).data
+            self._data = Statevector.from_instruction(data, dtype=dtype).data
         else:
             raise QiskitError("Invalid input data format for Statevector")
         # Check that the input is a numpy vector or column-vector numpy
@@ -114,13 +126,21 @@ class Statevector(QuantumState, TolerancesMixin):
         super().__init__(op_shape=OpShape.auto(shape=shape, dims_l=dims, num_qubits_r=0))
 
     @classmethod
-    def from_circuit(cls, circuit: QuantumCircuit, ignore_set_layout: bool = False) -> Statevector:
+    def from_circuit(
+        cls,
+        circuit: QuantumCircuit,
+        ignore_set_layout: bool = False,
+        *,
+        dtype: type | np.dtype = complex,
+    ) -> Statevector:
         """Create a Statevector from a quantum circuit.
 
         Args:
             circuit (QuantumCircuit): A quantum circuit
             ignore_set_layout (bool): When set to ``True``, if the input ``circuit``
                 has a layout set, it will be ignored. Defaults to ``False``.
+            dtype: The complex data type of the statevector; either ``numpy.complex128`` (the
+                default) or ``numpy.complex64``.
 
         Returns:
             The statevector obtained by applying the circuit on the all-zero
@@ -161,7 +181,7 @@ class Statevector(QuantumState, TolerancesMixin):
         if not ignore_set_layout:
             layout = circuit.layout
         # Create statevector using from_instruction (which iterates through circuit)
-        statevec = cls.from_instruction(circuit)
+        statevec = cls.from_instruction(circuit, dtype=dtype)
 
         # Apply layout permutations if needed (this handles transpiler layout changes)
         if not ignore_set_layout and layout is not None:
@@ -307,6 +327,8 @@ class Statevector(QuantumState, TolerancesMixin):
     @property
     def data(self) -> np.ndarray:
         """Return data."""
+        # The caller may modify the returned array in place.
+        self._clear_outcome_samplers()
         return self._data
 
     def is_valid(self, atol: float | None = None, rtol: float | None = None) -> bool:
@@ -325,7 +347,7 @@ class Statevector(QuantumState, TolerancesMixin):
 
     def conjugate(self) -> Statevector:
         """Return the conjugate of the operator."""
-        return Statevector(np.conj(self.data), dims=self.dims())
+        return Statevector(np.conj(self.data), dims=self.dims(), dtype=self._data.dtype)
 
     def trace(self) -> np.float64:
         """Return the trace of the quantum state as a density matrix."""
@@ -438,17 +460,29 @@ class Statevector(QuantumState, TolerancesMixin):
         return ret
 
     def evolve(
-        self, other: Operator | QuantumCircuit | Instruction, qargs: list[int] | None = None
-    ) -> Statevector:
+        self,
+        other: Operator | QuantumCircuit | Instruction,
+        qargs: list[int] | None = None,
+        *,
+        inplace: bool = False,
+    ) -> Statevector | None:
         """Evolve a quantum state by the operator.
 
+        Standard gates are applied to qubit statevectors by specialized in-place kernels for
+        diagonal, permutation and controlled gates, which never form the matrix of the gate on
+        the full space nor transpose the statevector.
+
         Args:
             other (Operator | QuantumCircuit | circuit.Instruction): The operator to evolve by.
             qargs (list): a list of Statevector subsystem positions to apply
                            the operator on.
+            inplace: if ``True``, evolve this statevector in place rather than returning a new
+                one.  When evolving by a circuit or instruction, the underlying data array is
+                modified in place, so no copy of the statevector is made.  Note that this also
+                affects any other :class:`Statevector` that shares its data with this one.
 
         Returns:
-            Statevector: the output quantum state.
+            Statevector: the output quantum state, or ``None`` if ``inplace`` is ``True``.
 
         Raises:
             QiskitError: if the operator dimension does not match the
@@ -458,7 +492,9 @@ class Statevector(QuantumState, TolerancesMixin):
             qargs = getattr(other, "qargs", None)
 
         # Get return vector
-        ret = _copy.copy(self)
+        if inplace:
+            self._clear_outcome_samplers()
+        ret = self if inplace else _copy.copy(self)
 
         # Evolution by a circuit or instruction
         if isinstance(other, QuantumCircuit):
@@ -466,7 +502,11 @@ class Statevector(QuantumState, TolerancesMixin):
         if isinstance(other, Instruction):
             if self.num_qubits is None:
                 raise QiskitError("Cannot apply QuantumCircuit to non-qubit Statevector.")
-            return self._evolve_instruction(ret, other, qargs=qargs)
+            if not inplace:
+                # The instruction kernels write into the data, so we must not share it.
+                ret._data = ret._data.copy()
+            ret = self._evolve_instruction(ret, other, qargs=qargs)
+            return None if inplace else ret
 
         # Evolution by an Operator
         if not isinstance(other, Operator):
@@ -478,7 +518,8 @@ class Statevector(QuantumState, TolerancesMixin):
             raise QiskitError(
                 "Operator input dimensions are not equal to statevector subsystem dimensions."
             )
-        return Statevector._evolve_operator(ret, other, qargs=qargs)
+        ret = Statevector._evolve_operator(ret, other, qargs=qargs)
+        return None if inplace else ret
 
     def equiv(
         self, other: Statevector, rtol: float | None = None, atol: float | None = None
@@ -576,6 +617,10 @@ class Statevector(QuantumState, TolerancesMixin):
         Returns:
             complex: the expectation value.
         """
+        if isinstance(oper, (Pauli, SparsePauliOp)) and self._data.dtype != np.complex128:
+            # The Pauli expectation-value kernels work in double precision, so convert once.
+            return Statevector(self, dtype=complex).expectation_value(oper, qargs)
+
         if isinstance(oper, Pauli):
             return self._expectation_value_pauli(oper, qargs)
 
@@ -697,7 +742,7 @@ class Statevector(QuantumState, TolerancesMixin):
         if qargs is None:
             # Resetting all qubits does not require sampling or RNG
             ret = _copy.copy(self)
-            state = np.zeros(self._op_shape.shape, dtype=complex)
+            state = np.zeros(self._op_shape.shape, dtype=self._data.dtype)
             state[0] = 1
             ret._data = state
             return ret
@@ -819,7 +864,9 @@ class Statevector(QuantumState, TolerancesMixin):
         return Statevector(state, dims=dims)
 
     @classmethod
-    def from_instruction(cls, instruction: Instruction | QuantumCircuit) -> Statevector:
+    def from_instruction(
+        cls, instruction: Instruction | QuantumCircuit, *, dtype: type | np.dtype = complex
+    ) -> Statevector:
         """Return the output statevector of an instruction.
 
         The statevector is initialized in the state :math:`|{0,\\ldots,0}\\rangle` of the
@@ -828,6 +875,8 @@ class Statevector(QuantumState, TolerancesMixin):
 
         Args:
             instruction (qiskit.circuit.Instruction or QuantumCircuit): instruction or circuit
+            dtype: The complex data type of the statevector; either ``numpy.complex128`` (the
+                default) or ``numpy.complex64``.  The state is evolved in this precision.
 
         Returns:
             Statevector: The final statevector.
@@ -840,9 +889,10 @@ class Statevector(QuantumState, TolerancesMixin):
         if isinstance(instruction, QuantumCircuit):
             instruction = instruction.to_instruction()
         # Initialize an the statevector in the all |0> state
-        init = np.zeros(2**instruction.num_qubits, dtype=complex)
+        dtype = cls._validate_dtype(dtype)
+        init = np.zeros(2**instruction.num_qubits, dtype=dtype)
         init[0] = 1.0
-        vec = Statevector(init, dims=instruction.num_qubits * (2,))
+        vec = Statevector(init, dims=instruction.num_qubits * (2,), dtype=dtype)
         return Statevector._evolve_instruction(vec, instruction)
 
     def to_dict(self, decimals: None | int = None) -> dict:
@@ -929,9 +979,11 @@ class Statevector(QuantumState, TolerancesMixin):
     def _evolve_operator(statevec, oper, qargs=None):
         """Evolve a qudit statevector"""
         new_shape = statevec._op_shape.compose(oper._op_shape, qargs=qargs)
+        # Evolve in the precision of the state, not of the operator.
+        oper_data = oper._data.astype(statevec._data.dtype, copy=False)
         if qargs is None:
             # Full system evolution
-            statevec._data = np.dot(oper._data, statevec._data)
+            statevec._data = np.dot(oper_data, statevec._data)
             statevec._op_shape = new_shape
             return statevec
 
@@ -954,7 +1006,7 @@ class Statevector(QuantumState, TolerancesMixin):
 
         # Perform contraction
         tensor = np.reshape(
-            np.dot(oper.data, np.reshape(tensor, contract_shape)),
+            np.dot(oper_data, np.reshape(tensor, contract_shape)),
             tensor_shape,
         )
 
@@ -965,6 +1017,37 @@ class Statevector(QuantumState, TolerancesMixin):
         statevec._op_shape = new_shape
         return statevec
 
+    @staticmethod
+    def _evolve_kernel(statevec, obj, qargs=None):
+        """Try to update a qubit Statevector in place by applying a gate with a specialized kernel.
+
+        Returns ``True`` if the gate was applied, or ``False`` if it is not suitable for any of the
+        kernels, in which case the statevector is unchanged."""
+        num_qubits = statevec.num_qubits
+        if qargs is None:
+            qargs = list(range(num_qubits))
+        if getattr(obj, "num_qubits", None) != len(qargs):
+            return False
+        tensor = statevec._tensor_view()
+        axes = _kernels.tensor_axes(num_qubits, qargs)
+        if (controlled := _kernels.controlled_subview(tensor, obj, axes)) is not None:
+            tensor, axes = controlled
+            obj = obj.base_gate
+        if len(axes) > _MAX_KERNEL_QUBITS:
+            return False
+        mat = Operator._instruction_to_matrix(obj)
+        if mat is None:
+            return False
+        _kernels.apply_matrix(tensor, mat, axes)
+        return True
+
+    def _tensor_view(self):
+        """Return the data of this qubit statevector as a writeable tensor view with one axis per
+        qubit, making the data contiguous and writeable first if needed."""
+        if not (self._data.flags.c_contiguous and self._data.flags.writeable):
+            self._data = self._data.copy()
+        return self._data.reshape((2,) * self.num_qubits)
+
     @staticmethod
     def _evolve_instruction(statevec, obj, qargs=None):
         """Update the current Statevector by applying an instruction."""
@@ -977,6 +1060,11 @@ class Statevector(QuantumState, TolerancesMixin):
         # pylint: disable=cyclic-import
         from qiskit.circuit.library.data_preparation.initializer import Initialize
 
+        if statevec.num_qubits is not None and Statevector._evolve_kernel(
+            statevec, obj, qargs=qargs
+        ):
+            return statevec
+
         mat = Operator._instruction_to_matrix(obj)
         if mat is not None:
             # Perform the composition and inplace update the current state
@@ -1003,6 +1091,7 @@ class Statevector(QuantumState, TolerancesMixin):
             # state is initialized to the statevector
             else:
                 initialization = np.asarray(obj.params, dtype=complex)
+            initialization = initialization.astype(statevec._data.dtype, copy=False)
 
             if qargs is None:
                 statevec._data = initialization
@@ -19,14 +19,26 @@ CNOT gates. The object has a distance function that can be used to map quantum c
 onto a device with this coupling.
 """
 
+from __future__ import annotations
+
 import math
+from collections import OrderedDict
 from typing import List
 
+import numpy as np
 import rustworkx as rx
 from rustworkx.visualization import graphviz_draw
 
 from qiskit.transpiler.exceptions import CouplingError
 
+# Marks a structure missing from the shared cache, which may legitimately hold ``None``.
+_NOT_CACHED = object()
+
+# Above this number of qubits, `CouplingMap.distance` computes distances on demand with a
+# `DistanceOracle` rather than building the dense all-pairs distance matrix.  This matches
+# `DENSE_DISTANCE_MAX_QUBITS` in the Rust-space Sabre routing target.
+_DENSE_DISTANCE_MAX_QUBITS = 2048
+
 
 class CouplingMap:
     """
@@ -39,8 +51,10 @@ class CouplingMap:
 
     __slots__ = (
         "description",
-        "graph",
+        "_graph",
         "_dist_matrix",
+        "_distance_oracle",
+        "_shared_derived",
         "_qubit_list",
         "_size",
         "_is_symmetric",
@@ -62,6 +76,10 @@ class CouplingMap:
         self.graph = rx.PyDiGraph()
         # a dict of dicts from node pairs to distances
         self._dist_matrix = None
+        # on-demand distances, used instead of the dense matrix for large graphs
+        self._distance_oracle = None
+        # a cache of derived structures shared with other coupling maps of the same graph
+        self._shared_derived = None
         # a sorted list of physical qubits (integers) in this coupling map
         self._qubit_list = None
         # number of qubits in the graph
@@ -77,6 +95,25 @@ class CouplingMap:
             self._size = len(self.graph)
         return self._size
 
+    @property
+    def graph(self):
+        """The :class:`~rustworkx.PyDiGraph` of the coupling map.
+
+        Assigning a new graph discards everything computed from the previous one, such as the
+        :attr:`distance_matrix`.
+        """
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph):
+        self._graph = graph
+        self._dist_matrix = None  # invalidate
+        self._distance_oracle = None  # invalidate
+        self._shared_derived = None  # invalidate
+        self._qubit_list = None  # invalidate
+        self._size = None  # invalidate
+        self._is_symmetric = None  # invalidate
+
     def get_edges(self):
         """
         Gets the list of edges in the coupling graph.
@@ -105,6 +142,8 @@ class CouplingMap:
             )
         self.graph.add_node(physical_qubit)
         self._dist_matrix = None  # invalidate
+        self._distance_oracle = None  # invalidate
+        self._shared_derived = None  # invalidate
         self._qubit_list = None  # invalidate
         self._size = None  # invalidate
 
@@ -121,6 +160,8 @@ class CouplingMap:
             self.add_physical_qubit(dst)
         self.graph.add_edge(src, dst, None)
         self._dist_matrix = None  # invalidate
+        self._distance_oracle = None  # invalidate
+        self._shared_derived = None  # invalidate
         self._is_symmetric = None  # invalidate
 
     @property
@@ -170,13 +211,58 @@ class CouplingMap:
         those or want to pre-generate it.
         """
         if self._dist_matrix is None:
-            self._dist_matrix = rx.digraph_distance_matrix(
-                self.graph, as_undirected=True, null_value=math.inf
+            self._dist_matrix = self._get_shared_derived(
+                "distance_matrix", self._build_distance_matrix
+            )
+
+    def _build_distance_matrix(self):
+        dist_matrix = rx.digraph_distance_matrix(
+            self.graph, as_undirected=True, null_value=math.inf
+        )
+        if self._shared_derived is not None:
+            # The matrix is shared with other coupling maps, so must not be modified by any one.
+            dist_matrix.setflags(write=False)
+        return dist_matrix
+
+    def _get_shared_derived(self, key, build):
+        """Get the structure ``key`` derived from the graph from the shared cache, if this coupling
+        map has one (see :meth:`.Target.build_coupling_map`), building it with ``build()`` if
+        needed."""
+        if self._shared_derived is None:
+            return build()
+        if (out := self._shared_derived.get(key, _NOT_CACHED)) is _NOT_CACHED:
+            out = self._shared_derived[key] = build()
+        return out
+
+    def distance_oracle(self) -> DistanceOracle:
+        """Return the :class:`.DistanceOracle` of the coupling map.
+
+        The oracle computes the undirected distances from a physical qubit when they are first
+        needed, and keeps a bounded number of them cached, so it uses much less memory than the
+        dense :attr:`distance_matrix` for coupling maps with many qubits.
+        """
+        if self._distance_oracle is None:
+            self._distance_oracle = self._get_shared_derived(
+                "distance_oracle", lambda: DistanceOracle(self.graph)
             )
+        return self._distance_oracle
+
+    def _undirected_distance(self, physical_qubit1, physical_qubit2):
+        """Return the undirected distance between two physical qubits, or ``math.inf`` if there is
+        no path between them, from the dense distance matrix if it is (or should be) computed, and
+        from the distance oracle otherwise."""
+        if self._dist_matrix is None and self.size() > _DENSE_DISTANCE_MAX_QUBITS:
+            return self.distance_oracle().distance(physical_qubit1, physical_qubit2)
+        self.compute_distance_matrix()
+        return self._dist_matrix[physical_qubit1, physical_qubit2]
 
     def distance(self, physical_qubit1, physical_qubit2):
         """Returns the undirected distance between physical_qubit1 and physical_qubit2.
 
+        For coupling maps with more than a few thousand qubits, the distance is computed on
+        demand with the :meth:`distance_oracle`, unless the dense :attr:`distance_matrix` has
+        already been computed.
+
         Args:
             physical_qubit1 (int): A physical qubit
             physical_qubit2 (int): Another physical qubit
@@ -191,8 +277,7 @@ class CouplingMap:
             raise CouplingError(f"{physical_qubit1} not in coupling graph")
         if physical_qubit2 >= self.size():
             raise CouplingError(f"{physical_qubit2} not in coupling graph")
-        self.compute_distance_matrix()
-        res = self._dist_matrix[physical_qubit1, physical_qubit2]
+        res = self._undirected_distance(physical_qubit1, physical_qubit2)
         if res == math.inf:
             raise CouplingError(f"No path from {physical_qubit1} to {physical_qubit2}")
         return int(res)
@@ -240,6 +325,8 @@ class CouplingMap:
             if (dest, src) not in edge_set:
                 self.graph.add_edge(dest, src, None)
         self._dist_matrix = None  # invalidate
+        self._distance_oracle = None  # invalidate
+        self._shared_derived = None  # invalidate
         self._is_symmetric = None  # invalidate
 
     def _check_symmetry(self):
@@ -502,3 +589,101 @@ class CouplingMap:
         """
 
         return graphviz_draw(self.graph, method=method)
+
+
+class DistanceOracle:
+    """Lazily computed undirected distances between the physical qubits of a coupling graph.
+
+    The dense all-pairs distance matrix of :attr:`.CouplingMap.distance_matrix` takes memory and
+    time quadratic in the number of qubits, which dominates for coupling maps with many thousands
+    of qubits.  Instead, this computes the distances from a physical qubit to all the others with a
+    breadth-first search when they are first needed, and keeps at most ``max_rows`` of these rows
+    of the distance matrix in a least-recently-used cache.
+
+    Distances are only correct for the graph at the time the oracle was created; use
+    :meth:`.CouplingMap.distance_oracle` to get an oracle that is kept up to date with the
+    coupling map.
+    """
+
+    def __init__(self, graph: rx.PyDiGraph | rx.PyGraph, max_rows: int | None = 256):
+        """
+        Args:
+            graph: the coupling graph.  The direction of its edges is ignored.
+            max_rows: the maximum number of rows of the distance matrix to keep cached.  If
+                ``None``, all computed rows are kept.
+        """
+        if max_rows is not None and max_rows < 1:
+            raise CouplingError(f"The maximum number of cached rows must be positive: {max_rows}")
+        if isinstance(graph, rx.PyDiGraph):
+            graph = graph.to_undirected(multigraph=False)
+        self._graph = graph
+        self._num_qubits = max(self._graph.node_indices(), default=-1) + 1
+        self._max_rows = max_rows
+        self._rows = OrderedDict()
+
+    @property
+    def num_qubits(self) -> int:
+        """The number of physical qubits in the graph."""
+        return self._num_qubits
+
+    @property
+    def max_rows(self) -> int | None:
+        """The maximum number of rows of the distance matrix kept cached."""
+        return self._max_rows
+
+    @property
+    def num_cached_rows(self) -> int:
+        """The number of rows of the distance matrix currently cached."""
+        return len(self._rows)
+
+    def distances_from(self, physical_qubit: int) -> np.ndarray:
+        """Return the undirected distances from a physical qubit to all the physical qubits.
+
+        Args:
+            physical_qubit: the source physical qubit.
+
+        Returns:
+            A read-only ``float64`` array of length :attr:`num_qubits`, whose entries are the
+            distances from ``physical_qubit``, or ``math.inf`` for qubits not connected to it.
+
+        Raises:
+            CouplingError: if the physical qubit is not in the graph.
+        """
+        row = self._rows.get(physical_qubit)
+        if row is not None:
+            self._rows.move_to_end(physical_qubit)
+            return row
+        if not 0 <= physical_qubit < self._num_qubits or not self._graph.has_node(physical_qubit):
+            raise CouplingError(f"{physical_qubit} not in coupling graph")
+        row = np.full(self._num_qubits, math.inf)
+        for distance, layer in enumerate(rx.bfs_layers(self._graph, [physical_qubit])):
+            row[layer] = distance
+        row.setflags(write=False)
+        self._rows[physical_qubit] = row
+        if self._max_rows is not None and len(self._rows) > self._max_rows:
+            self._rows.popitem(last=False)
+        return row
+
+    def distance(self, physical_qubit1: int, physical_qubit2: int) -> float:
+        """Return the undirected distance between two physical qubits.
+
+        Args:
+            physical_qubit1: a physical qubit.
+            physical_qubit2: another physical qubit.
+
+        Returns:
+            The distance, or ``math.inf`` if there is no path between the qubits.
+
+        Raises:
+            CouplingError: if either physical qubit is not in the graph.
+        """
+        # Distances are symmetric, so reuse the row of either qubit if it is already cached.
+        if physical_qubit2 in self._rows and physical_qubit1 not in self._rows:
+            physical_qubit1, physical_qubit2 = physical_qubit2, physical_qubit1
+        if not 0 <= physical_qubit2 < self._num_qubits:
+            raise CouplingError(f"{physical_qubit2} not in coupling graph")
+        return self.distances_from(physical_qubit1)[physical_qubit2]
+
+    def clear(self):
+        """Remove all the cached rows."""
+        self._rows.clear()
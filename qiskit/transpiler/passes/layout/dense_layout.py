@@ -168,22 +168,12 @@ def _build_error_matrix(num_qubits, qubit_map, target=None):
     error_mat = np.zeros((num_qubits, num_qubits))
     use_error = False
     if target is not None and target.qargs is not None:
-        for qargs in target.qargs:
-            # Ignore gates over 2q DenseLayout only works with 2q
-            if len(qargs) > 2:
-                continue
-            error = 0.0
-            ops = target.operation_names_for_qargs(qargs)
-            for op in ops:
-                props = target[op].get(qargs, None)
-                if props is not None and props.error is not None:
-                    # Use max error rate to represent operation error
-                    # on a qubit(s). If there is more than 1 operation available
-                    # we don't know what will be used on the qubits eventually
-                    # so we take the highest error operation as a proxy for
-                    # the possible worst case.
-                    error = max(error, props.error)
-            max_error = error
+        qargs_errors = target._derived(
+            "dense_layout_qargs_errors",
+            lambda: _build_qargs_errors(target),
+            uses_properties=True,
+        )
+        for qargs, max_error in qargs_errors:
             if any(qubit not in qubit_map for qubit in qargs):
                 continue
             # TODO: Factor in T1 and T2 to error matrix after #7736
@@ -195,3 +185,24 @@ def _build_error_matrix(num_qubits, qubit_map, target=None):
                 error_mat[qubit_map[qargs[0]]][qubit_map[qargs[1]]] = max_error
                 use_error = True
     return error_mat, use_error
+
+
+def _build_qargs_errors(target):
+    qargs_errors = []
+    for qargs in target.qargs:
+        # Ignore gates over 2q DenseLayout only works with 2q
+        if len(qargs) > 2:
+            continue
+        error = 0.0
+        ops = target.operation_names_for_qargs(qargs)
+        for op in ops:
+            props = target[op].get(qargs, None)
+            if props is not None and props.error is not None:
+                # Use max error rate to represent operation error
+                # on a qubit(s). If there is more than 1 operation available
+                # we don't know what will be used on the qubits eventually
+                # so we take the highest error operation as a proxy for
+                # the possible worst case.
+                error = max(error, props.error)
+        qargs_errors.append((qargs, error))
+    return tuple(qargs_errors)
@@ -62,16 +62,14 @@ class Layout2qDistance(AnalysisPass):
             self.property_set[self.property_name] = 0
             return
 
-        self.coupling_map.compute_distance_matrix()
-
         sum_distance = 0
 
         virtual_physical_map = layout.get_virtual_bits()
-        dist_matrix = self.coupling_map.distance_matrix
         for gate in dag.two_qubit_ops():
             physical_q0 = virtual_physical_map[gate.qargs[0]]
             physical_q1 = virtual_physical_map[gate.qargs[1]]
 
-            sum_distance += dist_matrix[physical_q0, physical_q1] - 1
+            # This uses on-demand distances rather than the dense matrix for large coupling maps.
+            sum_distance += self.coupling_map._undirected_distance(physical_q0, physical_q1) - 1
 
         self.property_set[self.property_name] = sum_distance
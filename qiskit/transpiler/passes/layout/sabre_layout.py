@@ -109,6 +109,7 @@ class SabreLayout(TransformationPass):
         swap_trials=None,
         layout_trials=None,
         skip_routing=False,
+        time_limit=None,
     ):
         """SabreLayout initializer.
 
@@ -147,6 +148,20 @@ class SabreLayout(TransformationPass):
                 will be set in the property set. This is a tradeoff to run custom
                 routing with multiple layout trials, as using this option will cause
                 SabreLayout to run the routing stage internally but not use that result.
+            time_limit (float): An optional wall-clock budget, in seconds, for the layout
+                trials.  If set, each random layout trial checks the budget just before it
+                starts, and is skipped if the budget is already spent, and the result with the
+                fewest swaps of the trials that did run is used.  The first random trial and the
+                trials from the common layouts and ``sabre_starting_layouts`` always run, and
+                trials that have started are run to completion, so the budget can be exceeded by
+                roughly the duration of a single trial.  This option is mutually exclusive with
+                the ``routing_pass`` argument.
+
+                .. warning::
+                    With a ``time_limit``, the number of trials that are run depends on how fast
+                    the machine is and on how loaded it is, so the output is no longer determined
+                    by ``seed`` alone, and may differ between runs.  Leave this as ``None`` if you
+                    need reproducible results.
 
         Raises:
             TranspilerError: If both ``routing_pass`` and ``swap_trials`` or
@@ -172,12 +187,15 @@ class SabreLayout(TransformationPass):
                 self._coupling_map.make_symmetric()
         if routing_pass is not None and (swap_trials is not None or layout_trials is not None):
             raise TranspilerError("Both routing_pass and swap_trials can't be set at the same time")
+        if routing_pass is not None and time_limit is not None:
+            raise TranspilerError("Both routing_pass and time_limit can't be set at the same time")
         self.routing_pass = routing_pass
         self.seed = seed
         self.max_iterations = max_iterations
         self.swap_trials = default_num_processes() if swap_trials is None else swap_trials
         self.layout_trials = default_num_processes() if layout_trials is None else layout_trials
         self.skip_routing = skip_routing
+        self.time_limit = time_limit
 
     @property
     def coupling_map(self):  # pylint: disable=missing-function-docstring
@@ -281,6 +299,7 @@ class SabreLayout(TransformationPass):
             seed=self.seed,
             partial_layouts=starting_layouts,
             skip_routing=self.skip_routing,
+            time_limit=self.time_limit,
         )
         sabre_stop = time.perf_counter()
         logger.debug(
@@ -21,6 +21,7 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.target import Target
 from qiskit._accelerate.vf2_layout import (
     vf2_layout_pass_average,
+    build_average_error_map,
     MultiQEncountered,
     VF2PassConfiguration,
 )
@@ -144,6 +145,13 @@ class VF2Layout(AnalysisPass):
             else:
                 target = self.target
         self.avg_error_map = self.property_set["vf2_avg_error_map"]
+        avg_error_map = self.avg_error_map
+        if avg_error_map is None:
+            avg_error_map = target._derived(
+                "vf2_avg_error_map",
+                lambda: build_average_error_map(target),
+                uses_properties=True,
+            )
         config = VF2PassConfiguration.from_legacy_api(
             call_limit=self.call_limit,
             time_limit=self.time_limit,
@@ -156,7 +164,7 @@ class VF2Layout(AnalysisPass):
                 dag,
                 target,
                 strict_direction=self.strict_direction,
-                avg_error_map=self.avg_error_map,
+                avg_error_map=avg_error_map,
                 config=config,
             )
         except MultiQEncountered:
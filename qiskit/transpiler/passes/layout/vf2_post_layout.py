@@ -14,12 +14,16 @@
 """VF2PostLayout pass to find a layout after transpile using subgraph isomorphism"""
 
 from enum import Enum
+import time
+
+import numpy as np
 
 from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit._accelerate.vf2_layout import (
     vf2_layout_pass_average,
+    build_average_error_map,
     vf2_layout_pass_exact,
     MultiQEncountered,
     VF2PassConfiguration,
@@ -91,6 +95,8 @@ class VF2PostLayout(AnalysisPass):
         time_limit=None,
         strict_direction=True,
         max_trials=0,
+        restarts=0,
+        root_shards=1,
     ):
         """Initialize a ``VF2PostLayout`` pass instance
 
@@ -112,6 +118,19 @@ class VF2PostLayout(AnalysisPass):
                 the target set of instructions.
             max_trials (int): The maximum number of trials to run VF2 to find
                 a layout. A value of ``0`` (the default) means 'unlimited'.
+            restarts (int): The number of additional VF2 searches to run after the first one.
+                Each restart starts from the best layout found so far, so the search prunes any
+                partial layout whose score is already no better than it, and explores the
+                coupling graph in a different random node order (drawn from ``seed``), so it
+                can find improvements that the previous searches did not reach within their
+                ``call_limit``.  The ``time_limit`` applies to all the searches together.
+            root_shards (int): The number of parts to split each VF2 search into, by the physical
+                qubit that the first virtual qubit in the search order is mapped to.  With more
+                than one part, the parts are searched in parallel threads, and the best score
+                found by any of them is shared with all of them at regular intervals, so each
+                part prunes the layouts that cannot improve on the best one so far.  The result
+                depends only on ``seed`` and ``root_shards``, not on the number of threads.  The
+                ``call_limit`` and ``max_trials`` apply to each part separately.
 
         Raises:
             TypeError: At runtime, if ``target`` isn't provided.
@@ -123,6 +142,8 @@ class VF2PostLayout(AnalysisPass):
         self.max_trials = max_trials
         self.seed = seed
         self.strict_direction = strict_direction
+        self.restarts = restarts
+        self.root_shards = root_shards
         self.avg_error_map = None
 
     def run(self, dag):
@@ -130,24 +151,9 @@ class VF2PostLayout(AnalysisPass):
         if self.target is None:
             raise TranspilerError("A target must be specified")
         self.avg_error_map = self.property_set["vf2_avg_error_map"]
-        config = VF2PassConfiguration.from_legacy_api(
-            call_limit=self.call_limit,
-            time_limit=self.time_limit,
-            max_trials=self.max_trials,
-            shuffle_seed=self.seed,
-            score_initial_layout=True,
-        )
+        start = time.perf_counter()
         try:
-            if self.strict_direction:
-                output = vf2_layout_pass_exact(dag, self.target, config=config)
-            else:
-                output = vf2_layout_pass_average(
-                    dag,
-                    self.target,
-                    strict_direction=False,
-                    avg_error_map=self.avg_error_map,
-                    config=config,
-                )
+            output = self._search(dag, self.seed, self.time_limit)
         except MultiQEncountered:
             self.property_set["VF2PostLayout_stop_reason"] = VF2PostLayoutStopReason.MORE_THAN_2Q
             return
@@ -156,7 +162,7 @@ class VF2PostLayout(AnalysisPass):
                 VF2PostLayoutStopReason.NO_SOLUTION_FOUND
             )
             return
-        if dag.is_empty() or (layout := output.new_mapping()) is None:
+        if dag.is_empty() or (layout := self._restart(dag, output.new_mapping(), start)) is None:
             self.property_set["VF2PostLayout_stop_reason"] = (
                 VF2PostLayoutStopReason.NO_BETTER_SOLUTION_FOUND
             )
@@ -166,3 +172,75 @@ class VF2PostLayout(AnalysisPass):
         for reg in dag.qregs.values():
             layout.add_register(reg)
         self.property_set["post_layout"] = layout
+
+    def _search(self, dag, seed, time_limit):
+        config = VF2PassConfiguration.from_legacy_api(
+            call_limit=self.call_limit,
+            time_limit=time_limit,
+            max_trials=self.max_trials,
+            shuffle_seed=seed,
+            score_initial_layout=True,
+            root_shards=self.root_shards,
+        )
+        if self.strict_direction:
+            return vf2_layout_pass_exact(dag, self.target, config=config)
+        avg_error_map = self.avg_error_map
+        if avg_error_map is None:
+            avg_error_map = self.target._derived(
+                "vf2_avg_error_map",
+                lambda: build_average_error_map(self.target),
+                uses_properties=True,
+            )
+        return vf2_layout_pass_average(
+            dag,
+            self.target,
+            strict_direction=False,
+            avg_error_map=avg_error_map,
+            config=config,
+        )
+
+    def _restart(self, dag, mapping, start):
+        """Run the ``restarts`` further searches, each from the best layout found so far, and
+        return the best mapping of the qubits of ``dag``, or ``None`` if nothing improved on the
+        input layout."""
+        if not self.restarts:
+            return mapping
+        rng = np.random.default_rng(None if self.seed is None or self.seed < 0 else self.seed)
+        for _ in range(self.restarts):
+            time_limit = None
+            if self.time_limit is not None:
+                if (time_limit := self.time_limit - (time.perf_counter() - start)) <= 0:
+                    break
+            # The identity layout of the relabelled circuit is the best layout so far, which the
+            # search scores first and then uses as the bound for pruning.
+            current = dag if mapping is None else _relabel(dag, mapping)
+            output = self._search(current, int(rng.integers(np.iinfo(np.int64).max)), time_limit)
+            if (new_mapping := output.new_mapping()) is None:
+                continue
+            if mapping is None:
+                mapping = new_mapping
+            else:
+                # The mappings may leave out idle qubits, which stay idle after relabelling.
+                mapping = {
+                    virt: new_mapping[phys] for virt, phys in mapping.items() if phys in new_mapping
+                }
+        return mapping
+
+
+def _relabel(dag, mapping):
+    """Return a copy of ``dag`` with each qubit index ``i`` moved to ``mapping[i]``.
+
+    Qubits that are not in ``mapping`` are moved to the indices that are not used by it, in
+    order."""
+    qubits = dag.qubits
+    unused = iter(sorted(set(range(len(qubits))).difference(mapping.values())))
+    new_qubits = {
+        qubit: qubits[mapping[i] if i in mapping else next(unused)]
+        for i, qubit in enumerate(qubits)
+    }
+    out = dag.copy_empty_like()
+    for node in dag.topological_op_nodes():
+        out.apply_operation_back(
+            node.op, tuple(new_qubits[q] for q in node.qargs), node.cargs, check=False
+        )
+    return out
@@ -139,8 +139,10 @@ class BackwardMatch:
             heuristics_backward_param (list): list that contains the two parameters for
             applying the heuristics (length and survivor).
         """
-        self.circuit_dag_dep = circuit_dag_dep.copy()
-        self.template_dag_dep = template_dag_dep.copy()
+        # The backward match only reads the attributes set by the forward match, so the DAGs do
+        # not need to be copied.
+        self.circuit_dag_dep = circuit_dag_dep
+        self.template_dag_dep = template_dag_dep
         self.qubits = qubits
         self.clbits = clbits if clbits is not None else []
         self.node_id_c = node_id_c
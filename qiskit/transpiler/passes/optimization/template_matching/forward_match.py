@@ -33,7 +33,15 @@ class ForwardMatch:
     """
 
     def __init__(
-        self, circuit_dag_dep, template_dag_dep, node_id_c, node_id_t, qubits, clbits=None
+        self,
+        circuit_dag_dep,
+        template_dag_dep,
+        node_id_c,
+        node_id_t,
+        qubits,
+        clbits=None,
+        *,
+        copy_dags=True,
     ):
         """
         Create a ForwardMatch class with necessary arguments.
@@ -44,13 +52,17 @@ class ForwardMatch:
             node_id_t (int): index of the first gate matched in the template.
             qubits (list): list of considered qubits in the circuit.
             clbits (list): list of considered clbits in the circuit.
+            copy_dags (bool): if ``False``, the matching attributes are set directly on the nodes
+                of the given DAGs rather than on copies of them.  All the attributes read by the
+                algorithm are reset when it runs, so the same DAGs can be reused for successive
+                forward matches, as long as the results of a match are consumed before the next.
         """
 
         # The dag dependency representation of the circuit
-        self.circuit_dag_dep = circuit_dag_dep.copy()
+        self.circuit_dag_dep = circuit_dag_dep.copy() if copy_dags else circuit_dag_dep
 
         # The dag dependency representation of the template
-        self.template_dag_dep = template_dag_dep.copy()
+        self.template_dag_dep = template_dag_dep.copy() if copy_dags else template_dag_dep
 
         # List of qubit on which the node of the circuit is acting on
         self.qubits = qubits
@@ -23,6 +23,7 @@ Exact and practical pattern matching for quantum circuit optimization.
 
 """
 
+import collections
 import itertools
 
 from qiskit.circuit.controlledgate import ControlledGate
@@ -41,6 +42,7 @@ class TemplateMatching:
         template_dag_dep,
         heuristics_qubits_param=None,
         heuristics_backward_param=None,
+        max_candidates=None,
     ):
         """
         Create a TemplateMatching object with necessary arguments.
@@ -49,6 +51,10 @@ class TemplateMatching:
             template_dag_dep (QuantumCircuit): template.
             heuristics_backward_param (list[int]): [length, survivor]
             heuristics_qubits_param (list[int]): [length]
+            max_candidates (int): the maximum number of candidates, that is of pairs of a first
+                match and a qubit configuration, for which the forward and backward matches are
+                run.  Once it is reached the matching stops, and only the matches found so far are
+                kept.  If ``None`` (the default), all candidates are explored.
         """
         self.circuit_dag_dep = circuit_dag_dep
         self.template_dag_dep = template_dag_dep
@@ -59,6 +65,9 @@ class TemplateMatching:
         self.heuristics_backward_param = (
             heuristics_backward_param if heuristics_backward_param is not None else []
         )
+        self.max_candidates = max_candidates
+        # Map of each match in ``match_list`` (as a tuple of pairs) to its index in the list.
+        self._match_index = {}
 
     def _list_first_match_new(self, node_circuit, node_template, n_qubits_t, n_clbits_t):
         """
@@ -177,13 +186,14 @@ class TemplateMatching:
         already_in = False
 
         for b_match in backward_match_list:
-            for l_match in self.match_list:
-                if b_match.match == l_match.match:
-                    index = self.match_list.index(l_match)
-                    self.match_list[index].qubit.append(b_match.qubit[0])
-                    already_in = True
+            key = tuple(tuple(pair) for pair in b_match.match)
+            index = self._match_index.get(key)
+            if index is not None:
+                self.match_list[index].qubit.append(b_match.qubit[0])
+                already_in = True
 
             if not already_in:
+                self._match_index[key] = len(self.match_list)
                 self.match_list.append(b_match)
 
     def _explore_circuit(self, node_id_c, node_id_t, n_qubits_t, length):
@@ -232,16 +242,15 @@ class TemplateMatching:
                     return list(qubit_set)
             return list(qubit_set)
 
-    def run_template_matching(self):
-        """
-        Run the complete algorithm for finding all maximal matches for the given template and
-        circuit. First it fixes the configuration of the circuit due to the first match.
-        Then it explores all compatible qubit configurations of the circuit. For each
-        qubit configurations, we apply first the Forward part of the algorithm  and then
-        the Backward part of the algorithm. The longest matches for the given configuration
-        are stored. Finally, the list of stored matches is sorted.
+    def _candidates(self):
         """
+        Generate the candidates to run the forward and backward matches on, in order.
 
+        Yields:
+            tuple: the ids of the first matched nodes in the circuit and in the template, and the
+            lists of circuit qubits and clbits of the configuration (the latter is ``None`` if the
+            circuit has no clbits).
+        """
         # Get the number of qubits/clbits for both circuit and template.
         n_qubits_c = len(self.circuit_dag_dep.qubits)
         n_clbits_c = len(self.circuit_dag_dep.clbits)
@@ -249,122 +258,134 @@ class TemplateMatching:
         n_qubits_t = len(self.template_dag_dep.qubits)
         n_clbits_t = len(self.template_dag_dep.clbits)
 
+        # Operations can only match if their names are equal, so group the circuit nodes by name
+        # rather than comparing every pair of circuit and template nodes.
+        circuit_nodes_by_name = collections.defaultdict(list)
+        for circuit_index in range(0, self.circuit_dag_dep.size()):
+            circuit_nodes_by_name[self.circuit_dag_dep.get_node(circuit_index).name].append(
+                circuit_index
+            )
+
         # Loop over the indices of both template and circuit.
         for template_index in range(0, self.template_dag_dep.size()):
-            for circuit_index in range(0, self.circuit_dag_dep.size()):
+            node_template = self.template_dag_dep.get_node(template_index)
+            for circuit_index in circuit_nodes_by_name.get(node_template.name, ()):
+                node_circuit = self.circuit_dag_dep.get_node(circuit_index)
                 # Operations match up to ParameterExpressions.
-                if self.circuit_dag_dep.get_node(circuit_index).op.soft_compare(
-                    self.template_dag_dep.get_node(template_index).op
-                ):
+                if not node_circuit.op.soft_compare(node_template.op):
+                    continue
 
-                    qarg_c = self.circuit_dag_dep.get_node(circuit_index).qindices
-                    carg_c = self.circuit_dag_dep.get_node(circuit_index).cindices
+                qarg_c = node_circuit.qindices
+                carg_c = node_circuit.cindices
 
-                    qarg_t = self.template_dag_dep.get_node(template_index).qindices
-                    carg_t = self.template_dag_dep.get_node(template_index).cindices
+                qarg_t = node_template.qindices
+                carg_t = node_template.cindices
 
-                    node_id_c = circuit_index
-                    node_id_t = template_index
+                node_id_c = circuit_index
+                node_id_t = template_index
 
-                    # Fix the qubits and clbits configuration given the first match.
+                # Fix the qubits and clbits configuration given the first match.
 
-                    all_list_first_match_q, list_first_match_c = self._list_first_match_new(
-                        self.circuit_dag_dep.get_node(circuit_index),
-                        self.template_dag_dep.get_node(template_index),
-                        n_qubits_t,
-                        n_clbits_t,
-                    )
+                all_list_first_match_q, list_first_match_c = self._list_first_match_new(
+                    node_circuit,
+                    node_template,
+                    n_qubits_t,
+                    n_clbits_t,
+                )
+
+                list_circuit_q = list(range(0, n_qubits_c))
+                list_circuit_c = list(range(0, n_clbits_c))
+
+                # If the parameter for qubits heuristics is given then extracts
+                # the list of qubits for the successors (length(int)) in the circuit.
 
-                    list_circuit_q = list(range(0, n_qubits_c))
-                    list_circuit_c = list(range(0, n_clbits_c))
-
-                    # If the parameter for qubits heuristics is given then extracts
-                    # the list of qubits for the successors (length(int)) in the circuit.
-
-                    if self.heuristics_qubits_param:
-                        heuristics_qubits = self._explore_circuit(
-                            node_id_c, node_id_t, n_qubits_t, self.heuristics_qubits_param[0]
-                        )
-                    else:
-                        heuristics_qubits = []
-
-                    for sub_q in self._sublist(list_circuit_q, qarg_c, n_qubits_t - len(qarg_t)):
-                        # If the heuristics qubits are a subset of the given qubits configuration,
-                        # then this configuration is accepted.
-                        if set(heuristics_qubits).issubset(set(sub_q) | set(qarg_c)):
-                            # Permute the qubit configuration.
-                            for perm_q in itertools.permutations(sub_q):
-                                perm_q = list(perm_q)
-                                for list_first_match_q in all_list_first_match_q:
-                                    list_qubit_circuit = self._list_qubit_clbit_circuit(
-                                        list_first_match_q, perm_q
+                if self.heuristics_qubits_param:
+                    heuristics_qubits = self._explore_circuit(
+                        node_id_c, node_id_t, n_qubits_t, self.heuristics_qubits_param[0]
+                    )
+                else:
+                    heuristics_qubits = []
+
+                for sub_q in self._sublist(list_circuit_q, qarg_c, n_qubits_t - len(qarg_t)):
+                    # If the heuristics qubits are a subset of the given qubits configuration,
+                    # then this configuration is accepted.
+                    if not set(heuristics_qubits).issubset(set(sub_q) | set(qarg_c)):
+                        continue
+                    # Permute the qubit configuration.
+                    for perm_q in itertools.permutations(sub_q):
+                        perm_q = list(perm_q)
+                        for list_first_match_q in all_list_first_match_q:
+                            list_qubit_circuit = self._list_qubit_clbit_circuit(
+                                list_first_match_q, perm_q
+                            )
+
+                            # Check for clbits configurations if there are clbits.
+                            if not list_circuit_c:
+                                yield node_id_c, node_id_t, list_qubit_circuit, None
+                                continue
+                            for sub_c in self._sublist(
+                                list_circuit_c, carg_c, n_clbits_t - len(carg_t)
+                            ):
+                                for perm_c in itertools.permutations(sub_c):
+                                    perm_c = list(perm_c)
+
+                                    list_clbit_circuit = self._list_qubit_clbit_circuit(
+                                        list_first_match_c, perm_c
+                                    )
+                                    yield (
+                                        node_id_c,
+                                        node_id_t,
+                                        list_qubit_circuit,
+                                        list_clbit_circuit,
                                     )
 
-                                    # Check for clbits configurations if there are clbits.
-                                    if list_circuit_c:
-                                        for sub_c in self._sublist(
-                                            list_circuit_c, carg_c, n_clbits_t - len(carg_t)
-                                        ):
-                                            for perm_c in itertools.permutations(sub_c):
-                                                perm_c = list(perm_c)
-
-                                                list_clbit_circuit = self._list_qubit_clbit_circuit(
-                                                    list_first_match_c, perm_c
-                                                )
-
-                                                # Apply the forward match part of the algorithm.
-                                                forward = ForwardMatch(
-                                                    self.circuit_dag_dep,
-                                                    self.template_dag_dep,
-                                                    node_id_c,
-                                                    node_id_t,
-                                                    list_qubit_circuit,
-                                                    list_clbit_circuit,
-                                                )
-                                                forward.run_forward_match()
-
-                                                # Apply the backward match part of the algorithm.
-                                                backward = BackwardMatch(
-                                                    forward.circuit_dag_dep,
-                                                    forward.template_dag_dep,
-                                                    forward.match,
-                                                    node_id_c,
-                                                    node_id_t,
-                                                    list_qubit_circuit,
-                                                    list_clbit_circuit,
-                                                    self.heuristics_backward_param,
-                                                )
-
-                                                backward.run_backward_match()
-
-                                                # Add the matches to the list.
-                                                self._add_match(backward.match_final)
-                                    else:
-                                        # Apply the forward match part of the algorithm.
-                                        forward = ForwardMatch(
-                                            self.circuit_dag_dep,
-                                            self.template_dag_dep,
-                                            node_id_c,
-                                            node_id_t,
-                                            list_qubit_circuit,
-                                        )
-                                        forward.run_forward_match()
-
-                                        # Apply the backward match part of the algorithm.
-                                        backward = BackwardMatch(
-                                            forward.circuit_dag_dep,
-                                            forward.template_dag_dep,
-                                            forward.match,
-                                            node_id_c,
-                                            node_id_t,
-                                            list_qubit_circuit,
-                                            [],
-                                            self.heuristics_backward_param,
-                                        )
-                                        backward.run_backward_match()
-
-                                        # Add the matches to the list.
-                                        self._add_match(backward.match_final)
+    def run_template_matching(self):
+        """
+        Run the complete algorithm for finding all maximal matches for the given template and
+        circuit. First it fixes the configuration of the circuit due to the first match.
+        Then it explores all compatible qubit configurations of the circuit. For each
+        qubit configurations, we apply first the Forward part of the algorithm  and then
+        the Backward part of the algorithm. The longest matches for the given configuration
+        are stored. Finally, the list of stored matches is sorted.
+        """
+        # The forward match sets its attributes on the nodes of the DAGs, and the backward match
+        # only reads them, so a single working copy of each DAG is shared by all the candidates
+        # rather than copying the DAGs for each of them.
+        circuit_dag_dep = self.circuit_dag_dep.copy()
+        template_dag_dep = self.template_dag_dep.copy()
+
+        for num_candidates, candidate in enumerate(self._candidates()):
+            if self.max_candidates is not None and num_candidates >= self.max_candidates:
+                break
+            node_id_c, node_id_t, list_qubit_circuit, list_clbit_circuit = candidate
+
+            # Apply the forward match part of the algorithm.
+            forward = ForwardMatch(
+                circuit_dag_dep,
+                template_dag_dep,
+                node_id_c,
+                node_id_t,
+                list_qubit_circuit,
+                list_clbit_circuit,
+                copy_dags=False,
+            )
+            forward.run_forward_match()
+
+            # Apply the backward match part of the algorithm.
+            backward = BackwardMatch(
+                forward.circuit_dag_dep,
+                forward.template_dag_dep,
+                forward.match,
+                node_id_c,
+                node_id_t,
+                list_qubit_circuit,
+                list_clbit_circuit if list_clbit_circuit is not None else [],
+                self.heuristics_backward_param,
+            )
+            backward.run_backward_match()
+
+            # Add the matches to the list.
+            self._add_match(backward.match_final)
 
         # Sort the list of matches according to the length of the matches (decreasing order).
         self.match_list.sort(key=lambda x: len(x.match), reverse=True)
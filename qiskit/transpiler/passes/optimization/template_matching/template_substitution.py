@@ -25,6 +25,48 @@ from qiskit.converters.dagdependency_to_dag import dagdependency_to_dag
 from qiskit.utils import optionals as _optionals
 
 
+# The default quantum cost of each gate, used to decide whether a match is worth substituting.
+DEFAULT_COST_DICT = {
+    "id": 0,
+    "x": 1,
+    "y": 1,
+    "z": 1,
+    "h": 1,
+    "t": 1,
+    "tdg": 1,
+    "s": 1,
+    "sdg": 1,
+    "u1": 1,
+    "u2": 2,
+    "u3": 2,
+    "rx": 1,
+    "ry": 1,
+    "rz": 1,
+    "r": 2,
+    "cx": 2,
+    "cy": 4,
+    "cz": 4,
+    "ch": 8,
+    "swap": 6,
+    "iswap": 8,
+    "rxx": 9,
+    "ryy": 9,
+    "rzz": 5,
+    "rzx": 7,
+    "ms": 9,
+    "cu3": 10,
+    "crx": 10,
+    "cry": 10,
+    "crz": 10,
+    "ccx": 21,
+    "rccx": 12,
+    "c3x": 96,
+    "rc3x": 24,
+    "c4x": 312,
+    "p": 1,
+}
+
+
 class SubstitutionConfig:
     """
     Class to store the configuration of a given match substitution, which circuit
@@ -87,45 +129,7 @@ class TemplateSubstitution:
         if user_cost_dict is not None:
             self.cost_dict = dict(user_cost_dict)
         else:
-            self.cost_dict = {
-                "id": 0,
-                "x": 1,
-                "y": 1,
-                "z": 1,
-                "h": 1,
-                "t": 1,
-                "tdg": 1,
-                "s": 1,
-                "sdg": 1,
-                "u1": 1,
-                "u2": 2,
-                "u3": 2,
-                "rx": 1,
-                "ry": 1,
-                "rz": 1,
-                "r": 2,
-                "cx": 2,
-                "cy": 4,
-                "cz": 4,
-                "ch": 8,
-                "swap": 6,
-                "iswap": 8,
-                "rxx": 9,
-                "ryy": 9,
-                "rzz": 5,
-                "rzx": 7,
-                "ms": 9,
-                "cu3": 10,
-                "crx": 10,
-                "cry": 10,
-                "crz": 10,
-                "ccx": 21,
-                "rccx": 12,
-                "c3x": 96,
-                "rc3x": 24,
-                "c4x": 312,
-                "p": 1,
-            }
+            self.cost_dict = dict(DEFAULT_COST_DICT)
 
     def _pred_block(self, circuit_sublist, index):
         """
@@ -20,6 +20,8 @@ all compatible maximal matches that reduces the size of the circuit.
 Exact and practical pattern matching for quantum circuit optimization.
 `arXiv:1909.05270 <https://arxiv.org/abs/1909.05270>`_
 """
+from collections import Counter
+
 import numpy as np
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
@@ -37,6 +39,9 @@ from qiskit.transpiler.passes.optimization.template_matching import (
     TemplateSubstitution,
     MaximalMatches,
 )
+from qiskit.transpiler.passes.optimization.template_matching.template_substitution import (
+    DEFAULT_COST_DICT,
+)
 
 
 class TemplateOptimization(TransformationPass):
@@ -50,6 +55,7 @@ class TemplateOptimization(TransformationPass):
         heuristics_qubits_param=None,
         heuristics_backward_param=None,
         user_cost_dict=None,
+        max_candidates=None,
     ):
         """
         Args:
@@ -71,6 +77,11 @@ class TemplateOptimization(TransformationPass):
             user_cost_dict (Dict[str, int]): quantum cost dictionary passed to TemplateSubstitution
                 to configure its behavior. This will override any default values if None
                 is not given. The key is the name of the gate and the value its quantum cost.
+            max_candidates (int): the maximum number of candidate matches, that is of pairs of a
+                first matched gate and a qubit configuration, explored for each template.  Once
+                it is reached, only the matches found so far are substituted.  This bounds the
+                run time of the pass on large circuits, at the cost of possibly missing some
+                matches.  If ``None`` (the default), all the candidates are explored.
         """
         super().__init__()
         # If no template is given; the template are set as x-x, cx-cx, ccx-ccx.
@@ -85,6 +96,7 @@ class TemplateOptimization(TransformationPass):
         )
 
         self.user_cost_dict = user_cost_dict
+        self.max_candidates = max_candidates
 
     def run(self, dag):
         """
@@ -127,11 +139,15 @@ class TemplateOptimization(TransformationPass):
             else:
                 template_dag_dep = template
 
+            if not self._can_reduce_cost(circuit_dag_dep, template_dag_dep):
+                continue
+
             template_m = TemplateMatching(
                 circuit_dag_dep,
                 template_dag_dep,
                 self.heuristics_qubits_param,
                 self.heuristics_backward_param,
+                max_candidates=self.max_candidates,
             )
 
             template_m.run_template_matching()
@@ -156,3 +172,22 @@ class TemplateOptimization(TransformationPass):
                 continue
         circuit_dag = dagdependency_to_dag(circuit_dag_dep)
         return circuit_dag
+
+    def _can_reduce_cost(self, circuit_dag_dep, template_dag_dep):
+        """Return ``False`` if no match of the template in the circuit can be substituted.
+
+        A match is only substituted if the cost of its matched template gates is larger than the
+        cost of the rest of the template.  Gates only match gates with the same name, so the gate
+        counts of the template and of the circuit bound the cost of any match, which allows
+        skipping templates that cannot reduce the cost of the circuit without matching them."""
+        cost_dict = self.user_cost_dict if self.user_cost_dict is not None else DEFAULT_COST_DICT
+        template_counts = Counter(node.name for node in template_dag_dep.get_nodes())
+        if any(name not in cost_dict or cost_dict[name] < 0 for name in template_counts):
+            return True
+        circuit_counts = Counter(node.name for node in circuit_dag_dep.get_nodes())
+        total_cost = 0
+        max_matched_cost = 0
+        for name, count in template_counts.items():
+            total_cost += count * cost_dict[name]
+            max_matched_cost += min(count, circuit_counts[name]) * cost_dict[name]
+        return max_matched_cost > total_cost - max_matched_cost
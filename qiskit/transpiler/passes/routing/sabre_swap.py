@@ -71,7 +71,15 @@ class SabreSwap(TransformationPass):
     `arXiv:1809.02573 <https://arxiv.org/pdf/1809.02573.pdf>`_
     """
 
-    def __init__(self, coupling_map, heuristic="basic", seed=None, fake_run=False, trials=None):
+    def __init__(
+        self,
+        coupling_map,
+        heuristic="basic",
+        seed=None,
+        fake_run=False,
+        trials=None,
+        window_size=None,
+    ):
         r"""SabreSwap initializer.
 
         Args:
@@ -87,9 +95,16 @@ class SabreSwap(TransformationPass):
                 CPUs on the local system. For reproducible results it is recommended
                 that you set this explicitly, as the output will be deterministic for
                 a fixed number of trials.
+            window_size (int): If set, route the circuit in consecutive topological windows
+                that each contain at most this many operations on two or more qubits, rather
+                than all at once.  The layout at the end of each window is the initial layout
+                of the next, so only one window's routing state is ever held in memory.  This
+                bounds the memory use on circuits with millions of two-qubit gates, at the cost
+                of the lookahead of the heuristic not crossing the window boundaries.
 
         Raises:
-            TranspilerError: If the specified heuristic is not valid.
+            TranspilerError: If the specified heuristic is not valid, or ``window_size`` is less
+                than 1.
 
         Additional Information:
 
@@ -157,6 +172,9 @@ class SabreSwap(TransformationPass):
         self.seed = seed
         self.trials = default_num_processes() if trials is None else trials
         self.fake_run = fake_run
+        if window_size is not None and window_size < 1:
+            raise TranspilerError(f"window_size must be at least 1, not {window_size}")
+        self.window_size = window_size
 
     @functools.cached_property
     def dist_matrix(self):  # pylint: disable=missing-function-docstring
@@ -186,7 +204,10 @@ class SabreSwap(TransformationPass):
         if self.target is None:
             raise TranspilerError("SabreSwap cannot run with coupling_map=None")
         if self._routing_target is None:
-            self._routing_target = RoutingTarget.from_target(self.target)
+            # The distance matrix and neighbour tables are shared by all users of the target.
+            self._routing_target = self.target._derived(
+                "sabre_routing_target", lambda: RoutingTarget.from_target(self.target)
+            )
         if len(dag.qregs) != 1 or dag.qregs.get("q", None) is None:
             raise TranspilerError("Sabre swap runs on physical circuits only.")
         num_dag_qubits = len(dag.qubits)
@@ -232,9 +253,12 @@ class SabreSwap(TransformationPass):
 
         initial_layout = NLayout.generate_trivial_layout(num_dag_qubits)
         sabre_start = time.perf_counter()
-        dag, final_layout = sabre_routing(
-            dag, self._routing_target, heuristic, initial_layout, self.trials, self.seed
-        )
+        if self.window_size is None:
+            dag, final_layout = sabre_routing(
+                dag, self._routing_target, heuristic, initial_layout, self.trials, self.seed
+            )
+        else:
+            dag, final_layout = self._route_windows(dag, heuristic, initial_layout)
         sabre_stop = time.perf_counter()
         LOG.debug("Sabre swap algorithm execution complete in: %s", sabre_stop - sabre_start)
         permutation = [
@@ -252,3 +276,33 @@ class SabreSwap(TransformationPass):
             else prev.compose(layout, dag.qubits)
         )
         return dag
+
+    def _route_windows(self, dag, heuristic, initial_layout):
+        """Route ``dag`` one window of :meth:`_windows` at a time, carrying the layout over from
+        the end of each window to the start of the next."""
+        out = dag.copy_empty_like()
+        layout = initial_layout
+        for window in self._windows(dag):
+            routed, layout = sabre_routing(
+                window, self._routing_target, heuristic, layout, self.trials, self.seed
+            )
+            out.compose(routed, inline_captures=True)
+        return out, layout
+
+    def _windows(self, dag):
+        """Split ``dag`` into consecutive slices of a topological order, each with at most
+        ``window_size`` operations on two or more qubits."""
+        window, num_multi_qubit = None, 0
+        for node in dag.topological_op_nodes():
+            if window is None:
+                # The variables are captured so the routed windows can be inlined into the output.
+                window = dag.copy_empty_like(vars_mode="captures")
+                window.global_phase = 0
+            window.apply_operation_back(node.op, node.qargs, node.cargs, check=False)
+            if len(node.qargs) > 1:
+                num_multi_qubit += 1
+                if num_multi_qubit == self.window_size:
+                    yield window
+                    window, num_multi_qubit = None, 0
+        if window is not None:
+            yield window
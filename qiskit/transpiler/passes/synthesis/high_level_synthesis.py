@@ -16,12 +16,16 @@ High-level-synthesis transpiler pass.
 
 from __future__ import annotations
 
+import itertools
 import typing
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
 from qiskit.circuit.operation import Operation
+from qiskit.circuit.library import LinearFunction, MCXGate, PermutationGate, QFTGate
+from qiskit.quantum_info.operators import Clifford
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit import EquivalenceLibrary
@@ -30,6 +34,7 @@ from qiskit.transpiler.target import Target
 from qiskit.transpiler.coupling import CouplingMap
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.utils.parallel import default_num_processes
 
 from qiskit._accelerate.high_level_synthesis import (
     QubitTracker,
@@ -37,7 +42,7 @@ from qiskit._accelerate.high_level_synthesis import (
     run_on_dag,
 )
 
-from .plugin import HighLevelSynthesisPluginManager
+from .plugin import HighLevelSynthesisPlugin, HighLevelSynthesisPluginManager
 
 if typing.TYPE_CHECKING:
     from qiskit.dagcircuit import DAGOpNode
@@ -95,6 +100,8 @@ class HLSConfig:
         use_default_on_unspecified: bool = True,
         plugin_selection: str = "sequential",
         plugin_evaluation_fn: Callable[[QuantumCircuit], int] | None = None,
+        plugin_parallel: bool = False,
+        plugin_cache: bool = False,
         **kwargs,
     ):
         """Creates a high-level-synthesis config.
@@ -112,6 +119,20 @@ class HLSConfig:
                 quantum circuit in the case that ``plugin_selection="sequential"``;
                 a smaller value means a better circuit. If ``None``, the
                 quality of the circuit is its size (i.e. the number of gates that it contains).
+            plugin_parallel: if ``True``, all the specified methods for a higher-level-object are
+                run concurrently in a thread pool, and the result is then chosen according to
+                ``plugin_selection`` as if the methods were run one after the other.  This is
+                beneficial when several expensive methods are specified, and their synthesis
+                routines release the GIL (as, for instance, the Rust-accelerated synthesis of
+                :class:`.Clifford` and :class:`.LinearFunction` objects does).  Each method is
+                given its own copy of the qubit tracker, and only the changes made by the method
+                whose result is chosen are kept.
+            plugin_cache: if ``True``, the synthesis pass reuses the synthesized circuit for
+                higher-level-objects with the same canonical definition (for instance, two
+                :class:`.Clifford` objects with the same tableau), rather than running the
+                synthesis methods again.  This is currently supported for :class:`.Clifford`,
+                :class:`.LinearFunction`, :class:`.PermutationGate`, :class:`.QFTGate` and
+                :class:`.MCXGate` objects.
             kwargs: a dictionary mapping higher-level-objects to lists of synthesis methods.
         """
         self.use_default_on_unspecified = use_default_on_unspecified
@@ -119,6 +140,8 @@ class HLSConfig:
         self.plugin_evaluation_fn = (
             plugin_evaluation_fn if plugin_evaluation_fn is not None else lambda qc: qc.size()
         )
+        self.plugin_parallel = plugin_parallel
+        self.plugin_cache = plugin_cache
         self.methods = {}
 
         for key, value in kwargs.items():
@@ -284,6 +307,10 @@ class HighLevelSynthesis(TransformationPass):
         return res if res is not None else dag
 
 
+# The maximum number of cached plugin syntheses held by a single pass, before the cache is reset.
+_SYNTHESIS_CACHE_SIZE = 1024
+
+
 def _methods_to_try(data: HighLevelSynthesisData, name: str):
     """Get a sequence of methods to try for a given op name."""
     if (methods := data.hls_config.methods.get(name)) is not None:
@@ -328,82 +355,84 @@ def _synthesize_op_using_plugins(
     if len(hls_methods) == 0:
         return None
 
-    hls_plugin_manager = data.hls_plugin_manager
     num_clean_ancillas = tracker.num_clean(input_qubits)
     num_dirty_ancillas = tracker.num_dirty(input_qubits)
 
-    best_decomposition = None
-    best_score = np.inf
-
-    for method in hls_methods:
-        # There are two ways to specify a synthesis method. The more explicit
-        # way is to specify it as a tuple consisting of a synthesis algorithm and a
-        # list of additional arguments, e.g.,
-        #   ("kms", {"all_mats": 1, "max_paths": 100, "orig_circuit": 0}), or
-        #   ("pmh", {}).
-        # When the list of additional arguments is empty, one can also specify
-        # just the synthesis algorithm, e.g.,
-        #   "pmh".
-        if isinstance(method, tuple):
-            plugin_specifier, plugin_args = method
-        else:
-            plugin_specifier = method
-            plugin_args = {}
-
-        # There are two ways to specify a synthesis algorithm being run,
-        # either by name, e.g. "kms" (which then should be specified in entry_points),
-        # or directly as a class inherited from HighLevelSynthesisPlugin (which then
-        # does not need to be specified in entry_points).
-        if isinstance(plugin_specifier, str):
-            if plugin_specifier not in hls_plugin_manager.method_names(operation.name):
-                raise TranspilerError(
-                    f"Specified method: {plugin_specifier} not found in available "
-                    f"plugins for {operation.name}"
-                )
-            plugin_method = hls_plugin_manager.method(operation.name, plugin_specifier)
-        else:
-            plugin_method = plugin_specifier
-
-        # The additional arguments we pass to every plugin include the list of global
-        # qubits over which the operation is defined, high-level-synthesis data and options,
-        # and the tracker that tracks the state for global qubits.
-        #
-        # Note: the difference between the argument "qubits" passed explicitly to "run"
-        # and "input_qubits" passed via "plugin_args" is that for backwards compatibility
-        # the former should be None if the synthesis is done before layout/routing.
-        # However, plugins may need access to the global qubits over which the operation
-        # is defined, as well as their state, in particular the plugin for AnnotatedOperations
-        # requires these arguments to be able to process the base operation recursively.
-        #
-        # We may want to refactor the inputs and the outputs for the plugins' "run" method,
-        # however this needs to be backwards-compatible.
-        plugin_args["input_qubits"] = input_qubits
-        plugin_args["hls_data"] = data
-        plugin_args["qubit_tracker"] = tracker
-        plugin_args["num_clean_ancillas"] = num_clean_ancillas
-        plugin_args["num_dirty_ancillas"] = num_dirty_ancillas
-        if data.optimize_clifford_t:
-            plugin_args["optimization_metric"] = OptimizationMetric.COUNT_T
-        else:
-            plugin_args["optimization_metric"] = OptimizationMetric.COUNT_2Q
-
-        qubits = input_qubits if data.use_physical_indices else None
-
-        decomposition = plugin_method.run(
+    cache_key = None
+    if data.hls_config.plugin_cache:
+        cache_key = _synthesis_cache_key(
             operation,
-            coupling_map=data.coupling_map,
-            target=data.target,
-            qubits=qubits,
-            **plugin_args,
+            input_qubits if data.use_physical_indices else None,
+            num_clean_ancillas,
+            num_dirty_ancillas,
         )
+    if cache_key is not None and cache_key in data.synthesis_cache:
+        best_decomposition = data.synthesis_cache[cache_key]
+    else:
+        plugin_runs = (_plugin_for_method(method, operation, data) for method in hls_methods)
+
+        def run_plugin(plugin_run, tracker=tracker):
+            plugin_method, plugin_args = plugin_run
+            # The additional arguments we pass to every plugin include the list of global
+            # qubits over which the operation is defined, high-level-synthesis data and options,
+            # and the tracker that tracks the state for global qubits.
+            #
+            # Note: the difference between the argument "qubits" passed explicitly to "run"
+            # and "input_qubits" passed via "plugin_args" is that for backwards compatibility
+            # the former should be None if the synthesis is done before layout/routing.
+            # However, plugins may need access to the global qubits over which the operation
+            # is defined, as well as their state, in particular the plugin for
+            # AnnotatedOperations requires these arguments to be able to process the base
+            # operation recursively.
+            #
+            # We may want to refactor the inputs and the outputs for the plugins' "run" method,
+            # however this needs to be backwards-compatible.
+            plugin_args["input_qubits"] = input_qubits
+            plugin_args["hls_data"] = data
+            plugin_args["qubit_tracker"] = tracker
+            plugin_args["num_clean_ancillas"] = num_clean_ancillas
+            plugin_args["num_dirty_ancillas"] = num_dirty_ancillas
+            if data.optimize_clifford_t:
+                plugin_args["optimization_metric"] = OptimizationMetric.COUNT_T
+            else:
+                plugin_args["optimization_metric"] = OptimizationMetric.COUNT_2Q
+
+            qubits = input_qubits if data.use_physical_indices else None
+
+            return plugin_method.run(
+                operation,
+                coupling_map=data.coupling_map,
+                target=data.target,
+                qubits=qubits,
+                **plugin_args,
+            )
 
-        # The synthesis methods that are not suited for the given higher-level-object
-        # will return None.
-        if decomposition is not None:
+        if data.hls_config.plugin_parallel and len(hls_methods) > 1:
+            # All the plugins are resolved up front, so that an invalid method raises here rather
+            # than in a worker thread.  Each plugin gets its own copy of the tracker, since it is
+            # not safe to share the mutable tracker between threads.
+            plugin_runs = list(plugin_runs)
+            trackers = [tracker.copy() for _ in plugin_runs]
+            num_threads = min(default_num_processes(), len(plugin_runs))
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                decompositions = list(executor.map(run_plugin, plugin_runs, trackers))
+        else:
+            trackers = itertools.repeat(tracker)
+            decompositions = (run_plugin(plugin_run) for plugin_run in plugin_runs)
+
+        best_decomposition = None
+        best_tracker = tracker
+        best_score = np.inf
+        for decomposition, plugin_tracker in zip(decompositions, trackers):
+            # The synthesis methods that are not suited for the given higher-level-object
+            # will return None.
+            if decomposition is None:
+                continue
             if data.hls_config.plugin_selection == "sequential":
                 # In the "sequential" mode the first successful decomposition is
                 # returned.
                 best_decomposition = decomposition
+                best_tracker = plugin_tracker
                 break
 
             # In the "run everything" mode we update the best decomposition
@@ -411,8 +440,20 @@ def _synthesize_op_using_plugins(
             current_score = data.hls_config.plugin_evaluation_fn(decomposition)
             if current_score < best_score:
                 best_decomposition = decomposition
+                best_tracker = plugin_tracker
                 best_score = current_score
 
+        if best_tracker is not tracker:
+            # The plugins that were run in parallel each updated the state of the qubits in their
+            # own copy of the tracker, so keep the updates of the plugin whose result is used,
+            # exactly as if it had been run on its own.
+            tracker.replace_state(best_tracker, range(tracker.num_qubits()))
+
+        if cache_key is not None:
+            if len(data.synthesis_cache) >= _SYNTHESIS_CACHE_SIZE:
+                data.synthesis_cache.clear()
+            data.synthesis_cache[cache_key] = best_decomposition
+
     # A synthesis method may have potentially used available ancilla qubits.
     # The following greedily grabs global qubits available. In the additional
     # refactoring mentioned previously, we want each plugin to actually return
@@ -437,3 +478,73 @@ def _synthesize_op_using_plugins(
         return None
 
     return (best_decomposition, output_qubits)
+
+
+def _plugin_for_method(
+    method, operation: Operation, data: HighLevelSynthesisData
+) -> tuple[HighLevelSynthesisPlugin, dict]:
+    """Get the plugin and a copy of its additional arguments for a method in the config."""
+    # There are two ways to specify a synthesis method. The more explicit
+    # way is to specify it as a tuple consisting of a synthesis algorithm and a
+    # list of additional arguments, e.g.,
+    #   ("kms", {"all_mats": 1, "max_paths": 100, "orig_circuit": 0}), or
+    #   ("pmh", {}).
+    # When the list of additional arguments is empty, one can also specify
+    # just the synthesis algorithm, e.g.,
+    #   "pmh".
+    if isinstance(method, tuple):
+        plugin_specifier, plugin_args = method
+    else:
+        plugin_specifier = method
+        plugin_args = {}
+
+    # There are two ways to specify a synthesis algorithm being run,
+    # either by name, e.g. "kms" (which then should be specified in entry_points),
+    # or directly as a class inherited from HighLevelSynthesisPlugin (which then
+    # does not need to be specified in entry_points).
+    if isinstance(plugin_specifier, str):
+        hls_plugin_manager = data.hls_plugin_manager
+        if plugin_specifier not in hls_plugin_manager.method_names(operation.name):
+            raise TranspilerError(
+                f"Specified method: {plugin_specifier} not found in available "
+                f"plugins for {operation.name}"
+            )
+        plugin_method = hls_plugin_manager.method(operation.name, plugin_specifier)
+    else:
+        plugin_method = plugin_specifier
+
+    return plugin_method, dict(plugin_args)
+
+
+def _synthesis_cache_key(
+    operation: Operation,
+    qubits: tuple[int] | None,
+    num_clean_ancillas: int,
+    num_dirty_ancillas: int,
+) -> tuple | None:
+    """Get a hashable key identifying the synthesis problem for ``operation``.
+
+    Returns ``None`` if the operation does not have a canonical definition that is cheap to
+    hash, in which case its synthesis is not cached.
+    """
+    if isinstance(operation, Clifford):
+        definition = (operation.tableau.shape, operation.tableau.tobytes())
+    elif isinstance(operation, LinearFunction):
+        definition = (operation.linear.shape, np.asarray(operation.linear, dtype=bool).tobytes())
+    elif isinstance(operation, PermutationGate):
+        definition = tuple(int(x) for x in operation.pattern)
+    elif isinstance(operation, MCXGate):
+        definition = (operation.num_ctrl_qubits, operation.ctrl_state)
+    elif isinstance(operation, QFTGate):
+        definition = ()
+    else:
+        return None
+    return (
+        type(operation),
+        operation.name,
+        operation.num_qubits,
+        definition,
+        None if qubits is None else tuple(qubits),
+        num_clean_ancillas,
+        num_dirty_ancillas,
+    )
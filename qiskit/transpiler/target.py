@@ -49,7 +49,6 @@ from qiskit.providers.backend import QubitProperties  # pylint: disable=unused-i
 
 logger = logging.getLogger(__name__)
 
-
 class InstructionProperties(BaseInstructionProperties):
     """A representation of the properties of a gate implementation.
 
@@ -244,6 +243,9 @@ class Target(BaseTarget):
         "_instruction_schedule_map",
         "_non_global_basis_strict",
         "_non_global_basis",
+        "_derived_cache",
+        "_derived_properties_cache",
+        "_properties_version",
     )
 
     def __new__(
@@ -324,6 +326,9 @@ class Target(BaseTarget):
         out._instruction_schedule_map = None
         out._non_global_basis = None
         out._non_global_basis_strict = None
+        out._derived_cache = {}
+        out._derived_properties_cache = {}
+        out._properties_version = 0
         return out
 
     def get_non_global_operation_names(self, strict_direction=False):
@@ -467,6 +472,9 @@ class Target(BaseTarget):
         self._instruction_schedule_map = None
         self._non_global_basis_strict = None
         self._non_global_basis = None
+        self._derived_cache = {}
+        self._derived_properties_cache = {}
+        self._properties_version += 1
 
     def update_instruction_properties(self, instruction, qargs, properties):
         """Update the property object for an instruction qarg pair already in the Target.
@@ -477,6 +485,11 @@ class Target(BaseTarget):
         modify/update the properties of an instruction in the ``Target``. Usage of the mapping protocol
         for modifications is not supported.
 
+        Structures derived from the instruction properties, such as the error maps used by the
+        layout passes, are cached by the target and rebuilt only after a call to this method (or
+        to :meth:`add_instruction`).  If an :class:`.InstructionProperties` object has been
+        modified in place, pass it back to this method to invalidate those structures.
+
         Args:
             instruction (str): The instruction name to update
             qargs (tuple): The qargs to update the properties of
@@ -488,6 +501,32 @@ class Target(BaseTarget):
         self._gate_map[instruction][qargs] = properties
         self._instruction_durations = None
         self._instruction_schedule_map = None
+        self._properties_version += 1
+
+    def _derived(self, key, build, *, uses_properties=False):
+        """Get a structure derived from this target, such as a distance matrix or an error map.
+
+        The structure is built by calling ``build()`` the first time it is requested, and then kept
+        in a cache owned by the target, so it is shared between all the transpiler passes (and all
+        the transpilations) that use this target.  Callers must not mutate the returned object.
+
+        The cache is discarded whenever the target is modified by :meth:`add_instruction`.  If
+        ``uses_properties`` is ``True``, the structure depends on the instruction properties, and
+        is rebuilt if the properties version has been bumped by
+        :meth:`update_instruction_properties` since it was built.  Modifying an
+        :class:`.InstructionProperties` in place does not bump the version, so is not seen until
+        the properties are passed back to :meth:`update_instruction_properties`.
+        """
+        if uses_properties:
+            cache, version = self._derived_properties_cache, self._properties_version
+        else:
+            cache, version = self._derived_cache, None
+        # Entries are stored as ``(version, structure)`` pairs, so a structure of ``None`` can be
+        # told apart from a missing entry.
+        entry = cache.get(key)
+        if entry is None or entry[0] != version:
+            entry = cache[key] = (version, build())
+        return entry[1]
 
     def qargs_for_operation_name(self, operation):
         """Get the qargs for a given operation name
@@ -663,31 +702,52 @@ class Target(BaseTarget):
             )
 
         if two_q_gate is not None:
-            coupling_graph = rx.PyDiGraph(multigraph=False)
-            coupling_graph.add_nodes_from([None] * self.num_qubits)
-            for qargs, properties in self[two_q_gate].items():
-                if len(qargs) != 2:
-                    raise ValueError(
-                        f"Specified two_q_gate: {two_q_gate} is not a 2 qubit instruction"
-                    )
-                coupling_graph.add_edge(*qargs, {two_q_gate: properties})
-            cmap = CouplingMap()
-            cmap.graph = coupling_graph
-            return cmap
+            # The edge data of this graph contains the instruction properties.
+            coupling_graph, derived = self._derived(
+                ("gate_coupling_graph", two_q_gate),
+                lambda: (self._build_gate_coupling_graph(two_q_gate), {}),
+                uses_properties=True,
+            )
+            return self._coupling_map_from_cache(coupling_graph, derived)
         if self._coupling_graph is None:
             self._build_coupling_graph()
         # if there is no connectivity constraints in the coupling graph treat it as not
         # existing and return
         if self._coupling_graph is not None:
-            cmap = CouplingMap()
-            if filter_idle_qubits:
-                cmap.graph = self._filter_coupling_graph()
-            else:
-                cmap.graph = self._coupling_graph.copy()
-            return cmap
+            coupling_graph, derived = self._derived(
+                ("coupling_graph", bool(filter_idle_qubits)),
+                lambda: (
+                    self._filter_coupling_graph() if filter_idle_qubits else self._coupling_graph,
+                    {},
+                ),
+            )
+            return self._coupling_map_from_cache(coupling_graph, derived)
         else:
             return None
 
+    def _build_gate_coupling_graph(self, two_q_gate):
+        coupling_graph = rx.PyDiGraph(multigraph=False)
+        coupling_graph.add_nodes_from([None] * self.num_qubits)
+        for qargs, properties in self[two_q_gate].items():
+            if len(qargs) != 2:
+                raise ValueError(f"Specified two_q_gate: {two_q_gate} is not a 2 qubit instruction")
+            coupling_graph.add_edge(*qargs, {two_q_gate: properties})
+        return coupling_graph
+
+    @staticmethod
+    def _coupling_map_from_cache(coupling_graph, derived):
+        # Each caller gets its own copy of the graph to mutate, but all the copies share the
+        # structures derived from the graph, like the distance matrix, until they are modified.
+        # Copying the graph shares the payloads, so the edge-data dictionaries are copied too.
+        graph = coupling_graph.copy()
+        for edge, payload in graph.edge_index_map().items():
+            if isinstance(payload[2], dict):
+                graph.update_edge_by_index(edge, dict(payload[2]))
+        cmap = CouplingMap()
+        cmap.graph = graph
+        cmap._shared_derived = derived
+        return cmap
+
     def _filter_coupling_graph(self):
         has_operations = set(itertools.chain.from_iterable(x for x in self.qargs if x is not None))
         graph = self._coupling_graph.copy()
@@ -774,6 +834,9 @@ class Target(BaseTarget):
         self._coupling_graph = state["coupling_graph"]
         self._instruction_durations = state["instruction_durations"]
         self._instruction_schedule_map = state["instruction_schedule_map"]
+        self._derived_cache = {}
+        self._derived_properties_cache = {}
+        self._properties_version = 0
         super().__setstate__(state["base"])
 
     def seconds_to_dt(self, duration: float) -> int:
@@ -22,6 +22,7 @@ from qiskit.circuit import (
     QuantumRegister,
     Parameter,
     CircuitInstruction,
+    Gate,
     Operation,
     Qubit,
     Clbit,
@@ -616,6 +617,79 @@ class TestQuantumCircuitInstructionData(QiskitTestCase):
 
         self.assertEqual(data_copy, qc.data)
 
+    def test_copy_is_independent(self):
+        """Test that copies sharing their instructions until modified stay independent."""
+        theta = Parameter("theta")
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.rx(theta, 1)
+        expected = qc.copy()
+        # Copy, then modify each side in turn, in all the ways that write to the instructions.
+        modified = qc.copy()
+        modified.append(XGate(), [0])
+        modified.data[0] = CircuitInstruction(XGate(), [modified.qubits[1]])
+        modified.data.insert(1, CircuitInstruction(HGate(), [modified.qubits[0]]))
+        del modified.data[2]
+        modified.assign_parameters([0.5], inplace=True)
+        self.assertEqual(qc, expected)
+        self.assertEqual(len(modified.data), 4)
+
+        original = qc.copy()
+        qc.assign_parameters([1.5], inplace=True)
+        qc.data.clear()
+        self.assertEqual(original.parameters, {theta})
+        self.assertEqual(original, expected)
+
+    def test_copy_shares_storage(self):
+        """Test that copies share their instruction storage until either is modified, even if the
+        operation objects have been accessed."""
+        qc = QuantumCircuit(2)
+        qc.rz(0.5, 0)
+        qc.rx(0.25, 1)
+        qc.cx(0, 1)
+        operations = [instruction.operation for instruction in qc.data]
+        copied = qc.copy()
+        self.assertTrue(copied._data._shares_data_with(qc._data))
+        # The copies must still not share their (non-singleton) operation objects.
+        for operation, instruction in zip(operations[:2], copied.data):
+            self.assertIsNot(instruction.operation, operation)
+        self.assertIsNot(copied.data[1].operation, qc.data[1].operation)
+        self.assertTrue(copied._data._shares_data_with(qc._data))
+        copied.x(0)
+        self.assertFalse(copied._data._shares_data_with(qc._data))
+        self.assertEqual(len(qc.data), 3)
+
+        # Python-space operations have to be copied individually.
+        qc.append(Gate("custom", 1, []), [0])
+        self.assertFalse(qc.copy()._data._shares_data_with(qc._data))
+
+    def test_copy_keeps_operation_caches(self):
+        """Test that copying a circuit keeps the operation objects of the original, and that a copy
+        sharing the instruction storage caches its own operation objects."""
+        gate = RXGate(0.25)
+        qc = QuantumCircuit(2)
+        qc.append(gate, [0])
+        qc.cx(0, 1)
+        copied = qc.copy()
+        self.assertTrue(copied._data._shares_data_with(qc._data))
+        self.assertIs(qc.data[0].operation, gate)
+        self.assertIsNot(copied.data[0].operation, gate)
+
+        first, second = [], []
+        copied._data.foreach_op(first.append)
+        copied._data.foreach_op(second.append)
+        for before, after in zip(first, second):
+            self.assertIs(before, after)
+        self.assertIsNot(first[0], gate)
+        self.assertIs(qc.data[0].operation, gate)
+
+        # The cached objects survive the storage being separated.
+        copied.x(0)
+        self.assertFalse(copied._data._shares_data_with(qc._data))
+        self.assertIs(copied.data[0].operation, first[0])
+        self.assertIs(qc.data[0].operation, gate)
+
     def test_copy_empty_like(self):
         """Test copy_empty_like with variable handling"""
         qr = QuantumRegister(2)
@@ -16,6 +16,7 @@
 import gzip
 import io
 import json
+import os
 import random
 import tempfile
 import unittest
@@ -72,10 +73,14 @@ from qiskit.circuit.parameter import Parameter
 from qiskit.circuit.parametervector import ParameterVector
 from qiskit.synthesis import LieTrotter, SuzukiTrotter
 from qiskit.qpy import dump, load, UnsupportedFeatureForVersion, QPY_COMPATIBILITY_VERSION
+from qiskit.qpy import QPY_VERSION, QPYWriter, get_qpy_version, open as qpy_open
+from qiskit.qpy import ParameterSweep, dump_sweep, load_sweep
+from qiskit.primitives import BindingsArray
 from qiskit.quantum_info import Pauli, SparsePauliOp, Clifford
 from qiskit.quantum_info.random import random_unitary
 from qiskit.circuit.controlledgate import ControlledGate
 from qiskit.utils import optionals
+from qiskit.utils.parallel import should_run_in_parallel
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
 
@@ -389,6 +394,137 @@ class TestLoadFromQPY(QiskitTestCase):
         for old, new in zip(circuits, new_circs):
             self.assertDeprecatedBitProperties(old, new)
 
+    @ddt.data(QPY_COMPATIBILITY_VERSION, 16, QPY_VERSION)
+    def test_multiple_circuits_parallel(self, version):
+        """Test dumping and loading in parallel matches the serial paths."""
+        circuits = [random_circuit(5, 5, measure=True, reset=True, seed=300 + i) for i in range(6)]
+        serial_file = io.BytesIO()
+        dump(circuits, serial_file, version=version)
+        with should_run_in_parallel.override(True):
+            parallel_file = io.BytesIO()
+            dump(circuits, parallel_file, version=version, num_processes=2)
+            self.assertEqual(parallel_file.getvalue(), serial_file.getvalue())
+            parallel_file.seek(0)
+            self.assertEqual(load(parallel_file, num_processes=2), circuits)
+
+    @ddt.data(QPY_COMPATIBILITY_VERSION, 16, QPY_VERSION)
+    def test_open_random_access(self, version):
+        """Test the lazy reader returns the same circuits as loading eagerly."""
+        circuits = [random_circuit(5, 5, measure=True, reset=True, seed=100 + i) for i in range(10)]
+        qpy_file = io.BytesIO()
+        dump(circuits, qpy_file, version=version)
+        qpy_file.seek(0)
+        reader = qpy_open(qpy_file)
+        self.assertEqual(reader.qpy_version, version)
+        self.assertEqual(len(reader), 10)
+        self.assertEqual(reader[7], circuits[7])
+        self.assertEqual(reader[-1], circuits[-1])
+        self.assertEqual(reader[2], circuits[2])
+        self.assertEqual(reader[1:8:3], circuits[1:8:3])
+        self.assertEqual(list(reader), circuits)
+        with self.assertRaises(IndexError):
+            reader[10]  # pylint: disable=pointless-statement
+
+    def test_open_path(self):
+        """Test the lazy reader can memory map a file from its path."""
+        circuits = [random_circuit(5, 5, measure=True, seed=200 + i) for i in range(5)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "circuits.qpy")
+            with open(path, "wb") as fptr:
+                dump(circuits, fptr)
+            with qpy_open(path) as reader:
+                self.assertEqual(reader[3], circuits[3])
+                self.assertEqual(list(reader), circuits)
+
+    @ddt.data(QPY_COMPATIBILITY_VERSION, 15, QPY_VERSION)
+    def test_writer_matches_dump(self, version):
+        """Test the incremental writer produces the same file as dump."""
+        circuits = [random_circuit(5, 5, measure=True, seed=300 + i) for i in range(5)]
+        expected = io.BytesIO()
+        dump(circuits, expected, version=version)
+        qpy_file = io.BytesIO()
+        with QPYWriter(qpy_file, version=version) as writer:
+            for circuit in circuits:
+                writer.write(circuit)
+        self.assertEqual(qpy_file.getvalue(), expected.getvalue())
+
+    @ddt.data(QPY_COMPATIBILITY_VERSION, 15, QPY_VERSION)
+    def test_writer_append(self, version):
+        """Test appending to an existing file gives the same result as writing all at once."""
+        circuits = [random_circuit(5, 5, measure=True, seed=400 + i) for i in range(6)]
+        expected = io.BytesIO()
+        dump(circuits, expected, version=version)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "circuits.qpy")
+            with QPYWriter(path, version=version) as writer:
+                for circuit in circuits[:2]:
+                    writer.write(circuit)
+            with QPYWriter(path, mode="a") as writer:
+                self.assertEqual(writer.qpy_version, version)
+                for circuit in circuits[2:]:
+                    writer.write(circuit)
+            with open(path, "rb") as fptr:
+                self.assertEqual(fptr.read(), expected.getvalue())
+            with self.assertRaises(RuntimeError):
+                with QPYWriter(path, mode="a") as writer:
+                    writer.write(circuits[0])
+                    raise RuntimeError("abort")
+            with open(path, "rb") as fptr:
+                self.assertEqual(load(fptr), circuits)
+
+    @unittest.skipIf(os.name != "posix", "file permissions are POSIX-specific")
+    def test_writer_keeps_permissions(self):
+        """Test the writer gives new files the default permissions, and keeps those of existing
+        files when appending."""
+        circuit = random_circuit(3, 3, seed=450)
+        umask = os.umask(0o022)
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                path = os.path.join(tmpdir, "circuits.qpy")
+                with QPYWriter(path) as writer:
+                    writer.write(circuit)
+                self.assertEqual(os.stat(path).st_mode & 0o777, 0o644)
+                os.chmod(path, 0o640)
+                with QPYWriter(path, mode="a") as writer:
+                    writer.write(circuit)
+                self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+        finally:
+            os.umask(umask)
+
+    def test_parameter_sweep(self):
+        """Test a template and its bindings round-trip as a sweep."""
+        template = real_amplitudes(3, reps=2)
+        values = np.random.default_rng(0).uniform(size=(4, 5, template.num_parameters))
+        qpy_file = io.BytesIO()
+        dump_sweep(template, values, qpy_file)
+        qpy_file.seek(0)
+        sweep = load_sweep(qpy_file)
+        self.assertEqual(sweep.template, template)
+        self.assertEqual(sweep.shape, (4, 5))
+        np.testing.assert_array_equal(sweep.values, values)
+        self.assertEqual(len(sweep), 20)
+        self.assertEqual(sweep[7], template.assign_parameters(values[1, 2]))
+        self.assertEqual(sweep[-1], template.assign_parameters(values[3, 4]))
+        bindings = sweep.bindings_array()
+        self.assertEqual(bindings.shape, (4, 5))
+        np.testing.assert_array_equal(bindings.as_array(template.parameters), values)
+
+    def test_parameter_sweep_bindings_array(self):
+        """Test a sweep can be built from a BindingsArray with parameters in any order."""
+        a, b = Parameter("a"), Parameter("b")
+        template = QuantumCircuit(1)
+        template.rx(a, 0)
+        template.ry(b, 0)
+        bindings = BindingsArray({("b", "a"): [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]})
+        qpy_file = io.BytesIO()
+        dump_sweep(template, bindings, qpy_file)
+        qpy_file.seek(0)
+        sweep = load_sweep(qpy_file)
+        np.testing.assert_array_equal(sweep.values, [[2.0, 1.0], [4.0, 3.0], [6.0, 5.0]])
+        self.assertEqual(list(sweep), [bindings.bind(template, (i,)) for i in range(3)])
+        with self.assertRaisesRegex(ValueError, "last axis"):
+            ParameterSweep(template, np.zeros((3, 3)))
+
     def test_shared_bit_register(self):
         """Test a circuit with shared bit registers."""
         qubits = [Qubit() for _ in range(5)]
@@ -30,10 +30,11 @@ from qiskit.circuit.controlflow.switch_case import SwitchCaseOp
 from qiskit.circuit.controlflow.while_loop import WhileLoopOp
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.circuit.controlflow import IfElseOp
-from qiskit.circuit.library import CXGate, HGate
+from qiskit.circuit.library import CXGate, GlobalPhaseGate, HGate
 from qiskit.circuit.library.standard_gates import SGate
 from qiskit.circuit.quantumcircuit import BitLocations
 from qiskit.circuit.quantumcircuitdata import CircuitInstruction
+from qiskit.converters import circuit_to_dag
 from qiskit.circuit import AncillaQubit, AncillaRegister, Qubit
 from qiskit.providers.fake_provider import GenericBackendV2
 from qiskit.providers.basic_provider import BasicSimulator
@@ -162,6 +163,72 @@ class TestCircuitOperations(QiskitTestCase):
         with self.assertRaisesRegex(CircuitError, "The amount of qubit arguments"):
             qc.append(Barrier(4), bad_arg)
 
+    def test_append_standard_gates(self):
+        """Test that bulk-appending standard gates matches appending them one at a time."""
+        expected = QuantumCircuit(3)
+        expected.h(0)
+        expected.cx(0, 1)
+        expected.rz(0.5, 2)
+        expected.u(0.1, 0.2, 0.3, 1)
+        expected.ccx(2, 1, 0)
+
+        gates = ["h", "cx", "rz", "u", "ccx"]
+        qubits = [[0, 0, 0], [0, 1, 0], [2, 0, 0], [1, 0, 0], [2, 1, 0]]
+        params = [[0, 0, 0], [0, 0, 0], [0.5, 0, 0], [0.1, 0.2, 0.3], [0, 0, 0]]
+        with self.subTest("names"):
+            qc = QuantumCircuit(3)
+            qc.append_standard_gates(gates, qubits, params)
+            self.assertEqual(qc, expected)
+        with self.subTest("enum values"):
+            qc = QuantumCircuit(3)
+            qc.append_standard_gates(
+                [inst.operation._standard_gate for inst in expected.data], qubits, params
+            )
+            self.assertEqual(qc, expected)
+        with self.subTest("structured array"):
+            packed = np.zeros(
+                5, dtype=[("gate", np.uint8), ("qubits", np.uint32, 3), ("params", float, 3)]
+            )
+            packed["gate"] = [int(inst.operation._standard_gate) for inst in expected.data]
+            packed["qubits"] = qubits
+            packed["params"] = params
+            qc = QuantumCircuit(3)
+            qc.append_standard_gates(packed)
+            self.assertEqual(qc, expected)
+        with self.subTest("appends after existing data"):
+            qc = QuantumCircuit(3)
+            qc.h(0)
+            qc.append_standard_gates(gates[1:], qubits[1:], params[1:])
+            self.assertEqual(qc, expected)
+
+    def test_append_standard_gates_rejects_bad_input(self):
+        """Test that bulk-appending standard gates validates every row before appending."""
+        qc = QuantumCircuit(2)
+        with self.assertRaisesRegex(CircuitError, "out of range"):
+            qc.append_standard_gates(["h", "h"], [[0], [2]])
+        with self.assertRaisesRegex(CircuitError, "Duplicate qubits"):
+            qc.append_standard_gates(["h", "cx"], [[0, 1], [1, 1]])
+        with self.assertRaisesRegex(CircuitError, "qubit columns"):
+            qc.append_standard_gates(["cx"], [[0]])
+        with self.assertRaisesRegex(CircuitError, "parameter columns"):
+            qc.append_standard_gates(["rz"], [[0]])
+        with self.assertRaisesRegex(ValueError, "not the name of a standard gate"):
+            qc.append_standard_gates(["not_a_gate"], [[0]])
+        # Identifiers that do not fit the native integer types must not be silently truncated.
+        with self.assertRaisesRegex(CircuitError, "Invalid standard gate id 256"):
+            qc.append_standard_gates([256], [[0]])
+        with self.assertRaisesRegex(CircuitError, "Invalid standard gate id -1"):
+            qc.append_standard_gates(np.array([-1]), [[0]])
+        with self.assertRaisesRegex(CircuitError, "Invalid standard gate id 255"):
+            qc.append_standard_gates([255], [[0]])
+        with self.assertRaisesRegex(CircuitError, "Invalid qubit index -2"):
+            qc.append_standard_gates(["h"], [[-2]])
+        with self.assertRaisesRegex(CircuitError, "Invalid qubit index 4294967296"):
+            qc.append_standard_gates(["h"], [[2**32]])
+        with self.assertRaisesRegex(CircuitError, "must be an integer"):
+            qc.append_standard_gates(["h"], [[0.5]])
+        self.assertEqual(qc, QuantumCircuit(2))
+
     def test_anding_self(self):
         """Test that qc &= qc finishes, which can be prone to infinite while-loops.
 
@@ -1784,3 +1851,129 @@ class TestCircuitPrivateOperations(QiskitTestCase):
         circuit.append(SGate(label="s_gate"), [0])
         decomposed = circuit.decompose(gates_to_decompose=SGate)
         self.assertNotIn("s", decomposed.count_ops())
+
+    def test_structural_hash(self):
+        """Test the structural hash of a circuit distinguishes structure and follows mutations."""
+        theta = Parameter("theta")
+
+        def build():
+            qc = QuantumCircuit(3, 1, global_phase=0.5)
+            qc.h(0)
+            qc.cx(0, 1)
+            qc.rz(theta, 2)
+            qc.measure(2, 0)
+            return qc
+
+        qc = build()
+        self.assertEqual(qc.structural_hash(), build().structural_hash())
+        self.assertEqual(qc.structural_hash(), qc.copy().structural_hash())
+
+        other = build()
+        other.cx(1, 0)
+        self.assertNotEqual(qc.structural_hash(), other.structural_hash())
+
+        with self.subTest("global phase"):
+            phased = build()
+            phased.global_phase = 1.0
+            self.assertNotEqual(qc.structural_hash(), phased.structural_hash())
+            self.assertEqual(
+                qc.structural_hash(ignore_global_phase=True),
+                phased.structural_hash(ignore_global_phase=True),
+            )
+
+        with self.subTest("cache is invalidated on mutation"):
+            mutated = build()
+            before = mutated.structural_hash()
+            mutated.x(0)
+            after_append = mutated.structural_hash()
+            self.assertNotEqual(before, after_append)
+            mutated.assign_parameters([0.25], inplace=True)
+            self.assertNotEqual(after_append, mutated.structural_hash())
+            del mutated.data[-1]
+            expected = build().assign_parameters([0.25])
+            self.assertEqual(mutated.structural_hash(), expected.structural_hash())
+
+    def test_structural_hash_canonical(self):
+        """Test the canonical structural hash ignores reordering of independent instructions."""
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.x(1)
+        qc.cx(0, 2)
+        qc.y(1)
+
+        reordered = QuantumCircuit(3)
+        reordered.x(1)
+        reordered.y(1)
+        reordered.h(0)
+        reordered.cx(0, 2)
+        self.assertNotEqual(qc.structural_hash(), reordered.structural_hash())
+        self.assertEqual(
+            qc.structural_hash(canonical=True), reordered.structural_hash(canonical=True)
+        )
+        self.assertEqual(
+            qc.structural_hash(canonical=True), circuit_to_dag(reordered).structural_hash()
+        )
+
+        dependent = QuantumCircuit(3)
+        dependent.h(0)
+        dependent.y(1)
+        dependent.cx(0, 2)
+        dependent.x(1)
+        self.assertNotEqual(
+            qc.structural_hash(canonical=True), dependent.structural_hash(canonical=True)
+        )
+
+    def test_structural_hash_operation_details(self):
+        """Test the structural hash covers the details of operations beyond their names."""
+        for canonical in (False, True):
+            with self.subTest("symmetric qubits", canonical=canonical):
+                swap_01 = QuantumCircuit(2)
+                swap_01.h(0)
+                swap_01.swap(0, 1)
+                swap_10 = QuantumCircuit(2)
+                swap_10.h(0)
+                swap_10.swap(1, 0)
+                self.assertEqual(
+                    swap_01.structural_hash(canonical=canonical),
+                    swap_10.structural_hash(canonical=canonical),
+                )
+
+            with self.subTest("control-flow payload", canonical=canonical):
+                cond_0 = QuantumCircuit(1, 2)
+                with cond_0.if_test((cond_0.clbits[0], True)):
+                    cond_0.x(0)
+                cond_1 = QuantumCircuit(1, 2)
+                with cond_1.if_test((cond_1.clbits[1], True)):
+                    cond_1.x(0)
+                self.assertNotEqual(
+                    cond_0.structural_hash(canonical=canonical),
+                    cond_1.structural_hash(canonical=canonical),
+                )
+
+            with self.subTest("Python operation type", canonical=canonical):
+
+                class FirstGate(Gate):
+                    def __init__(self):
+                        super().__init__("custom", 1, [])
+
+                class SecondGate(Gate):
+                    def __init__(self):
+                        super().__init__("custom", 1, [])
+
+                first = QuantumCircuit(1)
+                first.append(FirstGate(), [0])
+                second = QuantumCircuit(1)
+                second.append(SecondGate(), [0])
+                self.assertNotEqual(
+                    first.structural_hash(canonical=canonical),
+                    second.structural_hash(canonical=canonical),
+                )
+
+        with self.subTest("zero-qubit operations"):
+            plain = QuantumCircuit(1)
+            plain.h(0)
+            phased = plain.copy()
+            phased.append(GlobalPhaseGate(0.5), [])
+            self.assertNotEqual(
+                plain.structural_hash(canonical=True), phased.structural_hash(canonical=True)
+            )
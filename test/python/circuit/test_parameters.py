@@ -377,6 +377,59 @@ class TestParameters(QiskitTestCase):
         self.assertEqual(qc.assign_parameters(dict(zip(qc.parameters, binds)).values()), expected)
         self.assertEqual(qc.assign_parameters(bind for bind in binds), expected)
 
+    def test_assign_parameters_batch(self):
+        """Batched assignment matches assigning each row separately."""
+        a, b, c = Parameter("a"), Parameter("b"), Parameter("c")
+        qc = QuantumCircuit(2, global_phase=c)
+        qc.rz(a, 0)
+        qc.crx(b + c, 0, 1)
+        qc.append(Gate("custom", 1, [2 * a]), [1])
+
+        values = numpy.random.default_rng(0).uniform(size=(5, 3))
+        bound = qc.assign_parameters_batch(values)
+        self.assertEqual(len(bound), 5)
+        for circuit, row in zip(bound, values):
+            self.assertEqual(circuit, qc.assign_parameters(row))
+            self.assertEqual(circuit.parameters, set())
+        # The original circuit and the copies don't share mutable state.
+        self.assertEqual(qc.parameters, {a, b, c})
+        self.assertIsNot(bound[0].data[2].operation, bound[1].data[2].operation)
+
+        with self.assertRaises(ValueError):
+            qc.assign_parameters_batch(values[:, :2])
+        with self.assertRaises(ValueError):
+            qc.assign_parameters_batch(values[0])
+
+    def test_assign_parameters_batch_expressions(self):
+        """Batched assignment of expressions in standard gates and the global phase."""
+        a, b = Parameter("a"), Parameter("b")
+        qc = QuantumCircuit(2, global_phase=a - b / 2)
+        qc.rz((a * b).sin(), 0)
+        qc.cp(a.exp() - b**2, 0, 1)
+        qc.u(a, 2 * b + 1, abs(a - b), 1)
+
+        values = numpy.random.default_rng(1).uniform(-2, 2, size=(3000, 2))
+        bound = qc.assign_parameters_batch(values)
+        for index in (0, 1234, 2999):
+            expected = qc.assign_parameters(values[index])
+            self.assertEqual(bound[index].parameters, set())
+            self.assertAlmostEqual(
+                float(bound[index].global_phase), float(expected.global_phase), places=12
+            )
+            for actual, reference in zip(bound[index].data, expected.data):
+                self.assertEqual(actual.operation.name, reference.operation.name)
+                numpy.testing.assert_allclose(
+                    actual.operation.params, reference.operation.params, rtol=1e-12, atol=1e-12
+                )
+
+        # A complex result fails in the same way as for a single assignment.
+        qc = QuantumCircuit(1)
+        qc.rz(a.log(), 0)
+        with self.assertRaises(Exception) as single:
+            qc.assign_parameters([-1.0])
+        with self.assertRaises(type(single.exception)):
+            qc.assign_parameters_batch([[1.0], [-1.0]])
+
     def test_assign_parameters_with_cache(self):
         """Test assigning parameters on a circuit with already triggered cache."""
         x = Parameter("x")
@@ -243,6 +243,28 @@ class TestDagNodeSelection(QiskitTestCase):
         predecessors_fourth = self.dag.predecessors(3)
         self.assertEqual(predecessors_fourth, [])
 
+    def test_edges_skip_commuting_runs(self):
+        """Test that edges are added from the latest non-commuting nodes, even when they are
+        preceded by long runs of commuting nodes on the same wires."""
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.z(0)
+        circuit.z(0)
+        circuit.cx(0, 1)
+        circuit.z(0)
+        circuit.x(1)
+        circuit.rz(0.3, 0)
+        circuit.t(2)
+        circuit.cx(2, 1)
+        circuit.h(0)
+
+        dag = circuit_to_dagdependency(circuit)
+        edges = sorted((src, dest) for src, dest, _ in dag.get_all_edges())
+        self.assertEqual(
+            edges,
+            [(0, 1), (0, 2), (0, 3), (0, 4), (0, 6), (1, 9), (2, 9), (3, 9), (4, 9), (6, 9)],
+        )
+
     def test_option_create_preds_and_succs_is_false(self):
         """Test that when the option ``create_preds_and_succs`` is False,
         direct successors and predecessors still get constructed, but
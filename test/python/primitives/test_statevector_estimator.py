@@ -23,6 +23,7 @@ from qiskit.primitives import StatevectorEstimator
 from qiskit.primitives.containers.bindings_array import BindingsArray
 from qiskit.primitives.containers.estimator_pub import EstimatorPub
 from qiskit.primitives.containers.observables_array import ObservablesArray
+from qiskit.primitives.utils import _statevector_from_circuit
 from qiskit.quantum_info import SparsePauliOp
 
 
@@ -97,6 +98,18 @@ class TestStatevectorEstimator(QiskitTestCase):
         np.testing.assert_allclose(result4[0].data.evs, [1.55555728, -1.08766318])
         np.testing.assert_allclose(result4[1].data.evs, [0.17849238])
 
+    def test_estimator_run_complex64(self):
+        """Test Estimator.run() with single-precision statevectors."""
+        psi1, _ = self.psi
+        hamiltonian1, _, _ = self.hamiltonian
+        theta1, _, _ = self.theta
+        estimator = StatevectorEstimator(dtype=np.complex64)
+        self.assertEqual(estimator.dtype, np.complex64)
+        result = estimator.run([(psi1, hamiltonian1, [theta1])]).result()
+        np.testing.assert_allclose(result[0].data.evs, [1.5555572817900956], rtol=1e-5)
+        state = _statevector_from_circuit(psi1.assign_parameters(theta1), None, np.complex64)
+        self.assertEqual(state.data.dtype, np.complex64)
+
     def test_estimator_with_pub(self):
         """Test estimator with explicit EstimatorPubs."""
         psi1, psi2 = self.psi
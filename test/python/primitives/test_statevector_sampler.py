@@ -124,6 +124,14 @@ class TestStatevectorSampler(QiskitTestCase):
             self.assertIsInstance(result[0].data.meas, BitArray)
             self._assert_allclose(result[0].data.meas, np.array([target, target, target]))
 
+    def test_sampler_run_complex64(self):
+        """Test run() with single-precision statevectors."""
+        bell, _, target = self._cases[1]
+        sampler = StatevectorSampler(seed=self._seed, dtype=np.complex64)
+        self.assertEqual(sampler.dtype, np.complex64)
+        result = sampler.run([bell], shots=self._shots).result()
+        self._assert_allclose(result[0].data.meas, np.array(target))
+
     def test_sampler_run_multiple_times(self):
         """Test run() returns the same results if the same input is given."""
         bell, _, _ = self._cases[1]
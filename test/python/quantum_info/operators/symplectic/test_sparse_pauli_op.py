@@ -35,7 +35,7 @@ from qiskit.quantum_info.operators import (
     PauliList,
     SparsePauliOp,
 )
-from qiskit.utils import optionals
+from qiskit.utils import optionals, should_run_in_parallel
 
 
 def pauli_mat(label):
@@ -647,6 +647,68 @@ class TestSparsePauliOpMethods(QiskitTestCase):
         np.testing.assert_allclose(value, target, atol=1e-8)
         np.testing.assert_array_equal(op.paulis.phase, np.zeros(op.size))
 
+    @combine(num_qubits=[1, 2, 3, 4], front=[True, False], chunk_size=[1, 7, None])
+    def test_compose_and_simplify(self, num_qubits, front, chunk_size):
+        """Test {num_qubits}-qubit compose_and_simplify with front={front}, chunk_size={chunk_size}."""
+        spp_op1 = self.random_spp_op(num_qubits, 2**num_qubits)
+        spp_op2 = self.random_spp_op(num_qubits, 2**num_qubits)
+        target = spp_op1.compose(spp_op2, front=front).simplify()
+
+        op = spp_op1.compose_and_simplify(spp_op2, front=front, chunk_size=chunk_size)
+        self.assertEqual(op, target)
+        np.testing.assert_array_equal(op.paulis.phase, np.zeros(op.size))
+
+        op = spp_op1.compose_and_simplify(
+            spp_op2, front=front, chunk_size=chunk_size, force_serial=True
+        )
+        self.assertEqual(op, target)
+
+        with should_run_in_parallel.override(True):
+            op = spp_op1.compose_and_simplify(spp_op2, front=front, chunk_size=chunk_size)
+        self.assertEqual(op, target)
+
+    @combine(num_qubits=[1, 2, 3])
+    def test_qargs_compose_and_simplify(self, num_qubits):
+        """Test 3-qubit compose_and_simplify method with {num_qubits}-qubit qargs."""
+        spp_op1 = self.random_spp_op(3, 2**3)
+        spp_op2 = self.random_spp_op(num_qubits, 2**num_qubits)
+        qargs = self.RNG.choice(3, size=num_qubits, replace=False).tolist()
+        target = Operator(spp_op1).compose(Operator(spp_op2), qargs=qargs)
+
+        op = spp_op1.compose_and_simplify(spp_op2, qargs=qargs, chunk_size=3)
+        self.assertEqual(op.to_operator(), target)
+        np.testing.assert_array_equal(op.paulis.phase, np.zeros(op.size))
+
+    def test_compose_and_simplify_cancellation(self):
+        """Test compose_and_simplify prunes terms that cancel across chunks."""
+        op = SparsePauliOp(["X", "Z"], [1, 1j])
+        # (X + iZ) @ (X + iZ) = XX - ZZ + i(XZ + ZX) = 0, and every row of `self` is its own chunk.
+        value = op.compose_and_simplify(op, chunk_size=1)
+        self.assertEqual(value, SparsePauliOp(["I"], [0]))
+
+        value = op.compose_and_simplify(SparsePauliOp(["Y"], [1e-3]), atol=1e-2)
+        self.assertEqual(value, SparsePauliOp(["I"], [0]))
+
+    def test_compose_and_simplify_prunes_during_accumulation(self):
+        """Test compose_and_simplify prunes the running total after merging each chunk."""
+        op = SparsePauliOp(["X", "Y", "Z"], [1, 1, 1])
+        other = SparsePauliOp(["X"], [6e-3])
+        # Every term of the result sums three contributions below `atol` from different chunks,
+        # and each contribution is pruned as soon as its chunk is merged.
+        value = (op @ op).compose_and_simplify(other, atol=1e-2, chunk_size=1)
+        self.assertEqual(value, SparsePauliOp(["I"], [0]))
+        # With all the contributions in one chunk, the total survives the pruning.
+        value = (op @ op).compose_and_simplify(other, atol=1e-2)
+        self.assertEqual(value, (op @ op @ other).simplify(atol=1e-2))
+
+    def test_compose_and_simplify_parameters(self):
+        """Test compose_and_simplify falls back correctly for parametrized operators."""
+        a = Parameter("a")
+        op = SparsePauliOp(["X", "Z"], np.array([a, 1], dtype=object))
+        value = op.compose_and_simplify(op)
+        target = op.compose(op).simplify()
+        self.assertEqual(value, target)
+
     @combine(num_qubits=[1, 2, 3, 4], use_parameters=[True, False])
     def test_dot(self, num_qubits, use_parameters):
         """Test {num_qubits}-qubit dot methods."""
@@ -21,6 +21,7 @@ from numpy.testing import assert_allclose
 
 from qiskit import QiskitError, QuantumCircuit, QuantumRegister
 from qiskit.circuit.library import QFTGate, HGate
+from qiskit.quantum_info.operators.channel import Kraus, SuperOp
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.symplectic import Pauli, SparsePauliOp
 from qiskit.quantum_info.random import random_density_matrix, random_pauli, random_unitary
@@ -299,6 +300,85 @@ class TestDensityMatrix(QiskitTestCase):
         target = DensityMatrix(np.dot(target_op, init).dot(target_op.conj().T), dims)
         self.assertEqual(state, target)
 
+    def test_evolve_gate_kernels(self):
+        """Test evolving by gates with the in-place kernels matches the full operator."""
+        circ = QuantumCircuit(4)
+        circ.h(0)
+        circ.cx(0, 2)
+        circ.cswap(3, 1, 0)
+        circ.rzz(0.3, 1, 3)
+        circ.append(random_unitary(4, seed=7), [3, 1])
+        circ.cry(0.4, 2, 1, ctrl_state=0)
+        circ.cu(0.1, 0.2, 0.3, 0.4, 1, 0)
+        init = self.rand_rho(16)
+        rho = DensityMatrix(init.copy())
+        target = rho.evolve(Operator(circ))
+        evolved = rho.evolve(circ)
+        self.assertEqual(evolved, target)
+        np.testing.assert_array_equal(rho.data, init)
+
+    def test_evolve_kraus(self):
+        """Test evolving by Kraus channels term-by-term matches the superoperator."""
+        p = 0.2
+        kraus = Kraus(
+            [
+                np.sqrt(1 - p) * np.eye(2),
+                np.sqrt(p / 3) * Pauli("X").to_matrix(),
+                np.sqrt(p / 3) * Pauli("Y").to_matrix(),
+                np.sqrt(p / 3) * Pauli("Z").to_matrix(),
+            ]
+        )
+        kraus_2q = Kraus(random_unitary(4, seed=3)).compose(kraus.tensor(kraus))
+        rho = DensityMatrix(self.rand_rho(8))
+        for chan, qargs in [(kraus, [1]), (kraus_2q, [2, 0]), (kraus_2q.tensor(kraus), None)]:
+            with self.subTest(qargs=qargs):
+                target = rho.evolve(SuperOp(chan), qargs=qargs)
+                self.assertEqual(rho.evolve(chan, qargs=qargs), target)
+                circ = QuantumCircuit(3)
+                circ.append(chan.to_instruction(), qargs or [0, 1, 2])
+                self.assertEqual(rho.evolve(circ), target)
+
+    def test_evolve_kraus_many_qubits(self):
+        """Test Kraus channels on more qubits than the gate kernels are applied term-by-term."""
+        kraus = Kraus([np.sqrt(0.7) * random_unitary(16, seed=5).data, np.sqrt(0.3) * np.eye(16)])
+        rho = DensityMatrix(self.rand_rho(32))
+        for qargs in [[4, 0, 2, 1], None]:
+            with self.subTest(qargs=qargs):
+                chan = kraus if qargs else kraus.tensor(Kraus(np.eye(2)))
+                target = rho.evolve(SuperOp(chan), qargs=qargs)
+                self.assertIsNotNone(rho._evolve_kraus(chan, qargs=qargs))
+                self.assertEqual(rho.evolve(chan, qargs=qargs), target)
+
+    def test_complex64(self):
+        """Test single-precision density matrices are evolved in single precision."""
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.cx(0, 1)
+        circ.ry(0.4, 1)
+        circ.reset(0)
+        target = DensityMatrix.from_instruction(circ)
+
+        rho = DensityMatrix.from_instruction(circ, dtype=np.complex64)
+        self.assertEqual(rho.data.dtype, np.complex64)
+        assert_allclose(rho.data, target.data, atol=1e-6)
+
+        evolved = rho.evolve(random_unitary(2, seed=5), qargs=[0])
+        self.assertEqual(evolved.data.dtype, np.complex64)
+        assert_allclose(
+            evolved.data, target.evolve(random_unitary(2, seed=5), qargs=[0]).data, atol=1e-6
+        )
+        self.assertEqual(rho.probabilities().dtype, np.float32)
+        obs = SparsePauliOp(["XX", "ZI"], [0.5, 2.0])
+        self.assertAlmostEqual(rho.expectation_value(obs), target.expectation_value(obs), places=5)
+        self.assertEqual(
+            DensityMatrix(Statevector([1, 0]), dtype=np.complex64).data.dtype, np.complex64
+        )
+        self.assertEqual(DensityMatrix(rho.data).data.dtype, np.complex64)
+        self.assertEqual(DensityMatrix(rho).data.dtype, np.complex64)
+        self.assertEqual(
+            DensityMatrix(Statevector([1, 0], dtype=np.complex64)).data.dtype, np.complex64
+        )
+
     def test_conjugate(self):
         """Test conjugate method."""
         for _ in range(10):
@@ -423,6 +423,102 @@ class TestStatevector(QiskitTestCase):
         target = Statevector([0, 1]) * np.exp(1j * phase)
         self.assertEqual(state_f, target)
 
+    def test_evolve_inplace(self):
+        """Test evolve with inplace=True modifies the state and returns None."""
+        vec = self.rand_vec(8, normalize=True)
+        circ = QuantumCircuit(3)
+        circ.h(0)
+        circ.cx(0, 2)
+        circ.rz(0.3, 1)
+        target = Statevector(vec).evolve(Operator(circ))
+
+        state = Statevector(vec)
+        self.assertIsNone(state.evolve(circ, inplace=True))
+        self.assertEqual(state, target)
+
+        op = random_unitary(2, seed=7)
+        target = target.evolve(op, qargs=[1])
+        self.assertIsNone(state.evolve(op, qargs=[1], inplace=True))
+        self.assertEqual(state, target)
+
+    def test_evolve_does_not_modify_input(self):
+        """Test that non-inplace evolution by a circuit leaves the original state unchanged."""
+        vec = self.rand_vec(4, normalize=True)
+        state = Statevector(vec)
+        circ = QuantumCircuit(2, global_phase=0.5)
+        circ.x(0)
+        circ.s(1)
+        state.evolve(circ)
+        assert_allclose(state.data, vec)
+
+    def test_evolve_gate_kernels(self):
+        """Test the specialized gate kernels against the dense operator of a circuit."""
+        circ = QuantumCircuit(4)
+        circ.h(range(4))
+        circ.rx(0.2, 1)
+        # Diagonal gates.
+        circ.z(0)
+        circ.t(2)
+        circ.rz(0.4, 3)
+        circ.cp(0.7, 3, 0)
+        circ.rzz(0.5, 1, 3)
+        circ.ccz(2, 0, 1)
+        # Permutation gates.
+        circ.x(1)
+        circ.y(3)
+        circ.swap(0, 2)
+        circ.ccx(3, 1, 0)
+        circ.cswap(1, 2, 3)
+        circ.iswap(0, 3)
+        # Controlled gates, including open controls.
+        circ.cx(2, 1, ctrl_state=0)
+        circ.ch(0, 3)
+        circ.crx(0.3, 3, 2)
+        circ.cu(0.1, 0.2, 0.3, 0.4, 1, 0)
+        circ.mcx([0, 1, 2], 3, ctrl_state="010")
+        # Dense gates.
+        circ.u(0.1, 0.2, 0.3, 2)
+        circ.rxx(0.6, 0, 1)
+        circ.append(random_unitary(8, seed=3), [3, 0, 2])
+
+        target = Statevector.from_label("0000").evolve(Operator(circ))
+        self.assertEqual(Statevector.from_instruction(circ), target)
+
+    def test_complex64(self):
+        """Test single-precision statevectors are evolved and measured in single precision."""
+        circ = QuantumCircuit(3)
+        circ.h(0)
+        circ.cx(0, 1)
+        circ.append(random_unitary(4, seed=11), [1, 2])
+        circ.rz(0.2, 2)
+        target = Statevector.from_instruction(circ)
+
+        state = Statevector.from_instruction(circ, dtype=np.complex64)
+        self.assertEqual(state.data.dtype, np.complex64)
+        assert_allclose(state.data, target.data, atol=1e-6)
+
+        evolved = state.evolve(random_unitary(2, seed=12), qargs=[1])
+        self.assertEqual(evolved.data.dtype, np.complex64)
+        self.assertEqual(evolved.conjugate().data.dtype, np.complex64)
+        self.assertEqual(Statevector(circ, dtype=np.complex64).data.dtype, np.complex64)
+        self.assertEqual(Statevector(state.data).data.dtype, np.complex64)
+        self.assertEqual(Statevector(state).data.dtype, np.complex64)
+        self.assertEqual(Statevector(target.data).data.dtype, np.complex128)
+
+        probs = state.probabilities([0, 2])
+        self.assertEqual(probs.dtype, np.float32)
+        assert_allclose(probs, target.probabilities([0, 2]), atol=1e-6)
+
+        obs = SparsePauliOp(["XXI", "ZIZ", "IYY"], [0.5, 1.0, -0.3])
+        self.assertAlmostEqual(
+            state.expectation_value(obs), target.expectation_value(obs), places=5
+        )
+        state.seed(1234)
+        self.assertEqual(len(state.sample_memory(10)), 10)
+
+        with self.assertRaises(QiskitError):
+            Statevector([1, 0], dtype=np.float64)
+
     def test_conjugate(self):
         """Test conjugate method."""
         for _ in range(10):
@@ -962,6 +1058,39 @@ class TestStatevector(QiskitTestCase):
             self.assertEqual(len(memory), shots)
             self.assertEqual(set(memory), {"0", "2"})
 
+    def test_outcome_sampler(self):
+        """Test outcome_sampler method"""
+        state = random_statevector(8, seed=42)
+        for qargs in [None, [0], [2, 0]]:
+            with self.subTest(msg=f"qargs={qargs}"):
+                sampler = state.outcome_sampler(qargs)
+                self.assertIs(sampler, state.outcome_sampler(qargs))
+                self.assertEqual(sampler.dims, state.dims(qargs))
+                probs = state.probabilities(qargs)
+                expected = np.random.default_rng(1234).choice(len(probs), p=probs, size=100)
+                np.testing.assert_array_equal(sampler.sample(100, seed=1234), expected)
+                state.seed(1234)
+                np.testing.assert_array_equal(
+                    sampler.sample_memory(100, seed=1234), state.sample_memory(100, qargs=qargs)
+                )
+                counts = sampler.sample_counts(100, seed=1234)
+                self.assertEqual(sum(counts.values()), 100)
+
+    def test_sampling_follows_state_changes(self):
+        """Test sampling reflects in-place changes to the state"""
+        state = Statevector.from_label("00")
+        sampler = state.outcome_sampler()
+        circ = QuantumCircuit(2)
+        circ.x(1)
+        state.evolve(circ, inplace=True)
+        self.assertIsNot(state.outcome_sampler(), sampler)
+        self.assertEqual(state.sample_counts(10), {"10": 10})
+        state.data[:] = [0, 1, 0, 0]
+        self.assertEqual(state.sample_counts(10), {"01": 10})
+        self.assertIsNot(state.copy().outcome_sampler(), state.outcome_sampler())
+        # An existing sampler is a snapshot of the state it was created from.
+        self.assertEqual(sampler.sample_counts(10), {"00": 10})
+
     def test_reset_2qubit(self):
         """Test reset method for 2-qubit state"""
 
@@ -531,6 +531,33 @@ class TestBasisTranslator(QiskitTestCase):
         inst = std_eq_lib._get_equivalences(rx_key)[0].circuit.data[0]
         self.assertEqual(inst.params, inst.operation.params)
 
+    def test_library_modification_invalidates_search(self):
+        """Verify a translation reflects equivalences changed after a previous run with the
+        same library and bases."""
+        eq_lib = EquivalenceLibrary()
+
+        gate = OneQubitZeroParamGate()
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitOneParamGate(pi), [0])
+        equiv.append(OneQubitOneParamGate(pi), [0])
+        eq_lib.add_equivalence(gate, equiv)
+
+        qc = QuantumCircuit(1)
+        qc.append(OneQubitZeroParamGate(), [0])
+
+        pass_ = BasisTranslator(eq_lib, ["1q1p"])
+        first = pass_.run(circuit_to_dag(qc))
+        self.assertEqual(first.count_ops(), {"1q1p": 2})
+        self.assertEqual(pass_.run(circuit_to_dag(qc)), first)
+
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitOneParamGate(pi), [0])
+        eq_lib.set_entry(gate, [equiv])
+
+        expected = QuantumCircuit(1)
+        expected.append(OneQubitOneParamGate(pi), [0])
+        self.assertEqual(pass_.run(circuit_to_dag(qc)), circuit_to_dag(expected))
+
 
 class TestUnrollerCompatability(QiskitTestCase):
     """Tests backward compatability with the Unroller pass.
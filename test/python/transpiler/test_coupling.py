@@ -18,6 +18,7 @@ import numpy as np
 import rustworkx as rx
 
 from qiskit.transpiler import CouplingMap
+from qiskit.transpiler.coupling import DistanceOracle
 from qiskit.transpiler.exceptions import CouplingError
 from qiskit.utils import optionals
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -91,6 +92,27 @@ class CouplingTest(QiskitTestCase):
         graph.add_physical_qubit(1)
         self.assertEqual(0.0, graph.distance(0, 0))
 
+    def test_distance_oracle(self):
+        """Test the distance oracle matches the distance matrix."""
+        coupling = CouplingMap.from_heavy_hex(5)
+        coupling.add_physical_qubit(coupling.size())
+        oracle = DistanceOracle(coupling.graph, max_rows=4)
+        dist_matrix = coupling.distance_matrix
+        for source in range(coupling.size()):
+            np.testing.assert_array_equal(oracle.distances_from(source), dist_matrix[source])
+            self.assertLessEqual(oracle.num_cached_rows, 4)
+        self.assertEqual(oracle.distance(3, 0), dist_matrix[3, 0])
+        self.assertEqual(oracle.distance(0, coupling.size() - 1), np.inf)
+        with self.assertRaises(CouplingError):
+            oracle.distance(0, coupling.size())
+
+    def test_distance_oracle_invalidated(self):
+        """Test the distance oracle of a coupling map is updated when the map changes."""
+        coupling = CouplingMap.from_line(5)
+        self.assertEqual(coupling.distance_oracle().distance(0, 4), 4)
+        coupling.add_edge(0, 4)
+        self.assertEqual(coupling.distance_oracle().distance(0, 4), 1)
+
     def test_init_with_couplinglist(self):
         coupling_list = [[0, 1], [1, 2]]
         coupling = CouplingMap(coupling_list)
@@ -65,7 +65,7 @@ from qiskit.quantum_info import (
 )
 from qiskit.quantum_info.random import random_unitary
 from qiskit.synthesis.evolution import synth_pauli_network_rustiq, LieTrotter
-from qiskit.synthesis.linear import random_invertible_binary_matrix
+from qiskit.synthesis.linear import random_invertible_binary_matrix, synth_cnot_count_full_pmh
 from qiskit.synthesis.arithmetic import adder_qft_d00
 from qiskit.compiler import transpile
 from qiskit.exceptions import QiskitError
@@ -997,6 +997,88 @@ class TestPMHSynthesisLinearFunctionPlugin(QiskitTestCase):
             self.assertEqual(qct.size(), 24)
             self.assertEqual(qct.depth(), 13)
 
+    def test_plugin_parallel(self):
+        """Test running the plugins in parallel gives the same result as running them in turn."""
+        mat = random_invertible_binary_matrix(7, seed=38)
+        qc = QuantumCircuit(7)
+        qc.append(LinearFunction(mat), [0, 1, 2, 3, 4, 5, 6])
+        methods = [
+            ("pmh", {}),
+            ("pmh", {"use_inverted": True}),
+            ("pmh", {"use_transposed": True}),
+            ("pmh", {"use_inverted": True, "use_transposed": True}),
+        ]
+
+        for plugin_selection in ["sequential", "all"]:
+            with self.subTest(plugin_selection=plugin_selection):
+                expected = HighLevelSynthesis(
+                    hls_config=HLSConfig(linear_function=methods, plugin_selection=plugin_selection)
+                )(qc)
+                hls_config = HLSConfig(
+                    linear_function=methods,
+                    plugin_selection=plugin_selection,
+                    plugin_parallel=True,
+                )
+                qct = HighLevelSynthesis(hls_config=hls_config)(qc)
+                self.assertEqual(qct, expected)
+
+    def test_plugin_parallel_tracker(self):
+        """Test the qubit state updates of the chosen plugin are kept when running in parallel."""
+        mat = random_invertible_binary_matrix(2, seed=1)
+        qc = QuantumCircuit(4)
+        qc.append(LinearFunction(mat), [0, 1])
+        qc.append(LinearFunction(mat), [0, 1])
+
+        ancillas = []
+
+        class DirtyingPlugin(HighLevelSynthesisPlugin):
+            """A plugin recording the available auxiliary qubits, and then using one of them."""
+
+            def run(
+                self, high_level_object, coupling_map=None, target=None, qubits=None, **options
+            ):
+                ancillas.append((options["num_clean_ancillas"], options["num_dirty_ancillas"]))
+                options["qubit_tracker"].set_dirty([3])
+                return synth_cnot_count_full_pmh(high_level_object.linear)
+
+        for plugin_parallel in [False, True]:
+            with self.subTest(plugin_parallel=plugin_parallel):
+                ancillas.clear()
+                hls_config = HLSConfig(
+                    linear_function=[DirtyingPlugin(), "pmh"], plugin_parallel=plugin_parallel
+                )
+                HighLevelSynthesis(hls_config=hls_config, qubits_initially_zero=True)(qc)
+                self.assertEqual(ancillas, [(2, 0), (1, 1)])
+
+    def test_plugin_cache(self):
+        """Test that the synthesis of equal objects is reused when caching is enabled."""
+        mat = random_invertible_binary_matrix(4, seed=5)
+        qc = QuantumCircuit(4)
+        qc.append(LinearFunction(mat), [0, 1, 2, 3])
+        qc.append(LinearFunction(mat), [3, 2, 1, 0])
+        qc.append(LinearFunction(mat.T), [0, 1, 2, 3])
+
+        calls = []
+
+        class CountingPlugin(HighLevelSynthesisPlugin):
+            """A plugin recording the objects it synthesizes."""
+
+            def run(
+                self, high_level_object, coupling_map=None, target=None, qubits=None, **options
+            ):
+                calls.append(high_level_object)
+                return synth_cnot_count_full_pmh(high_level_object.linear)
+
+        for plugin_cache, expected_calls in [(False, 3), (True, 2)]:
+            with self.subTest(plugin_cache=plugin_cache):
+                calls.clear()
+                hls_config = HLSConfig(
+                    linear_function=[CountingPlugin()], plugin_cache=plugin_cache
+                )
+                qct = HighLevelSynthesis(hls_config=hls_config)(qc)
+                self.assertEqual(len(calls), expected_calls)
+                self.assertEqual(Operator(qct), Operator(qc))
+
     def test_unfortunate_name(self):
         """Test the synthesis is not triggered for a custom gate with the same name."""
         intruder = QuantumCircuit(2, name="linear_function")
@@ -21,7 +21,7 @@ from qiskit.circuit import library as lib, Parameter
 from qiskit.circuit.classical import expr, types
 from qiskit.circuit.library import efficient_su2, quantum_volume
 from qiskit.transpiler import CouplingMap, AnalysisPass, PassManager, Target, Layout
-from qiskit.transpiler.passes import SabreLayout, DenseLayout, Unroll3qOrMore, BasicSwap
+from qiskit.transpiler.passes import SabreLayout, DenseLayout, Unroll3qOrMore, BasicSwap, CheckMap
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag
 from qiskit.compiler.transpiler import transpile
@@ -352,6 +352,42 @@ barrier q18585[5],q18585[2],q18585[8],q18585[3],q18585[6];
         _ = pm.run(qc)
         self.assertIsNotNone(pm.property_set.get("layout"))
 
+    def test_time_limit(self):
+        """Test that a spent time limit skips the random layout trials after the first."""
+        qc = quantum_volume(20, seed=42)
+        qc = Unroll3qOrMore()(qc)
+        cmap = CouplingMap.from_heavy_hex(5)
+        pass_ = SabreLayout(cmap, seed=0, layout_trials=10_000, swap_trials=1, time_limit=0.0)
+        out = pass_(qc)
+        self.assertIsNotNone(pass_.property_set["layout"])
+        check = CheckMap(cmap)
+        check(out)
+        self.assertTrue(check.property_set["is_swap_mapped"])
+
+        pass_ = SabreLayout(
+            cmap, seed=0, layout_trials=10_000, swap_trials=1, time_limit=0.0, skip_routing=True
+        )
+        pass_(qc)
+        self.assertIsNotNone(pass_.property_set["layout"])
+
+        with self.assertRaises(TranspilerError):
+            SabreLayout(cmap, routing_pass=BasicSwap(cmap), time_limit=1.0)
+        with self.assertRaises(ValueError):
+            SabreLayout(cmap, seed=0, time_limit=-1.0)(qc)
+
+    def test_no_time_limit_is_deterministic(self):
+        """Test that the layout only depends on the seed when there is no time limit."""
+        qc = quantum_volume(20, seed=42)
+        qc = Unroll3qOrMore()(qc)
+        cmap = CouplingMap.from_heavy_hex(5)
+        layouts = []
+        for _ in range(3):
+            pass_ = SabreLayout(cmap, seed=0, layout_trials=8, swap_trials=2, time_limit=None)
+            pass_(qc)
+            layouts.append(pass_.property_set["layout"].get_physical_bits())
+        self.assertEqual(layouts[0], layouts[1])
+        self.assertEqual(layouts[0], layouts[2])
+
     def test_all_to_all(self):
         """An implicitly all-to-all backend should just become physical with the trivial layout."""
         qc = QuantumCircuit(QuantumRegister(5, "virtuals"))
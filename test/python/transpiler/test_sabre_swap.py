@@ -270,6 +270,25 @@ class TestSabreSwap(QiskitTestCase):
 
         self.assertEqual(new_qc.num_nonlocal_gates(), 7)
 
+    def test_large_coupling_map(self):
+        """Test routing on a coupling map large enough to compute distances on demand gives the
+        same result as on a small one."""
+        coupling = CouplingMap.from_line(3000)
+        qc = QuantumCircuit(coupling.size())
+        qc.cx(0, 1)
+        qc.cx(2, 3)
+        qc.h(0)
+        qc.cx(1, 2)
+        qc.cx(1, 3)
+        qc.cx(2, 3)
+        qc.cx(1, 3)
+
+        new_qc = PassManager(SabreSwap(coupling, "lookahead", seed=0)).run(qc)
+        self.assertEqual(new_qc.num_nonlocal_gates(), 7)
+        check = CheckMap(coupling)
+        check(new_qc)
+        self.assertTrue(check.property_set["is_swap_mapped"])
+
     def test_do_not_change_cm(self):
         """Coupling map should not change.
         See https://github.com/Qiskit/qiskit-terra/issues/5675"""
@@ -309,6 +328,24 @@ class TestSabreSwap(QiskitTestCase):
         self.assertEqual(last_h.qubits, first_measure.qubits)
         self.assertNotEqual(last_h.qubits, second_measure.qubits)
 
+    def test_windowed_routing(self):
+        """Test that routing in windows produces a valid routing of all the operations."""
+        coupling = CouplingMap.from_line(6)
+        qc = random_circuit(6, 8, max_operands=2, measure=True, seed=2026)
+
+        pass_ = SabreSwap(coupling, "lookahead", seed=42, trials=2, window_size=2)
+        windowed = pass_(qc)
+        check = CheckMap(coupling)
+        check(windowed)
+        self.assertTrue(check.property_set["is_swap_mapped"])
+        ops = windowed.count_ops()
+        ops.pop("swap", None)
+        self.assertEqual(ops, qc.count_ops())
+        self.assertIsNotNone(pass_.property_set["final_layout"])
+
+        with self.assertRaises(TranspilerError):
+            SabreSwap(coupling, window_size=0)
+
     def test_no_infinite_loop(self):
         """Test that the 'release value' mechanisms allow SabreSwap to make progress even on
         circuits that get stuck in a stable local minimum of the lookahead parameters."""
@@ -561,6 +561,98 @@ class TestTarget(QiskitTestCase):
         # Verify that mutating the output of `build_coupling_map` doesn't affect the target.
         self.assertNotEqual(target.build_coupling_map(filter_idle_qubits=True), symmetric)
 
+    def test_coupling_map_shares_distance_matrix(self):
+        cm = CouplingMap.from_line(5, bidirectional=False)
+        target = Target()
+        target.add_instruction(CXGate(), {edge: None for edge in cm.get_edges()})
+        first = target.build_coupling_map()
+        np.testing.assert_array_equal(first.distance_matrix, cm.distance_matrix)
+        second = target.build_coupling_map()
+        self.assertIs(second.distance_matrix, first.distance_matrix)
+        self.assertFalse(second.distance_matrix.flags.writeable)
+        # Mutating one of the coupling maps must not affect the others.
+        second.add_edge(0, 4)
+        self.assertEqual(second.distance(0, 4), 1)
+        self.assertEqual(first.distance(0, 4), 4)
+        self.assertEqual(target.build_coupling_map().distance(0, 4), 4)
+        # Nor must the cache survive a mutation of the target.
+        target.add_instruction(CZGate(), {(0, 4): None})
+        self.assertEqual(target.build_coupling_map().distance(0, 4), 1)
+
+    def test_coupling_map_graph_assignment_unshares(self):
+        target = Target()
+        target.add_instruction(CXGate(), {(0, 1): None, (1, 2): None})
+        first = target.build_coupling_map()
+        self.assertEqual(first.distance(0, 2), 2)
+        second = target.build_coupling_map()
+        second.graph = CouplingMap([[0, 1], [1, 2], [0, 2]]).graph
+        self.assertEqual(second.distance(0, 2), 1)
+        self.assertEqual(first.distance(0, 2), 2)
+        self.assertEqual(target.build_coupling_map().distance(0, 2), 2)
+
+    def test_coupling_map_edge_data_not_shared(self):
+        target = Target()
+        target.add_instruction(CXGate(), {(0, 1): None, (1, 2): None})
+        first = target.build_coupling_map("cx")
+        first.graph.get_edge_data(0, 1)["cz"] = None
+        self.assertEqual(target.build_coupling_map("cx").graph.get_edge_data(0, 1), {"cx": None})
+        first = target.build_coupling_map()
+        first.graph.get_edge_data(0, 1)["cz"] = None
+        self.assertEqual(target.build_coupling_map().graph.get_edge_data(0, 1), {"cx": None})
+
+    def test_derived_cache_invalidation(self):
+        target = Target(num_qubits=2)
+        target.add_instruction(CXGate(), {(0, 1): InstructionProperties(error=1e-2)})
+        builds = []
+
+        def build():
+            builds.append(None)
+            return target["cx"][(0, 1)].error
+
+        self.assertEqual(target._derived("error", build, uses_properties=True), 1e-2)
+        self.assertEqual(target._derived("error", build, uses_properties=True), 1e-2)
+        self.assertEqual(len(builds), 1)
+        target.update_instruction_properties("cx", (0, 1), InstructionProperties(error=2e-2))
+        self.assertEqual(target._derived("error", build, uses_properties=True), 2e-2)
+        self.assertEqual(len(builds), 2)
+        # Structural entries are not affected by updates to the properties.
+        self.assertEqual(target._derived("structure", build), 2e-2)
+        target.update_instruction_properties("cx", (0, 1), InstructionProperties(error=3e-2))
+        self.assertEqual(target._derived("structure", build), 2e-2)
+        target.add_instruction(CZGate(), {(0, 1): None})
+        self.assertEqual(target._derived("structure", build), 3e-2)
+
+    def test_derived_cache_in_place_mutation(self):
+        target = Target(num_qubits=2)
+        target.add_instruction(CXGate(), {(0, 1): InstructionProperties(error=1e-2)})
+        builds = []
+
+        def build():
+            builds.append(None)
+            return target["cx"][(0, 1)].error
+
+        self.assertEqual(target._derived("error", build, uses_properties=True), 1e-2)
+        properties = target["cx"][(0, 1)]
+        properties.error = 2e-2
+        # In-place modifications are only seen after an explicit invalidation.
+        self.assertEqual(target._derived("error", build, uses_properties=True), 1e-2)
+        self.assertEqual(len(builds), 1)
+        target.update_instruction_properties("cx", (0, 1), properties)
+        self.assertEqual(target._derived("error", build, uses_properties=True), 2e-2)
+        self.assertEqual(target._derived("error", build, uses_properties=True), 2e-2)
+        self.assertEqual(len(builds), 2)
+
+    def test_derived_cache_stores_none(self):
+        target = Target(num_qubits=2)
+        builds = []
+
+        def build():
+            builds.append(None)
+
+        self.assertIsNone(target._derived("nothing", build))
+        self.assertIsNone(target._derived("nothing", build))
+        self.assertEqual(len(builds), 1)
+
     def test_coupling_map_2q_gate(self):
         cmap = self.fake_backend_target.build_coupling_map("ecr")
         self.assertEqual(
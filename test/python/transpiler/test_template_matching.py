@@ -124,6 +124,46 @@ class TestTemplateMatching(QiskitTestCase):
 
         self.assertEqual(dag_opt, dag_expected)
 
+    def test_max_candidates(self):
+        """Check that the candidate budget bounds the matching."""
+        qr = QuantumRegister(3, "qr")
+        circuit_in = QuantumCircuit(qr)
+        circuit_in.cx(qr[0], qr[1])
+        circuit_in.h(qr[2])
+        circuit_in.cx(qr[0], qr[1])
+        dag_in = circuit_to_dag(circuit_in)
+
+        template = QuantumCircuit(2)
+        template.cx(0, 1)
+        template.cx(0, 1)
+
+        with self.subTest("no candidates"):
+            dag_opt = TemplateOptimization([template], max_candidates=0).run(dag_in)
+            self.assertEqual(dag_opt, dag_in)
+
+        with self.subTest("enough candidates"):
+            circuit_expected = QuantumCircuit(qr)
+            circuit_expected.h(qr[2])
+            dag_opt = TemplateOptimization([template], max_candidates=100).run(dag_in)
+            self.assertEqual(dag_opt, circuit_to_dag(circuit_expected))
+
+    def test_template_that_cannot_reduce_cost_is_skipped(self):
+        """Check that templates whose gates are too rare in the circuit are not matched."""
+        qr = QuantumRegister(2, "qr")
+        circuit_in = QuantumCircuit(qr)
+        circuit_in.cx(qr[0], qr[1])
+        circuit_in.h(qr[0])
+        dag_in = circuit_to_dag(circuit_in)
+
+        template = QuantumCircuit(2)
+        template.cx(0, 1)
+        template.cx(0, 1)
+
+        pass_ = TemplateOptimization([template])
+        dag_dep = circuit_to_dagdependency(circuit_in)
+        self.assertFalse(pass_._can_reduce_cost(dag_dep, circuit_to_dagdependency(template)))
+        self.assertEqual(pass_.run(dag_in), dag_in)
+
     def test_pass_cx_cancellation_template_from_library(self):
         """
         Check the cancellation of CX gates for the apply of the library template cx-cx (2a_2).
@@ -1060,6 +1060,35 @@ class TestUnitarySynthesisTarget(QiskitTestCase):
             {(0, 1)},
         )
 
+    def test_repeated_unitaries(self):
+        """Verify that a repeated block is synthesized the same way every time it appears."""
+        backend = GenericBackendV2(2, coupling_map=[[0, 1]], seed=2)
+        unitary = random_unitary(4, seed=7)
+
+        single = QuantumCircuit(2)
+        single.unitary(unitary, [0, 1])
+        single_out = UnitarySynthesis(target=backend.target)(single)
+
+        qc = QuantumCircuit(2)
+        expected = QuantumCircuit(2)
+        for _ in range(3):
+            qc.unitary(unitary, [0, 1])
+            expected.compose(single_out, inplace=True)
+        qc_out = UnitarySynthesis(target=backend.target)(qc)
+
+        self.assertEqual(Operator(qc), Operator(qc_out))
+        self.assertEqual(circuit_to_dag(qc_out), circuit_to_dag(expected))
+
+    def test_nearly_repeated_unitaries(self):
+        """Verify that blocks that differ only by floating-point noise are synthesized correctly."""
+        backend = GenericBackendV2(2, coupling_map=[[0, 1]], seed=2)
+        unitary = random_unitary(4, seed=7).data
+        qc = QuantumCircuit(2)
+        for phase in (0.0, 1e-14, 1e-6):
+            qc.unitary(np.exp(1j * phase) * unitary, [0, 1])
+        qc_out = UnitarySynthesis(target=backend.target)(qc)
+        self.assertEqual(Operator(qc), Operator(qc_out))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -316,6 +316,54 @@ class TestVF2PostLayout(QiskitTestCase):
         vf2_pass.run(dag)
         self.assertLayoutV2(dag, target_last_qubits_best, vf2_pass.property_set)
 
+    @ddt.data(True, False)
+    def test_restarts(self, strict_direction):
+        """Test that restarted searches keep the best layout found."""
+        n_qubits = 4
+        target = Target()
+        target.add_instruction(
+            lib.CXGate(),
+            {(i, i + 1): InstructionProperties(error=10**-i) for i in range(n_qubits - 1)},
+        )
+        circuit = QuantumCircuit(n_qubits)
+        circuit.cx(0, 1)
+        circuit.cx(1, 2)
+        dag = circuit_to_dag(circuit)
+        vf2_pass = VF2PostLayout(
+            target=target, seed=self.seed, strict_direction=strict_direction, restarts=3
+        )
+        vf2_pass.run(dag)
+        self.assertLayoutV2(dag, target, vf2_pass.property_set)
+        layout = vf2_pass.property_set["post_layout"]
+        # The idle qubit may be left out of the layout.
+        self.assertEqual([layout[q] for q in dag.qubits[:3]], [1, 2, 3])
+
+    @ddt.data(True, False)
+    def test_root_shards(self, strict_direction):
+        """Test that a search split between parallel shards finds the best layout."""
+        n_qubits = 4
+        target = Target()
+        target.add_instruction(
+            lib.CXGate(),
+            {(i, i + 1): InstructionProperties(error=10**-i) for i in range(n_qubits - 1)},
+        )
+        circuit = QuantumCircuit(n_qubits)
+        circuit.cx(0, 1)
+        circuit.cx(1, 2)
+        dag = circuit_to_dag(circuit)
+        layouts = []
+        for _ in range(2):
+            vf2_pass = VF2PostLayout(
+                target=target, seed=self.seed, strict_direction=strict_direction, root_shards=3
+            )
+            vf2_pass.run(dag)
+            self.assertLayoutV2(dag, target, vf2_pass.property_set)
+            layout = vf2_pass.property_set["post_layout"]
+            # The idle qubit may be left out of the layout.
+            layouts.append([layout[q] for q in dag.qubits[:3]])
+        self.assertEqual(layouts[0], [1, 2, 3])
+        self.assertEqual(layouts[0], layouts[1])
+
     @combine(
         seed=(-1, 12),  # This hits both the "seeded" and "unseeded" paths.
         strict_direction=(True, False),